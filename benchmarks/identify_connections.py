@@ -0,0 +1,80 @@
+"""Benchmark the enumeration of connections against the line-graph matcher.
+
+Both methods identify the angles, dihedrals and impropers of a box of
+branched alkane chains. The line-graph matcher is slow on large systems,
+so it can be skipped with ``--skip-line-graph``.
+
+Usage::
+
+    python benchmarks/identify_connections.py --n-molecules 500
+"""
+
+import argparse
+import time
+
+import networkx as nx
+
+from gmso.core.atom import Atom
+from gmso.core.bond import Bond
+from gmso.core.topology import Topology
+from gmso.utils.connectivity import _detect_connections, identify_connections
+
+
+def build_topology(n_molecules, n_carbons):
+    """Return a topology of united-atom chains with a methyl branch every 3 carbons."""
+    top = Topology()
+    for _ in range(n_molecules):
+        backbone = [Atom(name="CH2") for _ in range(n_carbons)]
+        branches = [Atom(name="CH3") for _ in range(0, n_carbons, 3)]
+        for site in backbone + branches:
+            top.add_site(site, update_types=False)
+        for site1, site2 in zip(backbone[:-1], backbone[1:]):
+            top.add_connection(
+                Bond(connection_members=[site1, site2]), update_types=False
+            )
+        for idx, branch in zip(range(0, n_carbons, 3), branches):
+            top.add_connection(
+                Bond(connection_members=[backbone[idx], branch]), update_types=False
+            )
+    return top
+
+
+def line_graph_connections(top):
+    """Identify the connections by sub-graph matching on the bond line-graph."""
+    graph = nx.Graph()
+    for bond in top.bonds:
+        graph.add_edge(*bond.connection_members)
+    line_graph = nx.line_graph(graph)
+    return {
+        "angles": _detect_connections(line_graph, top, type_="angle"),
+        "dihedrals": _detect_connections(line_graph, top, type_="dihedral"),
+        "impropers": _detect_connections(line_graph, top, type_="improper"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-molecules", type=int, default=200)
+    parser.add_argument("--n-carbons", type=int, default=30)
+    parser.add_argument("--skip-line-graph", action="store_true")
+    args = parser.parse_args()
+
+    top = build_topology(args.n_molecules, args.n_carbons)
+    print(f"{top.n_sites} sites, {top.n_bonds} bonds")
+
+    start = time.perf_counter()
+    connections = identify_connections(top, index_only=True)
+    elapsed = time.perf_counter() - start
+    counts = ", ".join(f"{len(value)} {key}" for key, value in connections.items())
+    print(f"enumeration: {elapsed:.3f} s ({counts})")
+
+    if not args.skip_line_graph:
+        start = time.perf_counter()
+        reference = line_graph_connections(top)
+        elapsed = time.perf_counter() - start
+        print(f"line-graph matcher: {elapsed:.3f} s")
+        print(f"identical output: {reference == connections}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark the throughput of validated and trusted object construction.
+
+Atoms are built the way readers build them, once through the validated
+constructor followed by attribute assignments, and once through
+``construct_trusted``. Bonds are built between consecutive atoms in the
+same two ways.
+
+Usage::
+
+    python benchmarks/object_construction.py --n-atoms 100000
+"""
+
+import argparse
+import gc
+import time
+
+import numpy as np
+import unyt as u
+
+from gmso.abc.abstract_site import Molecule, Residue
+from gmso.core.atom import Atom
+from gmso.core.bond import Bond
+from gmso.core.element import element_by_symbol
+
+
+def validated_atoms(positions, element):
+    """Build the atoms through the constructor and attribute assignments."""
+    atoms = []
+    for idx, position in enumerate(positions):
+        atom = Atom(name="C", position=position)
+        atom.molecule = ("MOL", idx // 10)
+        atom.residue = ("RES", idx // 10)
+        atom.element = element
+        atoms.append(atom)
+    return atoms
+
+
+def trusted_atoms(positions, element):
+    """Build the atoms through construct_trusted."""
+    return [
+        Atom.construct_trusted(
+            name="C",
+            position=position,
+            molecule=Molecule.construct_trusted(name="MOL", number=idx // 10),
+            residue=Residue.construct_trusted(name="RES", number=idx // 10),
+            element=element,
+        )
+        for idx, position in enumerate(positions)
+    ]
+
+
+def validated_bonds(atoms):
+    """Build bonds between consecutive atoms through the constructor."""
+    return [
+        Bond(connection_members=[atom1, atom2])
+        for atom1, atom2 in zip(atoms[:-1], atoms[1:])
+    ]
+
+
+def trusted_bonds(atoms):
+    """Build bonds between consecutive atoms through construct_trusted."""
+    return [
+        Bond.construct_trusted(connection_members=(atom1, atom2))
+        for atom1, atom2 in zip(atoms[:-1], atoms[1:])
+    ]
+
+
+def report(label, n_objects, func, *args):
+    """Run func, print the objects it creates per second and return its output."""
+    gc.collect()
+    start = time.perf_counter()
+    output = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label}: {elapsed:.3f} s ({n_objects / elapsed:,.0f} objects/s)")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-atoms", type=int, default=50000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(seed=0)
+    positions = list(rng.random((args.n_atoms, 3)) * u.nm)
+    element = element_by_symbol("C")
+
+    atoms = report("validated atoms", args.n_atoms, validated_atoms, positions, element)
+    report("trusted atoms", args.n_atoms, trusted_atoms, positions, element)
+    report("validated bonds", args.n_atoms - 1, validated_bonds, atoms)
+    report("trusted bonds", args.n_atoms - 1, trusted_bonds, atoms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark the memory used by a parameterized box with and without shared potentials.
+
+Each mode runs in a fresh interpreter, so that the reported peak resident set sizes
+do not carry over from one mode to the other.
+
+Usage::
+
+    python benchmarks/parameterization_memory.py --n-molecules 5000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+
+def _peak_rss_mb():
+    """Return the peak resident set size of this process in MB."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak_rss / 1024**2 if sys.platform == "darwin" else peak_rss / 1024
+
+
+def run(n_molecules, share_potentials):
+    """Parameterize a box of ethane and report the memory it takes."""
+    import forcefield_utilities as ffutils
+    import mbuild as mb
+    from mbuild.lib.molecules import Ethane
+
+    from gmso.external import from_mbuild
+    from gmso.parameterization import apply
+
+    box = mb.fill_box(Ethane(), n_compounds=n_molecules, density=400)
+    top = from_mbuild(box)
+    top.identify_connections()
+    oplsaa = ffutils.FoyerFFs().load("oplsaa").to_gmso_ff()
+    rss_before = _peak_rss_mb()
+
+    start = time.perf_counter()
+    apply(
+        top,
+        oplsaa,
+        speedup_by_molgraph=True,
+        speedup_by_template=True,
+        share_potentials=share_potentials,
+    )
+    elapsed = time.perf_counter() - start
+
+    return {
+        "share_potentials": share_potentials,
+        "n_sites": top.n_sites,
+        "n_connections": top.n_connections,
+        "unique_potentials": len(set(id(site.atom_type) for site in top.sites))
+        + len(set(id(connection.connection_type) for connection in top.connections)),
+        "parameterization_time_s": round(elapsed, 2),
+        "peak_rss_increase_mb": round(_peak_rss_mb() - rss_before, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-molecules", type=int, default=2000)
+    parser.add_argument("--share-potentials", choices=["yes", "no"], default=None)
+    args = parser.parse_args()
+
+    if args.share_potentials is not None:
+        print(json.dumps(run(args.n_molecules, args.share_potentials == "yes")))
+        return
+
+    for share_potentials in ("no", "yes"):
+        output = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--n-molecules",
+                str(args.n_molecules),
+                "--share-potentials",
+                share_potentials,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(", ".join(f"{key}: {value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
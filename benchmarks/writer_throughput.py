@@ -0,0 +1,162 @@
+"""Benchmark the throughput of the text writers on a large typed system.
+
+The standard system is a box of united-atom butane chains with harmonic bonds
+and angles and Ryckaert-Bellemans dihedrals. Every format is written with and
+without the background writing thread, from a freshly built topology since
+some of the writers convert the potentials they write. The .top and .mcf
+writers only write each unique molecule once, so their outputs are small.
+
+Usage::
+
+    python benchmarks/writer_throughput.py --n-molecules 25000
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import unyt as u
+
+from gmso.abc.abstract_site import Molecule, Residue
+from gmso.core.angle import Angle
+from gmso.core.angle_type import AngleType
+from gmso.core.atom import Atom
+from gmso.core.atom_type import AtomType
+from gmso.core.bond import Bond
+from gmso.core.bond_type import BondType
+from gmso.core.box import Box
+from gmso.core.dihedral import Dihedral
+from gmso.core.dihedral_type import DihedralType
+from gmso.core.element import element_by_symbol
+from gmso.core.topology import Topology
+from gmso.formats import (
+    write_gro,
+    write_lammpsdata,
+    write_mcf,
+    write_top,
+    write_xyz,
+)
+from gmso.lib.potential_templates import PotentialTemplateLibrary
+
+WRITERS = {
+    "xyz": write_xyz,
+    "gro": write_gro,
+    "top": write_top,
+    "mcf": write_mcf,
+    "lammps": write_lammpsdata,
+}
+
+
+def build_topology(n_molecules):
+    """Return a typed box of united-atom butane chains."""
+    templates = PotentialTemplateLibrary()
+    atom_types = {
+        name: AtomType.from_template(
+            templates["LennardJonesPotential"],
+            parameters={"sigma": sigma * u.nm, "epsilon": epsilon * u.kJ / u.mol},
+            name=name,
+            mass=mass * u.amu,
+            charge=0 * u.elementary_charge,
+        )
+        for name, mass, sigma, epsilon in [
+            ("CH3", 15.035, 0.375, 0.815),
+            ("CH2", 14.027, 0.395, 0.382),
+        ]
+    }
+    bond_type = BondType.from_template(
+        templates["HarmonicBondPotential"],
+        parameters={"k": 200000 * u.kJ / u.mol / u.nm**2, "r_eq": 0.154 * u.nm},
+        member_types=("CH2", "CH3"),
+    )
+    angle_type = AngleType.from_template(
+        templates["HarmonicAnglePotential"],
+        parameters={"k": 500 * u.kJ / u.mol / u.rad**2, "theta_eq": 114 * u.degree},
+        member_types=("CH3", "CH2", "CH2"),
+    )
+    dihedral_type = DihedralType.from_template(
+        templates["RyckaertBellemansTorsionPotential"],
+        parameters={
+            f"c{idx}": value * u.kJ / u.mol
+            for idx, value in enumerate([9.28, 12.16, -13.12, -3.06, 26.24, 0])
+        },
+        member_types=("CH3", "CH2", "CH2", "CH3"),
+    )
+
+    rng = np.random.default_rng(seed=0)
+    chain = np.array([[0, 0, 0], [0.154, 0, 0], [0.2, 0.146, 0], [0.354, 0.146, 0]])
+    origins = rng.random((n_molecules, 3)) * 10
+    element = element_by_symbol("C")
+    top = Topology(name="butane")
+    sites = []
+    bonds, angles, dihedrals = [], [], []
+    for number, origin in enumerate(origins):
+        molecule = Molecule.construct_trusted(name="BUT", number=number)
+        residue = Residue.construct_trusted(name="BUT", number=number)
+        chain_sites = [
+            Atom.construct_trusted(
+                name=name,
+                position=(origin + position) * u.nm,
+                atom_type=atom_types[name],
+                molecule=molecule,
+                residue=residue,
+                element=element,
+            )
+            for name, position in zip(["CH3", "CH2", "CH2", "CH3"], chain)
+        ]
+        sites.extend(chain_sites)
+        bonds.extend(
+            Bond.construct_trusted(connection_members=pair, bond_type=bond_type)
+            for pair in zip(chain_sites[:-1], chain_sites[1:])
+        )
+        angles.extend(
+            Angle.construct_trusted(connection_members=triplet, angle_type=angle_type)
+            for triplet in zip(chain_sites[:-2], chain_sites[1:-1], chain_sites[2:])
+        )
+        dihedrals.append(
+            Dihedral.construct_trusted(
+                connection_members=tuple(chain_sites), dihedral_type=dihedral_type
+            )
+        )
+    top.add_sites(sites, update_types=False)
+    top.add_connections(bonds + angles + dihedrals, update_types=False)
+    top.box = Box(lengths=[10.5, 10.5, 10.5] * u.nm)
+    top.update_topology()
+    return top
+
+
+def report(fmt, n_molecules, directory, threaded):
+    """Write the standard system in a format and print the bytes written per second."""
+    top = build_topology(n_molecules)
+    filename = os.path.join(directory, f"system.{fmt}")
+    gc.collect()
+    start = time.perf_counter()
+    WRITERS[fmt](top, filename, threaded=threaded)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(filename)
+    mode = "threaded" if threaded else "serial"
+    print(
+        f"{fmt:>6} {mode:>8}: {size / 1e6:8.2f} MB in {elapsed:7.3f} s "
+        f"({size / elapsed / 1e6:7.2f} MB/s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n-molecules", type=int, default=10000)
+    parser.add_argument("--formats", nargs="+", choices=list(WRITERS), default=None)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    print(f"{args.n_molecules} butane molecules, {4 * args.n_molecules} sites")
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in args.formats or WRITERS:
+            for threaded in (False, True):
+                report(fmt, args.n_molecules, directory, threaded)
+
+
+if __name__ == "__main__":
+    main()
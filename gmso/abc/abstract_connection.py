@@ -1,4 +1,4 @@
-from typing import Optional, Sequence
+from typing import ClassVar, Optional, Sequence
 
 from pydantic import ConfigDict, Field, model_validator
 
@@ -14,6 +14,8 @@ class Connection(GMSOBase):
     Each instance will have a property for the conection_type (bond_type, angle_type, dihedral_type)
     """
 
+    __tracked_fields__: ClassVar[dict] = {"connection_members_": "members"}
+
     name_: str = Field(
         default="",
         description="Name of the connection. Defaults to class name.",
@@ -75,6 +77,22 @@ class Connection(GMSOBase):
             ]
             return tc if all(tc) else None
 
+    @classmethod
+    def construct_trusted(cls, **kwargs):
+        """Create a connection from already validated data, skipping validation.
+
+        See :meth:`GMSOBase.construct_trusted`. The connection members must
+        be distinct sites, and are not checked.
+        """
+        connection = super().construct_trusted(**kwargs)
+        if connection.connection_members is not None:
+            connection.__dict__["connection_members_"] = tuple(
+                connection.connection_members
+            )
+        if not connection.name:
+            connection.__dict__["name_"] = cls.__name__
+        return connection
+
     @model_validator(mode="before")
     def validate_fields(cls, values):
         if "connection_members" in values:
@@ -35,6 +35,12 @@ class Molecule(GMSOBase):
 
     __base_doc__: ClassVar[str] = "Molecule label for interaction sites."
 
+    __tracked_fields__: ClassVar[dict] = {
+        "name_": "labels",
+        "number_": "labels",
+        "isrigid_": "labels",
+    }
+
     name_: str = Field(
         "",
         validate_default=True,
@@ -97,6 +103,11 @@ class Residue(GMSOBase):
 
     __base_doc__: ClassVar[str] = "Residue label for interaction sites."
 
+    __tracked_fields__: ClassVar[dict] = {
+        "name_": "labels",
+        "number_": "labels",
+    }
+
     name_: str = Field(
         "",
         validate_default=True,
@@ -170,6 +181,13 @@ class Site(GMSOBase):
         "model_config",
     }
 
+    __tracked_fields__: ClassVar[dict] = {
+        "group_": "labels",
+        "molecule_": "labels",
+        "residue_": "labels",
+        "position_": "positions",
+    }
+
     __base_doc__: ClassVar[
         str
     ] = """An interaction site object in the topology hierarchy.
@@ -272,6 +290,19 @@ class Site(GMSOBase):
             f"label: {self.label if self.label else None} id: {id(self)}>"
         )
 
+    @classmethod
+    def construct_trusted(cls, **kwargs):
+        """Create a site from already validated data, skipping validation.
+
+        See :meth:`GMSOBase.construct_trusted`. The position must be a unyt
+        array of shape (3,) in nm, and the molecule and residue must be
+        :class:`Molecule` and :class:`Residue` objects rather than tuples.
+        """
+        site = super().construct_trusted(**kwargs)
+        if not site.name:
+            site.__dict__["name_"] = cls.__name__
+        return site
+
     @field_validator("position_")
     @classmethod
     def is_valid_position(cls, position):
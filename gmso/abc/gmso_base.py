@@ -2,8 +2,10 @@
 
 import json
 import warnings
+import weakref
 from abc import ABC
-from typing import Any, Type
+from collections import Counter, defaultdict
+from typing import Any, ClassVar, Type
 
 from pydantic import BaseModel, ConfigDict, validators
 
@@ -15,6 +17,74 @@ DictStrAny = Type["DictStrAny"]
 TupleGenerator = Type["TupleGenerator"]
 CallableGenerator = Type["CallableGenerator"]
 
+# Running count of assignments to the fields listed in a class's
+# __tracked_fields__, keyed by topic. Containers (e.g. gmso.Topology) compare
+# these counters to know when data they cached about their members is stale.
+FIELD_REVISIONS = Counter()
+
+# The objects notified of the assignments to the tracked fields of an object,
+# keyed by topic and then by the observed object, as a tuple of weak references.
+# An observer implements `_tracked_field_assigned(instance, name, old, new)`,
+# which lets containers keep data about their members current without
+# rescanning them, and only observes the objects it contains.
+FIELD_OBSERVERS = defaultdict(weakref.WeakKeyDictionary)
+
+
+def add_field_observer(topic, instances, observer):
+    """Notify `observer` of the assignments to the `topic` fields of `instances`."""
+    observed = FIELD_OBSERVERS[topic]
+    observer_ref = weakref.ref(observer)
+    for instance in instances:
+        observers = observed.get(instance, ())
+        if observer_ref not in observers:
+            observed[instance] = tuple(
+                ref for ref in observers if ref() is not None
+            ) + (observer_ref,)
+
+
+def remove_field_observer(topic, instance, observer):
+    """Stop notifying `observer` of the assignments to the `topic` fields of `instance`."""
+    observed = FIELD_OBSERVERS[topic]
+    observers = tuple(
+        ref for ref in observed.get(instance, ()) if ref() not in (None, observer)
+    )
+    if observers:
+        observed[instance] = observers
+    else:
+        observed.pop(instance, None)
+
+
+_object_setattr = object.__setattr__
+
+# Default field values of each class, used to construct trusted objects without
+# resolving the defaults through pydantic every time
+_TRUSTED_DEFAULTS = {}
+
+
+def _trusted_defaults(cls):
+    """Return the default values and the default factories of a model's fields.
+
+    The default values are in the order of the fields. Mutable defaults are
+    returned as factories so that objects do not share them.
+    """
+    if cls not in _TRUSTED_DEFAULTS:
+        defaults = {}
+        factories = {}
+        for name, field in cls.model_fields.items():
+            default = None
+            if field.default_factory is not None:
+                factories[name] = field.default_factory
+            elif field.is_required():
+                # Required fields default to None if they are not given
+                pass
+            elif isinstance(field.default, (str, int, float, bool, type(None))):
+                default = field.default
+            else:
+                factories[name] = field.get_default
+            defaults[name] = default
+        _TRUSTED_DEFAULTS[cls] = defaults, factories
+    return _TRUSTED_DEFAULTS[cls]
+
 
 class GMSOBase(BaseModel, ABC):
     """A BaseClass to all abstract classes in GMSO."""
@@ -26,6 +96,8 @@ class GMSOBase(BaseModel, ABC):
         populate_by_name=True,
     )
 
+    __tracked_fields__: ClassVar[dict] = {}
+
     def __hash__(self):
         """Return the unique hash of the object."""
         return id(self)
@@ -44,8 +116,69 @@ class GMSOBase(BaseModel, ABC):
                 "Please use external fields to set attributes."
             )
 
+        topic = self.__tracked_fields__.get(name)
+        observed = FIELD_OBSERVERS.get(topic) if topic else None
+        observers = observed.get(self) if observed else None
+        old = self.__dict__.get(name) if observers else None
+
         super().__setattr__(name, value)
 
+        if topic:
+            FIELD_REVISIONS[topic] += 1
+        if observers:
+            new = self.__dict__.get(name)
+            for observer_ref in observers:
+                observer = observer_ref()
+                if observer is not None:
+                    observer._tracked_field_assigned(self, name, old, new)
+
+    @classmethod
+    def construct_trusted(cls, **kwargs):
+        """Create an object from already validated data, skipping validation.
+
+        This is a fast alternative to the constructor for readers and
+        converters that build many objects from data they have checked
+        themselves. Fields may be given by their external or internal names,
+        and fields that are not given take their default values. The values
+        are neither validated nor converted, so they must already be what
+        the validators would produce, e.g. unyt quantities in the default
+        units rather than floats.
+
+        Parameters
+        ----------
+        **kwargs
+            The values of the fields of the object
+
+        Returns
+        -------
+        GMSOBase
+            The new object
+        """
+        if cls.__private_attributes__:
+            return cls.model_construct(**kwargs)
+
+        alias_to_fields = cls.model_config.get("alias_to_fields", {})
+        defaults, factories = _trusted_defaults(cls)
+        values = defaults.copy()
+        fields_set = set()
+        for key, value in kwargs.items():
+            name = alias_to_fields.get(key, key)
+            values[name] = value
+            fields_set.add(name)
+        if len(values) != len(defaults):
+            unknown = ", ".join(sorted(values.keys() - defaults.keys()))
+            raise TypeError(f"Unknown fields for {cls.__name__}: {unknown}")
+        for name, factory in factories.items():
+            if name not in fields_set:
+                values[name] = factory()
+
+        instance = cls.__new__(cls)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+        _object_setattr(instance, "__pydantic_extra__", None)
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
+
     @classmethod
     def model_validate(cls: Model, obj: Any) -> Model:
         dict_to_unyt(obj)
@@ -1,7 +1,7 @@
 """Represent general atomic information in GMSO."""
 
 import warnings
-from typing import Optional, Union
+from typing import ClassVar, Optional, Union
 
 import unyt as u
 from pydantic import ConfigDict, Field, field_serializer, field_validator
@@ -42,6 +42,13 @@ class Atom(Site):
         the gmso.abc.abstract site class
     """
 
+    __tracked_fields__: ClassVar[dict] = {
+        **Site.__tracked_fields__,
+        "charge_": "charges",
+        "mass_": "masses",
+        "atom_type_": "potentials",
+    }
+
     charge_: Optional[Union[u.unyt_quantity, float]] = Field(
         None, description="Charge of the atom", alias="charge"
     )
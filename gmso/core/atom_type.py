@@ -1,7 +1,7 @@
 """Support non-bonded interactions between sites."""
 
 import warnings
-from typing import Optional, Set, Union
+from typing import ClassVar, Optional, Set, Union
 
 import unyt as u
 from pydantic import ConfigDict, Field, field_serializer, field_validator
@@ -27,6 +27,12 @@ class AtomType(ParametricPotential):
     are stored explicitly.
     """
 
+    __tracked_fields__: ClassVar[dict] = {
+        **ParametricPotential.__tracked_fields__,
+        "charge_": "charges",
+        "mass_": "masses",
+    }
+
     mass_: Optional[u.unyt_array] = Field(
         0.0 * u.gram / u.mol,
         description="The mass of the atom type",
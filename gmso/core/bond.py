@@ -25,6 +25,10 @@ class Bond(Connection):
     """
 
     __members_creator__: ClassVar[Callable] = Atom.model_validate
+    __tracked_fields__: ClassVar[dict] = {
+        **Connection.__tracked_fields__,
+        "bond_type_": "potentials",
+    }
 
     connection_members_: Tuple[Atom, Atom] = Field(
         ...,
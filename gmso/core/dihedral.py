@@ -27,6 +27,10 @@ class Dihedral(Connection):
     """
 
     __members_creator__: ClassVar[Callable] = Atom.model_validate
+    __tracked_fields__: ClassVar[dict] = {
+        **Connection.__tracked_fields__,
+        "dihedral_type_": "potentials",
+    }
 
     connection_members_: Tuple[Atom, Atom, Atom, Atom] = Field(
         ...,
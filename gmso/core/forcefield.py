@@ -3,7 +3,7 @@
 import copy
 import itertools
 import warnings
-from collections import ChainMap
+from collections import ChainMap, OrderedDict, namedtuple
 from pathlib import Path
 from typing import Iterable
 
@@ -37,6 +37,47 @@ def _group_by_expression(potential_types):
     return expr_group
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_IMPROPER_EQUIVALENT_ORDERS = tuple(
+    (0, i, j, k) for (i, j, k) in itertools.permutations((1, 2, 3), 3)
+)
+
+
+def _compile_wildcard_masks(potential_types, n_members):
+    """Compile the wildcard masks that can match the keys of `potential_types`.
+
+    The masks are grouped by window size and kept in the order `mask_with`
+    yields them, so a lookup that walks them tries patterns in the same order
+    as masking the member types directly. Masks whose wildcard positions are
+    not covered by any key are dropped.
+    """
+    wildcard_positions = set()
+    for key in potential_types:
+        tokens = key.split(FF_TOKENS_SEPARATOR)
+        if len(tokens) == n_members and "*" in tokens:
+            wildcard_positions.add(
+                frozenset(j for j, token in enumerate(tokens) if token == "*")
+            )
+
+    compiled = []
+    for i in range(1, n_members + 1):
+        masks = []
+        for pattern in mask_with(range(n_members), i, mask=None):
+            mask = frozenset(j for j, token in enumerate(pattern) if token is None)
+            if any(mask <= positions for positions in wildcard_positions):
+                masks.append(mask)
+        compiled.append(tuple(masks))
+    return tuple(compiled)
+
+
+def _masked_key(atom_types, mask):
+    """Return the forcefield key for `atom_types` with the positions in `mask` wildcarded."""
+    return FF_TOKENS_SEPARATOR.join(
+        "*" if j in mask else atom_type for j, atom_type in enumerate(atom_types)
+    )
+
+
 class ForceField(object):
     """A generic implementation of the forcefield class.
 
@@ -75,6 +116,9 @@ class ForceField(object):
         A collection of unyt.Unit objects used in the forcefield
     scaling_factors : dict
         A collection of scaling factors used in the forcefield
+    lookup_cache_maxsize : int
+        The maximum number of member type combinations whose connection type
+        lookups are memoized
 
     See Also
     --------
@@ -85,6 +129,8 @@ class ForceField(object):
 
     """
 
+    lookup_cache_maxsize = 16384
+
     @deprecate_kwargs([("backend", "gmso"), ("backend", "GMSO")])
     def __init__(
         self,
@@ -93,6 +139,9 @@ class ForceField(object):
         greedy=True,
         backend="forcefield-utilities",
     ):
+        self._lookup_cache = OrderedDict()
+        self._lookup_stats = {"hits": 0, "misses": 0}
+        self._wildcard_masks = {}
         if xml_loc is not None:
             if backend in ["gmso", "GMSO"]:
                 ff = ForceField.from_xml(xml_loc, strict, greedy)
@@ -337,28 +386,12 @@ class ForceField(object):
                 f"be extracted for two atoms. Provided {len(atom_types)}"
             )
 
-        forward = FF_TOKENS_SEPARATOR.join(atom_types)
-        reverse = FF_TOKENS_SEPARATOR.join(reversed(atom_types))
-        match = None
-        if forward in self.bond_types:
-            match = self.bond_types[forward], (0, 1)
-        if reverse in self.bond_types:
-            match = self.bond_types[reverse], (1, 0)
-
+        match = self._lookup("bond_types", atom_types, self._match_exact)
         msg = (
             f"BondType between atoms {atom_types[0]} and {atom_types[1]} "
             f"is missing from the ForceField"
         )
-        if match:
-            if return_match_order:
-                return match
-            else:
-                return match[0]
-        elif warn:
-            warnings.warn(msg)
-            return None
-        else:
-            raise MissingPotentialError(msg)
+        return self._return_match(match, msg, return_match_order, warn)
 
     def _get_angle_type(self, atom_types, return_match_order=False, warn=False):
         """Get a particular angle_type between `atom_types` from this ForceField."""
@@ -368,28 +401,12 @@ class ForceField(object):
                 f"be extracted for three atoms. Provided {len(atom_types)}"
             )
 
-        forward = FF_TOKENS_SEPARATOR.join(atom_types)
-        reverse = FF_TOKENS_SEPARATOR.join(reversed(atom_types))
-        match = None
-        if forward in self.angle_types:
-            match = self.angle_types[forward], (0, 1, 2)
-        if reverse in self.angle_types:
-            match = self.angle_types[reverse], (2, 1, 0)
-
+        match = self._lookup("angle_types", atom_types, self._match_exact)
         msg = (
             f"AngleType between atoms {atom_types[0]}, {atom_types[1]} "
             f"and {atom_types[2]} is missing from the ForceField"
         )
-        if match:
-            if return_match_order:
-                return match
-            else:
-                return match[0]
-        elif warn:
-            warnings.warn(msg)
-            return None
-        else:
-            raise MissingPotentialError(msg)
+        return self._return_match(match, msg, return_match_order, warn)
 
     def _get_dihedral_type(self, atom_types, return_match_order=False, warn=False):
         """Get a particular dihedral_type between `atom_types` from this ForceField."""
@@ -399,56 +416,12 @@ class ForceField(object):
                 f"be extracted for four atoms. Provided {len(atom_types)}"
             )
 
-        forward = FF_TOKENS_SEPARATOR.join(atom_types)
-        reverse = FF_TOKENS_SEPARATOR.join(reversed(atom_types))
-
-        match = None
-        if forward in self.dihedral_types:
-            match = self.dihedral_types[forward], (0, 1, 2, 3)
-        if reverse in self.dihedral_types:
-            match = self.dihedral_types[reverse], (3, 2, 1, 0)
-
-        if match:
-            if return_match_order:
-                return match
-            else:
-                return match[0]
-
-        for i in range(1, 5):
-            forward_patterns = mask_with(atom_types, i)
-            reverse_patterns = mask_with(reversed(atom_types), i)
-
-            for forward_pattern, reverse_pattern in zip(
-                forward_patterns, reverse_patterns
-            ):
-                forward_match_key = FF_TOKENS_SEPARATOR.join(forward_pattern)
-                reverse_match_key = FF_TOKENS_SEPARATOR.join(reverse_pattern)
-
-                if forward_match_key in self.dihedral_types:
-                    match = self.dihedral_types[forward_match_key], (0, 1, 2, 3)
-                    break
-
-                if reverse_match_key in self.dihedral_types:
-                    match = self.dihedral_types[reverse_match_key], (3, 2, 1, 0)
-                    break
-
-            if match:
-                break
-
+        match = self._lookup("dihedral_types", atom_types, self._match_dihedral)
         msg = (
             f"DihedralType between atoms {atom_types[0]}, {atom_types[1]}, "
             f"{atom_types[2]} and {atom_types[3]} is missing from the ForceField."
         )
-        if match:
-            if return_match_order:
-                return match
-            else:
-                return match[0]
-        elif warn:
-            warnings.warn(msg)
-            return None
-        else:
-            raise MissingPotentialError(msg)
+        return self._return_match(match, msg, return_match_order, warn)
 
     def _get_improper_type(self, atom_types, return_match_order=False, warn=False):
         """Get a particular improper_type between `atom_types` from this ForceField."""
@@ -458,66 +431,145 @@ class ForceField(object):
                 f"be extracted for four atoms. Provided {len(atom_types)}"
             )
 
-        forward = FF_TOKENS_SEPARATOR.join(atom_types)
-
-        if forward in self.improper_types:
-            if return_match_order:
-                return self.improper_types[forward], (0, 1, 2, 3)
-            else:
-                return self.improper_types[forward]
-
-        equiv_idx = [(0, i, j, k) for (i, j, k) in itertools.permutations((1, 2, 3), 3)]
-        equivalent = [
-            [atom_types[m], atom_types[n], atom_types[o], atom_types[p]]
-            for (m, n, o, p) in equiv_idx
-        ]
-        for eq, order in zip(equivalent, equiv_idx):
-            eq_key = FF_TOKENS_SEPARATOR.join(eq)
-            if eq_key in self.improper_types:
-                if return_match_order:
-                    return self.improper_types[eq_key], order
-                else:
-                    return self.improper_types[eq_key]
-
-        match = None
-        for i in range(1, 5):
-            forward_patterns = mask_with(atom_types, i)
-            for forward_pattern in forward_patterns:
-                forward_match_key = FF_TOKENS_SEPARATOR.join(forward_pattern)
-                if forward_match_key in self.improper_types:
-                    match = self.improper_types[forward_match_key], (0, 1, 2, 3)
-                    break
-            if match:
-                break
-        if not match:
-            for i in range(1, 5):
-                for eq, order in zip(equivalent, equiv_idx):
-                    equiv_patterns = mask_with(eq, i)
-                    for equiv_pattern in equiv_patterns:
-                        equiv_pattern_key = FF_TOKENS_SEPARATOR.join(equiv_pattern)
-                        if equiv_pattern_key in self.improper_types:
-                            match = (
-                                self.improper_types[equiv_pattern_key],
-                                order,
-                            )
-                            break
-                    if match:
-                        break
-                if match:
-                    break
-
+        match = self._lookup("improper_types", atom_types, self._match_improper)
         msg = (
             f"ImproperType between atoms {atom_types[0]}, {atom_types[1]}, "
             f"{atom_types[2]} and {atom_types[3]} is missing from the ForceField."
         )
+        return self._return_match(match, msg, return_match_order, warn)
+
+    @staticmethod
+    def _return_match(match, msg, return_match_order, warn):
+        """Return a (potential, match order) pair as requested or handle a miss."""
         if match:
-            return match
+            if return_match_order:
+                return match
+            else:
+                return match[0]
         elif warn:
             warnings.warn(msg)
             return None
         else:
             raise MissingPotentialError(msg)
 
+    def lookup_cache_info(self):
+        """Return the statistics of the connection type lookup cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple with the number of cache hits, misses, the maximum
+            size of the cache and its current size
+        """
+        return CacheInfo(
+            self._lookup_stats["hits"],
+            self._lookup_stats["misses"],
+            self.lookup_cache_maxsize,
+            len(self._lookup_cache),
+        )
+
+    def clear_lookup_cache(self):
+        """Clear the connection type lookup cache and its statistics.
+
+        The cache notices when a potential group is replaced, grows or shrinks,
+        or when a matched potential is reassigned. Call this after swapping
+        keys in a potential group in place without changing its size.
+        """
+        self._lookup_cache.clear()
+        self._lookup_stats = {"hits": 0, "misses": 0}
+        self._wildcard_masks = {}
+
+    def _lookup(self, group, atom_types, matcher):
+        """Find the potential in `group` for `atom_types`, memoized on the member types."""
+        table = getattr(self, group)
+        cache_key = (group, tuple(atom_types))
+        entry = self._lookup_cache.get(cache_key)
+        if entry is not None:
+            cached_table, size, match, key = entry
+            if (
+                cached_table is table
+                and size == len(table)
+                and (match is None or table.get(key) is match[0])
+            ):
+                self._lookup_stats["hits"] += 1
+                self._lookup_cache.move_to_end(cache_key)
+                return match
+
+        self._lookup_stats["misses"] += 1
+        match, key = matcher(group, table, atom_types)
+        self._lookup_cache[cache_key] = (table, len(table), match, key)
+        if len(self._lookup_cache) > self.lookup_cache_maxsize:
+            self._lookup_cache.popitem(last=False)
+        return match
+
+    def _get_wildcard_masks(self, group, table):
+        """Return the wildcard masks, by window size, that can match keys of `group`."""
+        masks = self._wildcard_masks.get(group)
+        if masks is None or masks[0] is not table or masks[1] != len(table):
+            masks = (table, len(table), _compile_wildcard_masks(table, 4))
+            self._wildcard_masks[group] = masks
+        return masks[2]
+
+    @staticmethod
+    def _match_exact(group, table, atom_types):
+        """Match `atom_types` against `table` in forward or reverse order."""
+        forward = FF_TOKENS_SEPARATOR.join(atom_types)
+        reverse = FF_TOKENS_SEPARATOR.join(reversed(atom_types))
+        if reverse in table:
+            return (table[reverse], tuple(reversed(range(len(atom_types))))), reverse
+        if forward in table:
+            return (table[forward], tuple(range(len(atom_types)))), forward
+        return None, None
+
+    def _match_dihedral(self, group, table, atom_types):
+        """Match `atom_types` against dihedral types, falling back to wildcards."""
+        match, key = self._match_exact(group, table, atom_types)
+        if match:
+            return match, key
+
+        reversed_types = list(reversed(atom_types))
+        for masks in self._get_wildcard_masks(group, table):
+            for mask in masks:
+                forward_key = _masked_key(atom_types, mask)
+                if forward_key in table:
+                    return (table[forward_key], (0, 1, 2, 3)), forward_key
+
+                reverse_key = _masked_key(reversed_types, mask)
+                if reverse_key in table:
+                    return (table[reverse_key], (3, 2, 1, 0)), reverse_key
+
+        return None, None
+
+    def _match_improper(self, group, table, atom_types):
+        """Match `atom_types` against improper types, including equivalent orders."""
+        forward = FF_TOKENS_SEPARATOR.join(atom_types)
+        if forward in table:
+            return (table[forward], (0, 1, 2, 3)), forward
+
+        equivalent = [
+            [atom_types[m] for m in order] for order in _IMPROPER_EQUIVALENT_ORDERS
+        ]
+        for eq, order in zip(equivalent, _IMPROPER_EQUIVALENT_ORDERS):
+            eq_key = FF_TOKENS_SEPARATOR.join(eq)
+            if eq_key in table:
+                return (table[eq_key], order), eq_key
+
+        wildcard_masks = self._get_wildcard_masks(group, table)
+        for masks in wildcard_masks:
+            for mask in masks:
+                forward_key = _masked_key(atom_types, mask)
+                if forward_key in table:
+                    return (table[forward_key], (0, 1, 2, 3)), forward_key
+
+        for masks in wildcard_masks:
+            for eq, order in zip(equivalent, _IMPROPER_EQUIVALENT_ORDERS):
+                for mask in masks:
+                    eq_key = _masked_key(eq, mask)
+                    if eq_key in table:
+                        return (table[eq_key], order), eq_key
+
+        return None, None
+
     def __repr__(self):
         """Return a formatted representation of the Forcefield."""
         return (
@@ -30,6 +30,10 @@ class Improper(Connection):
     """
 
     __members_creator__: ClassVar[Callable] = Atom.model_validate
+    __tracked_fields__: ClassVar[dict] = {
+        **Connection.__tracked_fields__,
+        "improper_type_": "potentials",
+    }
 
     connection_members_: Tuple[Atom, Atom, Atom, Atom] = Field(
         ...,
@@ -10,7 +10,13 @@ import unyt as u
 from boltons.setutils import IndexedSet
 
 import gmso
+from gmso.abc.abstract_connection import Connection
 from gmso.abc.abstract_site import Molecule, Residue, Site
+from gmso.abc.gmso_base import (
+    FIELD_REVISIONS,
+    add_field_observer,
+    remove_field_observer,
+)
 from gmso.abc.serialization_utils import unyt_to_dict
 from gmso.core.angle import Angle
 from gmso.core.angle_type import AngleType
@@ -36,6 +42,29 @@ from gmso.utils.units import GMSO_UnitRegistry as UnitReg
 
 scaling_interaction_idxes = {"12": 0, "13": 1, "14": 2}
 
+# The FIELD_REVISIONS topics each of the per-site arrays depends on
+site_array_topics = {
+    "charges": ("charges", "potentials"),
+    "masses": ("masses", "potentials"),
+}
+
+# The potential group counted for the potential of each kind of connection
+potential_groups = {
+    Bond: "bond_types",
+    Angle: "angle_types",
+    Dihedral: "dihedral_types",
+    Improper: "improper_types",
+}
+
+# The potential group of each kind of potential indexed by Topology.get_index
+potential_type_groups = {
+    AtomType: "atom_types",
+    BondType: "bond_types",
+    AngleType: "angle_types",
+    DihedralType: "dihedral_types",
+    ImproperType: "improper_types",
+}
+
 
 class Topology(object):
     """A topology.
@@ -171,9 +200,40 @@ class Topology(object):
             "pairpotential_types": 0,
         }
 
+        self._potential_refcounts = {
+            group: {} for group in ("atom_types", *potential_groups.values())
+        }
+        self._n_typed = dict.fromkeys(self._potential_refcounts, 0)
+        self._potential_positions = {group: {} for group in self._potential_refcounts}
+        self._potential_indices = dict.fromkeys(self._potential_refcounts)
+
         self._unique_connections = {}
+        self._unique_connections_complete = True
+        self._connections_by_site = {}
+        self._connections_by_site_revision = FIELD_REVISIONS["members"]
+        self._sites_by_label = {}
+        self._connections_by_label = {}
+        self._label_indices_revision = None
+        self._positions_buffer = None
+        self._bound_positions = None
+        self._site_arrays = {}
         self._unit_system = None
 
+    def __setstate__(self, state):
+        """Restore a copied or unpickled topology."""
+        self.__dict__.update(state)
+        # The copied sites are not views of the copied positions buffer
+        self._positions_buffer = None
+        self._bound_positions = None
+        self._site_arrays = {}
+        add_field_observer(
+            "potentials",
+            itertools.chain(
+                self._sites, self._bonds, self._angles, self._dihedrals, self._impropers
+            ),
+            self,
+        )
+
     @property
     def unit_system(self):
         """Return the unyt system of the topology."""
@@ -236,11 +296,79 @@ class Topology(object):
 
     @property
     def positions(self):
-        """Return the positions of the sites in the topology."""
-        xyz = np.empty(shape=(self.n_sites, 3)) * u.nm
-        for i, site in enumerate(self._sites):
-            xyz[i, :] = site.position
-        return xyz
+        """Return the positions of the sites in the topology.
+
+        Notes
+        -----
+        Assigning to this property copies the positions into a contiguous
+        (n_sites, 3) float64 buffer owned by the topology, and makes the
+        position of every site a view into its row of that buffer. While the
+        sites remain views of the buffer, reading this property returns a
+        read-only view of it without copying. Otherwise, e.g. after a site is
+        added or the position of a site is reassigned, the positions are
+        gathered into a new read-only array in nm. Reading this property never
+        modifies the sites.
+
+        Sites shared with another topology, e.g. through `create_subtop`, are
+        views of the buffer of the topology whose positions were last
+        assigned, the positions of the other topology are then gathered.
+        """
+        return self._get_positions()
+
+    @positions.setter
+    def positions(self, positions):
+        """Set the positions of all the sites in the topology."""
+        if not isinstance(positions, u.unyt_array):
+            positions = u.unyt_array(positions, u.nm)
+            warnings.warn("Positions are assumed to be in nm")
+
+        try:
+            positions = np.reshape(positions, (self.n_sites, 3))
+        except ValueError:
+            raise ValueError(
+                f"Positions of shape {positions.shape} are not valid for a "
+                f"topology with {self.n_sites} sites. Expected shape: "
+                f"({self.n_sites}, 3)"
+            )
+
+        units = u.dimensionless if positions.units.is_dimensionless else u.nm
+        values = positions.to_value(units)
+        if self._positions_bound() and self._positions_buffer.units == units:
+            self._positions_buffer.ndview[:] = values
+            return
+
+        buffer = u.unyt_array(np.array(values, dtype=np.float64, order="C"), units)
+        bound_positions = [buffer[i] for i in range(self.n_sites)]
+        for site, position in zip(self._sites, bound_positions):
+            site.__dict__["position_"] = position
+        FIELD_REVISIONS["positions"] += 1
+        self._positions_buffer = buffer
+        self._bound_positions = bound_positions
+        self._site_arrays.pop("positions", None)
+
+    @property
+    def charges(self):
+        """Return the charges of the sites in the topology.
+
+        Notes
+        -----
+        The charges are resolved the same way as `Atom.charge`, sites without
+        a charge are set to nan. The returned array is read-only and cached
+        until a site is added or removed, or a charge or atom type changes.
+        """
+        return self._get_site_array("charges")
+
+    @property
+    def masses(self):
+        """Return the masses of the sites in the topology.
+
+        Notes
+        -----
+        The masses are resolved the same way as `Atom.mass`, sites without
+        a mass are set to nan. The returned array is read-only and cached
+        until a site is added or removed, or a mass or atom type changes.
+        """
+        return self._get_site_array("masses")
 
     @property
     def n_sites(self):
@@ -250,7 +378,7 @@ class Topology(object):
     @property
     def n_connections(self):
         """Return the number of connections in the topology."""
-        return len(self.connections)
+        return self.n_bonds + self.n_angles + self.n_dihedrals + self.n_impropers
 
     @property
     def n_bonds(self):
@@ -308,10 +436,12 @@ class Topology(object):
         """Return a list of all molecule/residue labels in the Topology."""
         # Not super happy with this method name, open for suggestion.
         unique_tags = IndexedSet()
-        if name_only and label_type in ("molecule", "residue"):
-            for site in self.sites:
-                label = getattr(site, label_type)
-                unique_tags.add(label.name if label else None)
+        if label_type in ("molecule", "residue", "group"):
+            if name_only and label_type in ("molecule", "residue"):
+                unique_tags.update(self._get_sites_by_label(label_type, True))
+            else:
+                for label in self._get_sites_by_label(label_type):
+                    unique_tags.add(copy(label))
         else:
             for site in self.sites:
                 unique_tags.add(copy(getattr(site, label_type)))
@@ -679,6 +809,12 @@ class Topology(object):
         for conn in site_connections:
             self.remove_connection(conn)
         self._sites.remove(site)
+        remove_field_observer("potentials", site, self)
+        self._count_potential("atom_types", getattr(site, "atom_type", None), -1)
+        self._reset_potential_indices("atom_types")
+        self._connections_by_site.pop(site, None)
+        self._sites_by_label.clear()
+        self._site_arrays.clear()
 
     def remove_connection(self, connection):
         """Remove a connection from the topology.
@@ -693,18 +829,24 @@ class Topology(object):
         The sites that belong to this connection are
         not removed from the topology.
         """
-        if connection not in self.connections:
+        connections_set = self._connections_sets.get(type(connection))
+        if connections_set is None or connection not in connections_set:
             raise ValueError(
                 f"Connection {connection} is not currently part of this topology."
             )
-        if isinstance(connection, gmso.core.bond.Bond):
-            self._bonds.remove(connection)
-        elif isinstance(connection, gmso.core.angle.Angle):
-            self._angles.remove(connection)
-        elif isinstance(connection, gmso.core.dihedral.Dihedral):
-            self._dihedrals.remove(connection)
-        elif isinstance(connection, gmso.core.improper.Improper):
-            self._impropers.remove(connection)
+        connections_by_site = self._get_connections_by_site()
+        for site in connection.connection_members:
+            connections_by_site[site].remove(connection)
+        connections_set.remove(connection)
+        remove_field_observer("potentials", connection, self)
+        group = potential_groups[type(connection)]
+        self._count_potential(group, connection.connection_type, -1)
+        self._reset_potential_indices(group)
+
+        equivalent_members = connection.equivalent_members()
+        if self._unique_connections.get(equivalent_members) is connection:
+            self._unique_connections.pop(equivalent_members)
+        self._connections_by_label.clear()
 
     def set_scaling_factors(self, lj, electrostatics, *, molecule_id=None):
         """Set both lj and electrostatics scaling factors."""
@@ -836,7 +978,36 @@ class Topology(object):
         update_types : (bool), default=True
             If true, add this site's atom type to the topology's set of AtomTypes
         """
-        self._sites.add(site)
+        self.add_sites((site,), update_types=update_types)
+
+    def add_sites(self, sites, update_types=False):
+        """Add several sites to the topology.
+
+        This is the same as calling `add_site` for every site, but the
+        per-site caches of the topology are invalidated once for all
+        the sites.
+
+        Parameters
+        ----------
+        sites : iterable of gmso.core.Site
+            Sites to be added to this topology
+        update_types : (bool), default=False
+            If true, update the topology's potentials after adding the sites
+        """
+        added_sites = list()
+        for site in sites:
+            if site not in self._sites:
+                self._sites.add(site)
+                self._append_potential(
+                    "atom_types",
+                    getattr(site, "atom_type", None),
+                    len(self._sites) - 1,
+                )
+                added_sites.append(site)
+        if added_sites:
+            add_field_observer("potentials", added_sites, self)
+            self._sites_by_label.clear()
+            self._site_arrays.clear()
         self.is_updated = False
         if update_types:
             self.update_topology()
@@ -867,35 +1038,148 @@ class Topology(object):
             The Connection object or equivalent Connection object that
             is in the topology
         """
-        # Check if an equivalent connection is in the topology
-        equivalent_members = connection.equivalent_members()
-        if equivalent_members in self._unique_connections:
-            warnings.warn(
-                "An equivalent connection already exists. "
-                "Providing the existing equivalent Connection."
-            )
-            connection = self._unique_connections[equivalent_members]
+        return self.add_connections((connection,), update_types=update_types)[0]
+
+    def add_connections(self, connections, update_types=False, validate=True):
+        """Add several gmso.Connection objects to the topology.
+
+        This is the same as calling `add_connection` for every connection,
+        but the members of all the connections are added to the topology
+        at once and the caches of the topology are invalidated once.
+
+        Parameters
+        ----------
+        connections : iterable of gmso.Connection
+            Connections to be added to this topology
+        update_types : bool, default=False
+            If True, update the topology's potentials after adding the
+            connections
+        validate : bool, default=True
+            If True, a connection equivalent to one already in the topology
+            is replaced by the existing connection. If False, the caller
+            guarantees that no two connections, in the topology or in
+            `connections`, are equivalent, the check is skipped and the
+            map of equivalent connections is rebuilt when next needed.
+
+        Returns
+        -------
+        list of gmso.Connection
+            The Connection objects or equivalent Connection objects that
+            are in the topology
+        """
+        connections_sets = self._connections_sets
+        if not validate:
+            # Unique connections cannot already be in the topology, the maps
+            # of equivalent connections and of connections by site are
+            # rebuilt when next needed
+            added_connections = list(connections)
+            new_connections = added_connections
+            for connection in added_connections:
+                connections_set = connections_sets[type(connection)]
+                connections_set.add(connection)
+                self._append_potential(
+                    potential_groups[type(connection)],
+                    connection.connection_type,
+                    len(connections_set) - 1,
+                )
+            self._unique_connections_complete = False
+            self._connections_by_site_revision = None
+        else:
+            unique_connections = self._get_unique_connections()
+            connections_by_site = self._get_connections_by_site()
+            added_connections = list()
+            new_connections = list()
+            for connection in connections:
+                # Check if an equivalent connection is in the topology
+                equivalent_members = connection.equivalent_members()
+                if equivalent_members in unique_connections:
+                    warnings.warn(
+                        "An equivalent connection already exists. "
+                        "Providing the existing equivalent Connection."
+                    )
+                    connection = unique_connections[equivalent_members]
+                else:
+                    unique_connections[equivalent_members] = connection
+
+                connections_set = connections_sets[type(connection)]
+                if connection not in connections_set:
+                    connections_set.add(connection)
+                    self._append_potential(
+                        potential_groups[type(connection)],
+                        connection.connection_type,
+                        len(connections_set) - 1,
+                    )
+                    for site in connection.connection_members:
+                        connections_by_site.setdefault(site, []).append(connection)
+                    new_connections.append(connection)
+                added_connections.append(connection)
+
+        add_field_observer("potentials", new_connections, self)
+        self.add_sites(
+            site
+            for connection in added_connections
+            for site in connection.connection_members
+        )
+        self._connections_by_label.clear()
+        if update_types:
+            self.update_topology()
 
-        for conn_member in connection.connection_members:
-            self.add_site(conn_member)
+        return added_connections
 
-        self._unique_connections.update({equivalent_members: connection})
+    def _get_unique_connections(self):
+        """Return the map of the equivalent members of every connection to it.
+
+        Connections added without validation are not in the map, which is then
+        rebuilt from all the connections of the topology in one pass.
+        """
+        if not self._unique_connections_complete:
+            self._unique_connections = {}
+            for connection in itertools.chain(
+                self._bonds, self._angles, self._dihedrals, self._impropers
+            ):
+                self._unique_connections.setdefault(
+                    connection.equivalent_members(), connection
+                )
+            self._unique_connections_complete = True
+        return self._unique_connections
 
-        connections_sets = {
+    @property
+    def _connections_sets(self):
+        """Return the collection of connections for each connection type."""
+        return {
             Bond: self._bonds,
             Angle: self._angles,
             Dihedral: self._dihedrals,
             Improper: self._impropers,
         }
-        connections_sets[type(connection)].add(connection)
-        if update_types:
-            self.update_topology()
 
-        return connection
+    def _get_connections_by_site(self):
+        """Return the map of every site to the connections it is a member of.
 
-    def identify_connections(self):
-        """Identify all connections in the topology."""
-        _identify_connections(self)
+        The map is updated as connections are added to or removed from the
+        topology, and rebuilt if the members of any connection were reassigned.
+        """
+        if self._connections_by_site_revision != FIELD_REVISIONS["members"]:
+            self._connections_by_site = {}
+            for connection in itertools.chain(
+                self._bonds, self._angles, self._dihedrals, self._impropers
+            ):
+                for site in connection.connection_members:
+                    self._connections_by_site.setdefault(site, []).append(connection)
+            self._connections_by_site_revision = FIELD_REVISIONS["members"]
+        return self._connections_by_site
+
+    def identify_connections(self, by_molecule=False):
+        """Identify all connections in the topology.
+
+        Parameters
+        ----------
+        by_molecule : bool, default=False
+            If True, identify the connections once per unique molecule and
+            replicate them over its copies.
+            See `gmso.utils.connectivity.identify_connections`.
+        """
+        _identify_connections(self, by_molecule=by_molecule)
 
     def update_atom_types(self):
         """Keep an up-to-date length of all the connection types."""
@@ -913,13 +1197,88 @@ class Topology(object):
 
     def _bookkeep_potentials(self):
         self._potentials_count = {
-            "atom_types": len(self.atom_types),
-            "bond_types": len(self.bond_types),
-            "angle_types": len(self.angle_types),
-            "dihedral_types": len(self.dihedral_types),
-            "improper_types": len(self.improper_types),
-            "pairpotential_types": len(self._pairpotential_types),
+            group: len(refcounts)
+            for group, refcounts in self._potential_refcounts.items()
         }
+        self._potentials_count["pairpotential_types"] = len(self._pairpotential_types)
+
+    def _count_potential(self, group, potential, increment):
+        """Add `increment` references of the sites/connections in `group` to `potential`.
+
+        The references are counted per potential object, so that the number of
+        unique potentials and of typed sites/connections are known without
+        iterating over the topology.
+        """
+        if potential is None:
+            return
+        refcounts = self._potential_refcounts[group]
+        count = refcounts.get(potential, 0) + increment
+        if count > 0:
+            refcounts[potential] = count
+        else:
+            refcounts.pop(potential, None)
+        self._n_typed[group] += increment
+
+    def _tracked_field_assigned(self, instance, name, old, new):
+        """Update the potential counts when a potential of a site/connection changes.
+
+        The topology only observes its own sites and connections, see
+        `gmso.abc.gmso_base.add_field_observer`.
+        """
+        if isinstance(instance, Connection):
+            group = potential_groups[type(instance)]
+        else:
+            group = "atom_types"
+        self._count_potential(group, old, -1)
+        self._count_potential(group, new, 1)
+        self._reorder_potentials(group, instance, old, new)
+
+    def _append_potential(self, group, potential, position):
+        """Count the potential of a site/connection appended at `position`.
+
+        The position of the first site/connection of every potential in a
+        group is kept, so that a potential seen for the first time is indexed
+        last in its TopologyPotentialView without rebuilding the indices.
+        """
+        self._count_potential(group, potential, 1)
+        positions = self._potential_positions[group]
+        if potential is None or positions is None or potential in positions:
+            return
+        positions[potential] = position
+        indices = self._potential_indices[group]
+        if indices is not None:
+            indices[potential] = len(indices)
+
+    def _reorder_potentials(self, group, instance, old, new):
+        """Update the first positions of the potentials of a reassigned member."""
+        positions = self._potential_positions[group]
+        if positions is None or old is new:
+            return
+        if isinstance(instance, Connection):
+            members = self._connections_sets[type(instance)]
+        else:
+            members = self._sites
+        position = members.index(instance)
+
+        reordered = False
+        if old is not None:
+            if old not in self._potential_refcounts[group]:
+                positions.pop(old, None)
+                reordered = True
+            elif positions.get(old) == position:
+                # The next member of the old potential is not known
+                self._reset_potential_indices(group)
+                return
+        if new is not None and position < positions.get(new, len(members)):
+            positions[new] = position
+            reordered = True
+        if reordered:
+            self._potential_indices[group] = None
+
+    def _reset_potential_indices(self, group):
+        """Rebuild the potential indices of a group from its members when next needed."""
+        self._potential_positions[group] = None
+        self._potential_indices[group] = None
 
     def add_pairpotentialtype(self, pairpotentialtype, update=True):
         """add a PairPotentialType to the topology
@@ -1013,14 +1372,14 @@ class Topology(object):
             self.update_topology()
 
         typed_status = {
-            "sites": lambda top: all(site.atom_type for site in top._sites),
-            "bonds": lambda top: all(bond.bond_type for bond in top._bonds),
-            "angles": lambda top: all(angle.angle_type for angle in top._angles),
-            "dihedrals": lambda top: all(
-                dihedral.dihedral_type for dihedral in top._dihedrals
+            "sites": lambda top: top._n_typed["atom_types"] == len(top._sites),
+            "bonds": lambda top: top._n_typed["bond_types"] == len(top._bonds),
+            "angles": lambda top: top._n_typed["angle_types"] == len(top._angles),
+            "dihedrals": lambda top: (
+                top._n_typed["dihedral_types"] == len(top._dihedrals)
             ),
-            "impropers": lambda top: all(
-                improper.improper_type for improper in top._impropers
+            "impropers": lambda top: (
+                top._n_typed["improper_types"] == len(top._impropers)
             ),
         }
 
@@ -1166,27 +1525,20 @@ class Topology(object):
 
     def _get_bonds_for(self, site):
         """Return a list of bonds in this Topology that the site is a part of."""
-        bonds = []
-        for bond in self.bonds:
-            if site in bond.connection_members:
-                bonds.append(bond)
-        return bonds
+        return self._get_connections_for(site, Bond)
 
     def _get_angles_for(self, site):
         """Return a list of angles in this Topology that the site is a part of."""
-        angles = []
-        for angle in self.angles:
-            if site in angle.connection_members:
-                angles.append(angle)
-        return angles
+        return self._get_connections_for(site, Angle)
 
     def _get_dihedrals_for(self, site):
         """Return a list of dihedrals in this Topology that the site is a part of."""
-        dihedrals = []
-        for dihedral in self.dihedrals:
-            if site in dihedral.connection_members:
-                dihedrals.append(dihedral)
-        return dihedrals
+        return self._get_connections_for(site, Dihedral)
+
+    def _get_connections_for(self, site, connection_type):
+        """Return a list of connections of a type that the site is a part of."""
+        connections = self._get_connections_by_site().get(site, ())
+        return [conn for conn in connections if type(conn) is connection_type]
 
     def get_index(self, member):
         """Get index of a member in the topology.
@@ -1209,22 +1561,122 @@ class Topology(object):
             Angle: self._angles,
             Dihedral: self._dihedrals,
             Improper: self._impropers,
-            AtomType: self.atom_types,
-            BondType: self.bond_types,
-            AngleType: self.angle_types,
-            DihedralType: self.dihedral_types,
-            ImproperType: self.improper_types,
-            PairPotentialType: self.pairpotential_types,
+            PairPotentialType: self._pairpotential_types,
         }
 
         member_type = type(member)
 
-        if member_type not in refs.keys():
+        if member_type in refs:
+            return refs[member_type].index(member)
+        elif member_type in potential_type_groups:
+            return self._get_potential_index(member)
+        else:
             raise TypeError(f"Cannot index member of type {member_type.__name__}")
 
-        index = refs[member_type].index(member)
+    def _get_potential_index(self, potential):
+        """Return the index of a potential in its TopologyPotentialView.
+
+        The sites and connections are stored in IndexedSets, which already
+        map items to their indices. Potentials are only reachable through a
+        view over their owners, which lists them in the order of their first
+        site/connection. The topology keeps the position of the first member
+        of every potential up to date as members are added and typed, and the
+        indices are the order of those positions. The members are only
+        rescanned after one is removed, or when the first member of a
+        potential is assigned another potential.
+        """
+        group = potential_type_groups[type(potential)]
+        indices = self._potential_indices[group]
+        if indices is None:
+            positions = self._potential_positions[group]
+            if positions is None:
+                positions = {}
+                if group == "atom_types":
+                    potentials = (
+                        getattr(site, "atom_type", None) for site in self._sites
+                    )
+                else:
+                    connections_set = {
+                        "bond_types": self._bonds,
+                        "angle_types": self._angles,
+                        "dihedral_types": self._dihedrals,
+                        "improper_types": self._impropers,
+                    }[group]
+                    potentials = (
+                        connection.connection_type for connection in connections_set
+                    )
+                for j, member_potential in enumerate(potentials):
+                    if member_potential is not None:
+                        positions.setdefault(member_potential, j)
+                self._potential_positions[group] = positions
+            indices = {
+                pot: j for j, pot in enumerate(sorted(positions, key=positions.get))
+            }
+            self._potential_indices[group] = indices
+
+        return indices.get(potential)
 
-        return index
+    def _get_site_array(self, name):
+        """Return a read-only per-site array, rebuilding it if it is stale."""
+        revision = (id(self),) + tuple(
+            FIELD_REVISIONS[topic] for topic in site_array_topics[name]
+        )
+        if name in self._site_arrays and self._site_arrays[name][0] == revision:
+            return self._site_arrays[name][1]
+
+        attr, unit = {
+            "charges": (
+                "charge",
+                u.Unit("elementary_charge", registry=UnitReg.default_reg()),
+            ),
+            "masses": ("mass", u.gram / u.mol),
+        }[name]
+        array = u.unyt_array(np.full(self.n_sites, np.nan), unit)
+        values = array.ndview
+        for i, site in enumerate(self._sites):
+            value = getattr(site, attr)
+            if value is not None:
+                values[i] = value.to_value(unit)
+
+        view = array.view()
+        view.flags.writeable = False
+        self._site_arrays[name] = (revision, view)
+        return view
+
+    def _positions_bound(self):
+        """Return True if the position of every site is a view of the positions buffer."""
+        revision = FIELD_REVISIONS["positions"]
+        cached = self._site_arrays.get("positions")
+        if cached is not None and cached[0] == revision:
+            return True
+
+        bound_positions = self._bound_positions
+        if bound_positions is None or len(bound_positions) != self.n_sites:
+            return False
+        for site, position in zip(self._sites, bound_positions):
+            if site.__dict__.get("position_") is not position:
+                return False
+
+        view = self._positions_buffer.view()
+        view.flags.writeable = False
+        self._site_arrays["positions"] = (revision, view)
+        return True
+
+    def _get_positions(self):
+        """Return a view of the positions buffer, or gather the positions of the sites."""
+        if self._positions_bound():
+            return self._site_arrays["positions"][1]
+
+        positions = u.unyt_array(np.empty(shape=(self.n_sites, 3)), u.nm)
+        values = positions.ndview
+        for i, site in enumerate(self._sites):
+            position = site.position
+            if position.units == u.nm or position.units.is_dimensionless:
+                values[i] = position.ndview
+            else:
+                values[i] = position.to_value(u.nm)
+        positions.flags.writeable = False
+        return positions
 
     def write_forcefield(self, filename, overwrite=False):
         """Save an xml file for all parameters found in the topology.
@@ -1392,9 +1844,7 @@ class Topology(object):
                 "Expected `value` to be something other than None. Provided None."
             )
         if key in ("molecule", "residue") and isinstance(value, str):
-            for site in self._sites:
-                if getattr(site, key) and getattr(site, key).name == value:
-                    yield site
+            yield from self._get_sites_by_label(key, name_only=True).get(value, ())
         elif isinstance(value, (tuple, list)):
             containers_dict = {"molecule": Molecule, "residue": Residue}
             if len(value) == 2:
@@ -1412,9 +1862,9 @@ class Topology(object):
                         number is type int, and isrigid is type bool.
                     """
                 )
-            for site in self._sites:
-                if getattr(site, key) and getattr(site, key) == tmp:
-                    yield site
+            yield from self._get_sites_by_label(key).get(tmp, ())
+        elif key in ("molecule", "residue", "group"):
+            yield from self._get_sites_by_label(key).get(value, ())
         else:
             for site in self._sites:
                 if getattr(site, key) == value:
@@ -1429,9 +1879,7 @@ class Topology(object):
             The method to iterate over Topology's sites
         """
         if isinstance(residue_tag, str):
-            for site in self._sites:
-                if site.residue and getattr(site, "residue").name == residue_tag:
-                    yield site
+            yield from self._get_sites_by_label("residue", True).get(residue_tag, ())
         else:
             return self.iter_sites("residue", residue_tag)
 
@@ -1444,12 +1892,83 @@ class Topology(object):
             The method to iterate over Topology's sites
         """
         if isinstance(molecule_tag, str):
-            for site in self._sites:
-                if site.molecule and getattr(site, "molecule").name == molecule_tag:
-                    yield site
+            yield from self._get_sites_by_label("molecule", True).get(molecule_tag, ())
         else:
             return self.iter_sites("molecule", molecule_tag)
 
+    def _get_sites_by_label(self, label_type, name_only=False):
+        """Return a map of the molecule, residue or group labels to their sites.
+
+        Parameters
+        ----------
+        label_type : str, one of {'molecule', 'residue', 'group'}
+            The label of the sites to map
+        name_only : bool, default=False
+            If True, map the names of the molecule/residue labels instead
+
+        Notes
+        -----
+        The maps are built lazily with a single pass over the sites, and kept
+        until a site is added or removed or any label is reassigned. Both the
+        labels and the sites are in the order they appear in the topology.
+        Unlabeled sites are mapped to None.
+        """
+        self._validate_label_indices()
+        key = (label_type, name_only)
+        if key not in self._sites_by_label:
+            sites_by_label = {}
+            for site in self._sites:
+                label = getattr(site, label_type)
+                if name_only:
+                    label = label.name if label else None
+                sites_by_label.setdefault(label, []).append(site)
+            self._sites_by_label[key] = sites_by_label
+        return self._sites_by_label[key]
+
+    def _get_connections_by_label(self, connections, label_type, label):
+        """Return the connections whose members all share the same label.
+
+        Parameters
+        ----------
+        connections : str, one of {'bonds', 'angles', 'dihedrals', 'impropers'}
+            The connections to look through
+        label_type : str, one of {'molecule', 'residue', 'group'}
+            The label of the sites to check
+        label : str, gmso.abc.abstract_site.Molecule or Residue
+            The label to match, molecule and residue labels given as a string
+            are matched by name
+
+        Notes
+        -----
+        Like `_get_sites_by_label`, the connections of every label are found
+        with a single pass over the connections and reused until the topology
+        or the labels change.
+        """
+        self._validate_label_indices()
+        name_only = label_type in ("molecule", "residue") and isinstance(label, str)
+        key = (connections, label_type, name_only)
+        if key not in self._connections_by_label:
+            connections_by_label = {}
+            for connection in getattr(self, connections):
+                labels = set()
+                for site in connection.connection_members:
+                    site_label = getattr(site, label_type)
+                    if name_only:
+                        site_label = site_label.name if site_label else None
+                    labels.add(site_label)
+                if len(labels) == 1:
+                    connections_by_label.setdefault(labels.pop(), []).append(connection)
+            self._connections_by_label[key] = connections_by_label
+        return self._connections_by_label[key].get(label, [])
+
+    def _validate_label_indices(self):
+        """Drop the label maps if any label or connection member was reassigned."""
+        revision = (FIELD_REVISIONS["labels"], FIELD_REVISIONS["members"])
+        if self._label_indices_revision != revision:
+            self._sites_by_label.clear()
+            self._connections_by_label.clear()
+            self._label_indices_revision = revision
+
     def iter_connections_by_site(self, site, connections=None):
         """Iterate through this topology's connections which contain
         this specific site.
@@ -1481,10 +2000,14 @@ class Topology(object):
                         "Valid connection types are limited to: "
                         '"bonds", "angles", "dihedrals", "impropers"'
                     )
+        connection_types = {
+            "bonds": Bond,
+            "angles": Angle,
+            "dihedrals": Dihedral,
+            "impropers": Improper,
+        }
         for conn_str in connections:
-            for conn in getattr(self, conn_str):
-                if site in conn.connection_members:
-                    yield conn
+            yield from self._get_connections_for(site, connection_types[conn_str])
 
     def create_subtop(self, label_type, label):
         """Create a new Topology object from a molecule or graup of the current Topology.
@@ -1538,48 +2061,29 @@ class Topology(object):
 
         new_top = gmso.Topology(name=label if isinstance(label, str) else label[0])
 
-        for ref_site, new_site in sites_dict.items():
-            new_top.add_site(new_site[1])
-        for ref_conn, conn_idx in bonds_dict.items():
-            bond = gmso.Bond(
-                connection_members=[new_top.sites[conn_idx[i]] for i in range(2)],
-                bond_type=(
-                    None
-                    if not ref_conn.connection_type
-                    else ref_conn.connection_type.clone()
-                ),
-            )
-            new_top.add_connection(bond)
-        for ref_conn, conn_idx in angles_dict.items():
-            angle = gmso.Angle(
-                connection_members=[new_top.sites[conn_idx[i]] for i in range(3)],
-                angle_type=(
-                    None
-                    if not ref_conn.connection_type
-                    else ref_conn.connection_type.clone()
-                ),
-            )
-            new_top.add_connection(angle)
-        for ref_conn, conn_idx in dihedrals_dict.items():
-            dihedral = gmso.Dihedral(
-                connection_members=[new_top.sites[conn_idx[i]] for i in range(4)],
-                dihedral_type=(
-                    None
-                    if not ref_conn.connection_type
-                    else ref_conn.connection_type.clone()
-                ),
-            )
-            new_top.add_connection(dihedral)
-        for ref_conn, conn_idx in impropers_dict.items():
-            improper = gmso.Improper(
-                connection_members=[new_top.sites[conn_idx[i]] for i in range(4)],
-                improper_type=(
-                    None
-                    if not ref_conn.connection_type
-                    else ref_conn.connection_type.clone()
-                ),
-            )
-            new_top.add_connection(improper)
+        new_sites = [new_site for _, new_site in sites_dict.values()]
+        new_top.add_sites(new_sites)
+        connections = list()
+        for connections_dict, Creator, type_attr in [
+            (bonds_dict, gmso.Bond, "bond_type"),
+            (angles_dict, gmso.Angle, "angle_type"),
+            (dihedrals_dict, gmso.Dihedral, "dihedral_type"),
+            (impropers_dict, gmso.Improper, "improper_type"),
+        ]:
+            for ref_conn, conn_idx in connections_dict.items():
+                connection_type = ref_conn.connection_type
+                connections.append(
+                    Creator(
+                        connection_members=[new_sites[idx] for idx in conn_idx],
+                        **{
+                            type_attr: (
+                                None if not connection_type else connection_type.clone()
+                            )
+                        },
+                    )
+                )
+        # The connections of this topology are unique, and so are their copies
+        new_top.add_connections(connections, validate=False)
 
         new_top.update_topology()
         return new_top
@@ -5,7 +5,6 @@ from __future__ import division
 import copy
 import itertools
 import json
-import re
 import warnings
 
 import numpy as np
@@ -20,6 +19,7 @@ from gmso.utils.conversions import convert_ryckaert_to_opls
 from gmso.utils.geometry import coord_shift
 from gmso.utils.io import has_gsd, has_hoomd
 from gmso.utils.sorting import (
+    natural_sort,
     sort_by_classes,
     sort_by_types,
     sort_connection_members,
@@ -272,10 +272,9 @@ def _parse_particle_information(
     box_lengths : list() of length 3
         Lengths of box in x, y, z
     """
-    # Set up all require
-    xyz = u.unyt_array(
-        [site.position.to_value(base_units["length"]) for site in top.sites]
-    )
+    # Positions, masses and charges are read from the topology's per-site
+    # arrays, so that units are converted once for the whole array
+    xyz = u.unyt_array(top.positions.to_value(base_units["length"]))
     if shift_coords:
         warnings.warn("Shifting coordinates to [-L/2, L/2]")
         xyz = coord_shift(xyz, box_lengths)
@@ -284,17 +283,17 @@ def _parse_particle_information(
         site.name if site.atom_type is None else site.atom_type.name
         for site in top.sites
     ]
-    unique_types = sorted(list(set(types)))
-    typeids = np.array([unique_types.index(t) for t in types])
-    masses = list()
-    charges = list()
-    for site in top.sites:
-        masses.append(
-            site.mass.to_value(base_units["mass"])
-            if site.mass
-            else 1 * base_units["mass"]
-        )
-        charges.append(site.charge if site.charge else 0 * u.elementary_charge)
+    unique_types = sorted(set(types))
+    type_ids = {atom_type: idx for idx, atom_type in enumerate(unique_types)}
+    typeids = np.fromiter(
+        (type_ids[atom_type] for atom_type in types), dtype=np.int32, count=len(types)
+    )
+
+    # Sites without a mass (or with a zero mass) are given a unit mass,
+    # sites without a charge are neutral
+    masses = top.masses.to_value(base_units["mass"])
+    masses[np.isnan(masses) | (masses == 0)] = 1
+    charges = np.nan_to_num(top.charges.to_value(u.elementary_charge), nan=0.0)
 
     """
     Permittivity of free space = 2.39725e-4 e^2/((kcal/mol)(angstrom)),
@@ -307,6 +306,7 @@ def _parse_particle_information(
     charge_factor = (
         4.0 * np.pi * e0 * base_units["length"] * base_units["energy"]
     ) ** 0.5
+    charges = charges / charge_factor.to_value(u.elementary_charge)
 
     if isinstance(snapshot, hoomd.Snapshot):
         snapshot.particles.N = top.n_sites
@@ -314,14 +314,14 @@ def _parse_particle_information(
         snapshot.particles.position[0:] = xyz
         snapshot.particles.typeid[0:] = typeids
         snapshot.particles.mass[0:] = masses
-        snapshot.particles.charge[0:] = charges / charge_factor
+        snapshot.particles.charge[0:] = charges
     elif isinstance(snapshot, gsd.hoomd.Frame):
         snapshot.particles.N = top.n_sites
         snapshot.particles.types = unique_types
         snapshot.particles.position = xyz
         snapshot.particles.typeid = typeids
         snapshot.particles.mass = masses
-        snapshot.particles.charge = charges / charge_factor
+        snapshot.particles.charge = charges
     if rigid_bodies:
         warnings.warn(
             "Rigid bodies detected, but not yet implemented for GSD",
@@ -334,26 +334,28 @@ def _parse_pairs_information(
     top,
 ):
     """Parse scaled pair types."""
-    pair_types = list()
+    pair_types = dict()
     pair_typeids = list()
     pairs = list()
 
-    scaled_pairs = list()
-    pairs_dict = generate_pairs_lists(top, refer_from_scaling_factor=True)
-    for pair_type in pairs_dict:
-        scaled_pairs.extend(pairs_dict[pair_type])
-
-    for pair in scaled_pairs:
-        if pair[0].atom_type and pair[1].atom_type:
-            pair.sort(key=lambda site: site.atom_type.name)
-            pair_type = "-".join([pair[0].atom_type.name, pair[1].atom_type.name])
+    sites = top.sites
+    pairs_dict = generate_pairs_lists(
+        top, refer_from_scaling_factor=True, index_only=True
+    )
+    for pair in itertools.chain.from_iterable(
+        scaled_pairs.tolist() for scaled_pairs in pairs_dict.values()
+    ):
+        if sites[pair[0]].atom_type and sites[pair[1]].atom_type:
+            names = [sites[idx].atom_type.name for idx in pair]
         else:
-            pair.sort(key=lambda site: site.name)
-            pair_type = "-".join([pair[0].name, pair[1].name])
-        if pair_type not in pair_types:
-            pair_types.append(pair_type)
-        pair_typeids.append(pair_types.index(pair_type))
-        pairs.append((top.get_index(pair[0]), top.get_index(pair[1])))
+            names = [sites[idx].name for idx in pair]
+        if names[0] > names[1]:
+            pair.reverse()
+            names.reverse()
+        pair_type = "-".join(names)
+        pair_typeids.append(pair_types.setdefault(pair_type, len(pair_types)))
+        pairs.append(tuple(pair))
+    pair_types = list(pair_types)
 
     if isinstance(snapshot, hoomd.Snapshot):
         snapshot.pairs.N = len(pairs)
@@ -367,6 +369,105 @@ def _parse_pairs_information(
         snapshot.pairs.typeid = pair_typeids
 
 
+def _sort_bond_members(ranks):
+    """Return the member order of bonds, lowest ranked member first."""
+    swap = ranks[:, 0] > ranks[:, 1]
+    return np.where(swap[:, None], [1, 0], [0, 1])
+
+
+def _sort_angle_members(ranks):
+    """Return the member order of angles, lowest ranked outer member first."""
+    swap = ranks[:, 0] > ranks[:, 2]
+    return np.where(swap[:, None], [2, 1, 0], [0, 1, 2])
+
+
+def _sort_dihedral_members(ranks):
+    """Return the member order of dihedrals, lowest ranked inner member first."""
+    reverse = (ranks[:, 1] > ranks[:, 2]) | (
+        (ranks[:, 1] == ranks[:, 2]) & (ranks[:, 0] > ranks[:, 3])
+    )
+    return np.where(reverse[:, None], [3, 2, 1, 0], [0, 1, 2, 3])
+
+
+def _sort_improper_members(ranks):
+    """Return the member order of impropers, central member first."""
+    order = np.argsort(ranks[:, 1:], axis=1, kind="stable") + 1
+    return np.hstack([np.zeros((len(ranks), 1), dtype=order.dtype), order])
+
+
+def _parse_connection_groups(top, connections, sort_members):
+    """Return the member indices, unique types and type ids of connections.
+
+    This is the array counterpart of calling `sort_connection_members` and
+    `top.get_index` on every connection. A connection is labelled by the
+    atomclass of its members when all of them are typed, and by their names
+    otherwise. Every label is given a rank following its natural sort order,
+    so that the members of all the connections are sorted in one pass.
+
+    Parameters
+    ----------
+    top : gmso.Topology
+        Topology object holding system information
+    connections : iterable of gmso.Connection
+        The bonds, angles, dihedrals or impropers of the topology.
+    sort_members : callable
+        Given the (n_connections, n_members) ranks of the members, return
+        the sorted order of the members of every connection.
+
+    Returns
+    -------
+    groups : np.ndarray of shape (n_connections, n_members)
+        The sorted indices of the members in the topology.
+    unique_types : list of str
+        The unique connection types.
+    typeids : np.ndarray of shape (n_connections,)
+        The index of each connection's type in unique_types.
+    """
+    site_ids = {site: idx for idx, site in enumerate(top.sites)}
+    labels = dict()
+    name_ids = np.empty(top.n_sites, dtype=np.int64)
+    class_ids = np.full(top.n_sites, -1, dtype=np.int64)
+    for idx, site in enumerate(top.sites):
+        name_ids[idx] = labels.setdefault(site.name, len(labels))
+        if site.atom_type is not None:
+            class_ids[idx] = labels.setdefault(site.atom_type.atomclass, len(labels))
+
+    # Labels with the same natural sort key share a rank, so that ties keep
+    # the order of the members just like the stable sort they replace
+    label_ranks = np.empty(len(labels), dtype=np.int64)
+    rank, previous_key = -1, None
+    for label in sorted(labels, key=natural_sort):
+        key = natural_sort(label)
+        if key != previous_key:
+            rank, previous_key = rank + 1, key
+        label_ranks[labels[label]] = rank
+
+    connections = list(connections)
+    n_members = len(connections[0].connection_members) if connections else 0
+    members = np.fromiter(
+        (
+            site_ids[site]
+            for connection in connections
+            for site in connection.connection_members
+        ),
+        dtype=np.int64,
+        count=len(connections) * n_members,
+    ).reshape(-1, n_members)
+
+    typed = (class_ids[members] >= 0).all(axis=1)
+    label_ids = np.where(typed[:, None], class_ids[members], name_ids[members])
+    order = sort_members(label_ranks[label_ids])
+    groups = np.take_along_axis(members, order, axis=1)
+    label_ids = np.take_along_axis(label_ids, order, axis=1)
+
+    unique_label_ids, typeids = np.unique(label_ids, axis=0, return_inverse=True)
+    label_list = list(labels)
+    unique_types = [
+        "-".join(label_list[label_id] for label_id in row) for row in unique_label_ids
+    ]
+    return groups, unique_types, typeids.reshape(-1)
+
+
 def _parse_bond_information(snapshot, top):
     """Parse bonds information from topology.
 
@@ -380,27 +481,10 @@ def _parse_bond_information(snapshot, top):
     """
     snapshot.bonds.N = top.n_bonds
     warnings.warn(f"{top.n_bonds} bonds detected")
-    bond_groups = []
-    bond_typeids = []
-    bond_types = []
-
-    for bond in top.bonds:
-        if all([site.atom_type for site in bond.connection_members]):
-            connection_members = sort_connection_members(bond, "atomclass")
-            bond_type = "-".join(
-                [site.atom_type.atomclass for site in connection_members]
-            )
-        else:
-            connection_members = sort_connection_members(bond, "name")
-            bond_type = "-".join([site.name for site in connection_members])
-
-        bond_types.append(bond_type)
-        bond_groups.append(
-            sorted(tuple(top.get_index(site) for site in connection_members))
-        )
-
-    unique_bond_types = list(set(bond_types))
-    bond_typeids = [unique_bond_types.index(i) for i in bond_types]
+    bond_groups, unique_bond_types, bond_typeids = _parse_connection_groups(
+        top, top.bonds, _sort_bond_members
+    )
+    bond_groups = np.sort(bond_groups, axis=1)
 
     if isinstance(snapshot, hoomd.Snapshot):
         snapshot.bonds.types = unique_bond_types
@@ -426,35 +510,18 @@ def _parse_angle_information(snapshot, top):
 
     """
     snapshot.angles.N = top.n_angles
-    unique_angle_types = set()
-    angle_typeids = []
-    angle_groups = []
-    angle_types = []
-
-    for angle in top.angles:
-        if all([site.atom_type for site in angle.connection_members]):
-            connection_members = sort_connection_members(angle, "atomclass")
-            angle_type = "-".join(
-                [site.atom_type.atomclass for site in connection_members]
-            )
-        else:
-            connection_members = sort_connection_members(angle, "name")
-            angle_type = "-".join([site.name for site in connection_members])
-
-        angle_types.append(angle_type)
-        angle_groups.append(tuple(top.get_index(site) for site in connection_members))
-
-    unique_angle_types = list(set(angle_types))
-    angle_typeids = [unique_angle_types.index(i) for i in angle_types]
+    angle_groups, unique_angle_types, angle_typeids = _parse_connection_groups(
+        top, top.angles, _sort_angle_members
+    )
 
     if isinstance(snapshot, hoomd.Snapshot):
         snapshot.angles.types = unique_angle_types
         snapshot.angles.typeid[:] = angle_typeids
-        snapshot.angles.group[:] = np.reshape(angle_groups, (-1, 3))
+        snapshot.angles.group[:] = angle_groups
     elif isinstance(snapshot, gsd.hoomd.Frame):
         snapshot.angles.types = unique_angle_types
         snapshot.angles.typeid = angle_typeids
-        snapshot.angles.group = np.reshape(angle_groups, (-1, 3))
+        snapshot.angles.group = angle_groups
 
     warnings.warn(f"{top.n_angles} angles detected")
     warnings.warn(f"{len(unique_angle_types)} unique angle types detected")
@@ -472,35 +539,20 @@ def _parse_dihedral_information(snapshot, top):
 
     """
     snapshot.dihedrals.N = top.n_dihedrals
-    dihedral_groups = []
-    dihedral_types = []
-
-    for dihedral in top.dihedrals:
-        if all([site.atom_type for site in dihedral.connection_members]):
-            connection_members = sort_connection_members(dihedral, "atomclass")
-            dihedral_type = "-".join(
-                [site.atom_type.atomclass for site in connection_members]
-            )
-        else:
-            connection_members = sort_connection_members(dihedral, "name")
-            dihedral_type = "-".join([site.name for site in connection_members])
-
-        dihedral_types.append(dihedral_type)
-        dihedral_groups.append(
-            tuple(top.get_index(site) for site in connection_members)
-        )
-
-    unique_dihedral_types = list(set(dihedral_types))
-    dihedral_typeids = [unique_dihedral_types.index(i) for i in dihedral_types]
+    (
+        dihedral_groups,
+        unique_dihedral_types,
+        dihedral_typeids,
+    ) = _parse_connection_groups(top, top.dihedrals, _sort_dihedral_members)
 
     if isinstance(snapshot, hoomd.Snapshot):
         snapshot.dihedrals.types = unique_dihedral_types
         snapshot.dihedrals.typeid[:] = dihedral_typeids
-        snapshot.dihedrals.group[:] = np.reshape(dihedral_groups, (-1, 4))
+        snapshot.dihedrals.group[:] = dihedral_groups
     elif isinstance(snapshot, gsd.hoomd.Frame):
         snapshot.dihedrals.types = unique_dihedral_types
         snapshot.dihedrals.typeid = dihedral_typeids
-        snapshot.dihedrals.group = np.reshape(dihedral_groups, (-1, 4))
+        snapshot.dihedrals.group = dihedral_groups
 
     warnings.warn(f"{top.n_dihedrals} dihedrals detected")
     warnings.warn(f"{len(unique_dihedral_types)} unique dihedral types detected")
@@ -518,35 +570,20 @@ def _parse_improper_information(snapshot, top):
 
     """
     snapshot.impropers.N = top.n_impropers
-    improper_groups = []
-    improper_types = []
-
-    for improper in top.impropers:
-        if all([site.atom_type for site in improper.connection_members]):
-            connection_members = sort_connection_members(improper, "atomclass")
-            improper_type = "-".join(
-                [site.atom_type.atomclass for site in connection_members]
-            )
-        else:
-            connection_members = sort_connection_members(improper, "name")
-            improper_type = "-".join([site.name for site in connection_members])
-
-        improper_types.append(improper_type)
-        improper_groups.append(
-            tuple(top.get_index(site) for site in connection_members)
-        )
-
-    unique_improper_types = list(set(improper_types))
-    improper_typeids = [unique_improper_types.index(i) for i in improper_types]
+    (
+        improper_groups,
+        unique_improper_types,
+        improper_typeids,
+    ) = _parse_connection_groups(top, top.impropers, _sort_improper_members)
 
     if isinstance(snapshot, hoomd.Snapshot):
         snapshot.impropers.types = unique_improper_types
         snapshot.impropers.typeid[0:] = improper_typeids
-        snapshot.impropers.group[0:] = np.reshape(improper_groups, (-1, 4))
+        snapshot.impropers.group[0:] = improper_groups
     elif isinstance(snapshot, gsd.hoomd.Frame):
         snapshot.impropers.types = unique_improper_types
         snapshot.impropers.typeid = improper_typeids
-        snapshot.impropers.group = np.reshape(improper_groups, (-1, 4))
+        snapshot.impropers.group = improper_groups
 
     warnings.warn(f"{top.n_impropers} impropers detected")
     warnings.warn(f"{len(unique_improper_types)} unique dihedral types detected")
@@ -754,6 +791,9 @@ def _parse_nonbonded_forces(
             exclusions.append(f"1-{i+2}")
     nlist = hoomd.md.nlist.Cell(exclusions=exclusions, buffer=nlist_buffer)
 
+    # Special pairs are generated once and shared by all nonbonded parsers
+    special_pairs = _special_pair_types(top)
+
     nbonded_forces = list()
     nbonded_forces.extend(
         _parse_coulombic(
@@ -763,6 +803,7 @@ def _parse_nonbonded_forces(
             resolution=pppm_kwargs["resolution"],
             order=pppm_kwargs["order"],
             r_cut=r_cut,
+            special_pairs=special_pairs,
         )
     )
     for group in groups:
@@ -774,12 +815,52 @@ def _parse_nonbonded_forces(
                 r_cut=r_cut,
                 nlist=nlist,
                 scaling_factors=nb_scalings,
+                special_pairs=special_pairs,
             )
         )
 
     return nbonded_forces
 
 
+def _special_pair_types(top):
+    """Return the unique atom type pairs of the 1-2, 1-3 and 1-4 pairs.
+
+    Special pairs are parameterized by type in hoomd, so the pairs of sites
+    are reduced to the sorted names of their atom types once, and shared by
+    all the nonbonded parsers.
+
+    Returns
+    -------
+    special_pair_types : list of list of tuple
+        The unique (name, name) atom type pairs of the 1-2, 1-3 and 1-4
+        pairs, in that order.
+    """
+    type_names = [site.atom_type.name for site in top.sites]
+    pairs_dict = generate_pairs_lists(top, index_only=True)
+    return [
+        list(
+            dict.fromkeys(
+                tuple(sorted([type_names[idx1], type_names[idx2]]))
+                for idx1, idx2 in pairs.tolist()
+            )
+        )
+        for pairs in pairs_dict.values()
+    ]
+
+
+def _scale_special_pairs(special_pairs, scaling_factors):
+    """Return the scaling factor of every special pair type.
+
+    A pair type found at several neighbor orders takes the scaling factor of
+    the furthest one, and pair types with a zero scaling factor are skipped.
+    """
+    pair_scalings = dict()
+    for scaling_factor, pair_types in zip(scaling_factors, special_pairs):
+        if scaling_factor:
+            pair_scalings.update(dict.fromkeys(pair_types, scaling_factor))
+    return pair_scalings
+
+
 def _parse_coulombic(
     top,
     nlist,
@@ -787,6 +868,7 @@ def _parse_coulombic(
     resolution,
     order,
     r_cut,
+    special_pairs,
 ):
     """Parse coulombic forces."""
     charge_groups = any(
@@ -804,45 +886,87 @@ def _parse_coulombic(
     # TODO: Fiure out a more general way to do this and handle molecule scaling factors
     special_coulombic = hoomd.md.special_pair.Coulomb()
 
-    # Use same method as to_hoomd_snapshot to generate pairs list
-    pairs_dict = generate_pairs_lists(top)
-    for i, pair_type in enumerate(pairs_dict):
-        if scaling_factors[i] and pairs_dict[pair_type]:
-            for pair in pairs_dict[pair_type]:
-                pair_name = "-".join(
-                    sorted([pair[0].atom_type.name, pair[1].atom_type.name])
-                )
-                special_coulombic.params[pair_name] = dict(alpha=scaling_factors[i])
-                special_coulombic.r_cut[pair_name] = r_cut
+    pair_scalings = _scale_special_pairs(special_pairs, scaling_factors)
+    for pair_name, scaling_factor in pair_scalings.items():
+        pair_name = "-".join(pair_name)
+        special_coulombic.params[pair_name] = dict(alpha=scaling_factor)
+        special_coulombic.r_cut[pair_name] = r_cut
 
     return [*coulombic, special_coulombic]
 
 
-def _parse_lj(top, atypes, combining_rule, r_cut, nlist, scaling_factors):
+def _lj_mixing_matrices(top, atypes, combining_rule):
+    """Return the mixed epsilon and sigma of every pair of LJ atom types.
+
+    Parameters
+    ----------
+    top : gmso.Topology
+        Topology object holding the pair potential types overriding the
+        combining rule.
+    atypes : list of gmso.AtomType
+        The LJ atom types, with parameters already converted to base units.
+    combining_rule : str
+        The combining rule of sigma, either "lorentz" or "geometric".
+
+    Returns
+    -------
+    epsilons, sigmas : np.ndarray of shape (n_atypes, n_atypes)
+        The mixed parameters, in the units of the first atom type.
+    """
+    epsilon_units = atypes[0].parameters["epsilon"].units
+    sigma_units = atypes[0].parameters["sigma"].units
+    epsilon = np.array(
+        [atype.parameters["epsilon"].to_value(epsilon_units) for atype in atypes]
+    )
+    sigma = np.array(
+        [atype.parameters["sigma"].to_value(sigma_units) for atype in atypes]
+    )
+
+    epsilons = np.sqrt(np.outer(epsilon, epsilon))
+    if combining_rule == "lorentz":
+        sigmas = (sigma[:, None] + sigma[None, :]) / 2
+    elif combining_rule == "geometric":
+        sigmas = np.sqrt(np.outer(sigma, sigma))
+    else:
+        raise ValueError(f"Invalid combining rule provided ({combining_rule})")
+
+    # Pair potential types refer to atom types by name or by atomclass
+    indices = dict()
+    for idx, atype in enumerate(atypes):
+        indices.setdefault(("class", atype.atomclass), []).append(idx)
+        indices.setdefault(("name", atype.name), []).append(idx)
+    for pairpotential_type in top.pairpotential_types:
+        if not {"epsilon", "sigma"}.issubset(pairpotential_type.parameters):
+            continue
+        rows, cols = (
+            indices.get(("name", member), indices.get(("class", member), []))
+            for member in pairpotential_type.member_types
+        )
+        rows, cols = np.ix_(rows, cols), np.ix_(cols, rows)
+        for parameter, matrix, units in (
+            ("epsilon", epsilons, epsilon_units),
+            ("sigma", sigmas, sigma_units),
+        ):
+            value = pairpotential_type.parameters[parameter].to_value(units)
+            matrix[rows] = value
+            matrix[cols] = value
+
+    return epsilons, sigmas
+
+
+def _parse_lj(
+    top, atypes, combining_rule, r_cut, nlist, scaling_factors, special_pairs
+):
     """Parse LJ forces and special pairs LJ forces."""
     lj = hoomd.md.pair.LJ(nlist=nlist)
+    epsilons, sigmas = _lj_mixing_matrices(top, atypes, combining_rule)
+    names = [atype.name for atype in atypes]
     calculated_params = dict()
-    for pairs in itertools.combinations_with_replacement(atypes, 2):
-        pairs = list(pairs)
-        pairs.sort(key=lambda atype: atype.name)
-        type_name = (pairs[0].name, pairs[1].name)
-        comb_epsilon = np.sqrt(
-            pairs[0].parameters["epsilon"].value * pairs[1].parameters["epsilon"].value
-        )
-        if top.combining_rule == "lorentz":
-            comb_sigma = np.mean(
-                [pairs[0].parameters["sigma"], pairs[1].parameters["sigma"]]
-            )
-        elif top.combining_rule == "geometric":
-            comb_sigma = np.sqrt(
-                pairs[0].parameters["sigma"].value * pairs[1].parameters["sigma"].value
-            )
-        else:
-            raise ValueError(f"Invalid combining rule provided ({combining_rule})")
-
+    for i, j in itertools.combinations_with_replacement(range(len(atypes)), 2):
+        type_name = tuple(sorted([names[i], names[j]]))
         calculated_params[type_name] = {
-            "sigma": comb_sigma,
-            "epsilon": comb_epsilon,
+            "sigma": sigmas[i, j],
+            "epsilon": epsilons[i, j],
         }
         lj.params[type_name] = calculated_params[type_name]
         lj.r_cut[(type_name)] = r_cut
@@ -852,24 +976,14 @@ def _parse_lj(top, atypes, combining_rule, r_cut, nlist, scaling_factors):
     # and handle molecule scaling factors
     special_lj = hoomd.md.special_pair.LJ()
 
-    pairs_dict = generate_pairs_lists(top)
-    for i, pair_type in enumerate(pairs_dict):
-        if scaling_factors[i] and pairs_dict[pair_type]:
-            for pair in pairs_dict[pair_type]:
-                if pair[0].atom_type in atypes and pair[1].atom_type in atypes:
-                    adjscale = scaling_factors[i]
-                    pair.sort(key=lambda site: site.atom_type.name)
-                    pair_name = (
-                        pair[0].atom_type.name,
-                        pair[1].atom_type.name,
-                    )
-                    scaled_epsilon = adjscale * calculated_params[pair_name]["epsilon"]
-                    sigma = calculated_params[pair_name]["sigma"]
-                    special_lj.params["-".join(pair_name)] = {
-                        "sigma": sigma,
-                        "epsilon": scaled_epsilon,
-                    }
-                    special_lj.r_cut["-".join(pair_name)] = r_cut
+    pair_scalings = _scale_special_pairs(special_pairs, scaling_factors)
+    for pair_name, scaling_factor in pair_scalings.items():
+        if pair_name in calculated_params:
+            special_lj.params["-".join(pair_name)] = {
+                "sigma": calculated_params[pair_name]["sigma"],
+                "epsilon": scaling_factor * calculated_params[pair_name]["epsilon"],
+            }
+            special_lj.r_cut["-".join(pair_name)] = r_cut
 
     return [lj, special_lj]
 
@@ -882,6 +996,7 @@ def _parse_buckingham(
     r_cut,
     nlist,
     scaling_factors,
+    special_pairs,
 ):
     return None
 
@@ -893,6 +1008,7 @@ def _parse_lj0804(
     r_cut,
     nlist,
     scaling_factors,
+    special_pairs,
 ):
     return None
 
@@ -904,6 +1020,7 @@ def _parse_lj1208(
     r_cut,
     nlist,
     scaling_factors,
+    special_pairs,
 ):
     return None
 
@@ -915,6 +1032,7 @@ def _parse_mie(
     r_cut,
     nlist,
     scaling_factors,
+    special_pairs,
 ):
     return None
 
@@ -1165,9 +1283,13 @@ def _parse_periodic_dihedral(container, dihedrals, expected_units_dim, base_unit
     containersList = []
     for _ in range(5):
         containersList.append(copy.deepcopy(container))
+    convert_params_units(
+        dict.fromkeys(dihedral.dihedral_type for dihedral in dihedrals),
+        expected_units_dim,
+        base_units,
+    )
     for dihedral in dihedrals:
         dtype = dihedral.dihedral_type
-        dtype = _convert_single_param_units(dtype, expected_units_dim, base_units)
         member_sites = sort_connection_members(dihedral, "atomclass")
         member_classes = [site.atom_type.atomclass for site in member_sites]
         if isinstance(dtype.parameters["k"], u.array.unyt_quantity):
@@ -1204,9 +1326,13 @@ def _parse_periodic_dihedral(container, dihedrals, expected_units_dim, base_unit
 
 
 def _parse_opls_dihedral(container, dihedrals, expected_units_dim, base_units):
+    convert_params_units(
+        dict.fromkeys(dihedral.dihedral_type for dihedral in dihedrals),
+        expected_units_dim,
+        base_units,
+    )
     for dihedral in dihedrals:
         dtype = dihedral.dihedral_type
-        dtype = _convert_single_param_units(dtype, expected_units_dim, base_units)
         # TODO: The range of ks is mismatched (GMSO go from k0 to k5)
         # May need to do a check that k0 == k5 == 0 or raise a warning
         member_sites = sort_connection_members(dihedral, "atomclass")
@@ -1224,9 +1350,13 @@ def _parse_rb_dihedral(container, dihedrals, expected_units_dim, base_units):
     warnings.warn(
         "RyckaertBellemansTorsionPotential will be converted to OPLSTorsionPotential."
     )
+    convert_params_units(
+        dict.fromkeys(dihedral.dihedral_type for dihedral in dihedrals),
+        expected_units_dim,
+        base_units,
+    )
     for dihedral in dihedrals:
         dtype = dihedral.dihedral_type
-        dtype = _convert_single_param_units(dtype, expected_units_dim, base_units)
         opls = convert_ryckaert_to_opls(dtype)
         member_sites = sort_connection_members(dihedral, "atomclass")
         member_classes = [site.atom_type.atomclass for site in member_sites]
@@ -1451,24 +1581,3 @@ def _infer_units(top):
         raise ValueError(f"Cannot infer energy unit from {length_unit}")
 
     return {"length": length_unit, "energy": energy_unit, "mass": mass_unit}
-
-
-def _convert_single_param_units(
-    potential,
-    expected_units_dim,
-    base_units,
-):
-    """Convert parameters' units in the potential to that specified in the base_units."""
-    converted_params = dict()
-    for parameter in potential.parameters:
-        unit_dim = expected_units_dim[parameter]
-        ind_units = re.sub("[^a-zA-Z]+", " ", unit_dim).split()
-        for unit in ind_units:
-            unit_dim = unit_dim.replace(
-                unit,
-                f"({str(base_units[unit].value)} * {str(base_units[unit].units)})",
-            )
-
-        converted_params[parameter] = potential.parameters[parameter].to(unit_dim)
-    potential.parameters = converted_params
-    return potential
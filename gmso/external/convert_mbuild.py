@@ -107,16 +107,21 @@ def from_mbuild(
         _parse_group(site_map, compound, custom_groups)
 
     # Use site map to apply Compound info to Topology.
-    for part in compound.particles():
-        site = _parse_site(site_map, part, search_method, infer_element=infer_elements)
-        top.add_site(site)
+    top.add_sites(
+        _parse_site(site_map, part, search_method, infer_element=infer_elements)
+        for part in compound.particles()
+    )
 
+    bonds = list()
     for b1, b2 in compound.bonds():
         assert site_map[b1]["site"].molecule == site_map[b2]["site"].molecule
-        new_bond = Bond(
-            connection_members=[site_map[b1]["site"], site_map[b2]["site"]],
+        bonds.append(
+            Bond(
+                connection_members=[site_map[b1]["site"], site_map[b2]["site"]],
+            )
         )
-        top.add_connection(new_bond, update_types=False)
+    # The bonds of a compound are unique
+    top.add_connections(bonds, update_types=False, validate=False)
 
     if box:
         top.box = from_mbuild_box(box)
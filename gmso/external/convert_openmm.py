@@ -34,8 +34,7 @@ def to_openmm(topology, openmm_object="topology"):
     openmm_top = app.Topology()
 
     # Get topology.positions into OpenMM form
-    topology.positions.convert_to_units(u.nm)
-    value = [i.value for i in topology.positions]
+    value = [i for i in topology.positions.to_value(u.nm)]
     openmm_pos = openmm_unit.Quantity(value=value, unit=openmm_unit.nanometer)
 
     # Adding a default chain and residue temporarily
@@ -88,6 +88,7 @@ def from_parmed(structure, refer_type=True):
             site_map[atom] = site
             top.add_site(site)
 
+    connections = list()
     harmonicbond_potential = lib["HarmonicBondPotential"]
     name = harmonicbond_potential.name
     expression = harmonicbond_potential.expression
@@ -114,7 +115,7 @@ def from_parmed(structure, refer_type=True):
                 expression=expression,
                 variables=variables,
             )
-        top.add_connection(top_connection, update_types=False)
+        connections.append(top_connection)
 
     harmonicangle_potential = lib["HarmonicAnglePotential"]
     name = harmonicangle_potential.name
@@ -142,7 +143,7 @@ def from_parmed(structure, refer_type=True):
                 expression=expression,
                 variables=variables,
             )
-        top.add_connection(top_connection, update_types=False)
+        connections.append(top_connection)
 
     periodic_torsion_potential = lib["PeriodicTorsionPotential"]
     name_proper = periodic_torsion_potential.name
@@ -201,7 +202,7 @@ def from_parmed(structure, refer_type=True):
                     expression=expression_proper,
                     variables=variables_proper,
                 )
-        top.add_connection(top_connection, update_types=False)
+        connections.append(top_connection)
 
     ryckaert_bellemans_torsion_potential = lib["RyckaertBellemansTorsionPotential"]
     name = ryckaert_bellemans_torsion_potential.name
@@ -235,7 +236,7 @@ def from_parmed(structure, refer_type=True):
                 expression=expression,
                 variables=variables,
             )
-        top.add_connection(top_connection, update_types=False)
+        connections.append(top_connection)
 
     periodic_torsion_potential = lib["HarmonicTorsionPotential"]
     name = periodic_torsion_potential.name
@@ -265,8 +266,11 @@ def from_parmed(structure, refer_type=True):
                 expression=expression,
                 variables=variables,
             )
-        top.add_connection(top_connection, update_types=False)
+        connections.append(top_connection)
 
+    # Parmed may hold several terms on the same members, these are merged
+    # into the first equivalent connection
+    top.add_connections(connections, update_types=False)
     top.update_topology()
     return top
 
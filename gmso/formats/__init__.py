@@ -4,14 +4,14 @@
 from gmso.utils.io import has_ipywidgets
 
 from .formats_registry import LoadersRegistry, SaversRegistry
-from .gro import read_gro, write_gro
+from .gro import iter_gro_frames, read_gro, write_gro
 from .gsd import write_gsd
 from .json import write_json
 from .lammpsdata import write_lammpsdata
 from .mcf import write_mcf
 from .mol2 import read_mol2
 from .top import write_top
-from .xyz import read_xyz, write_xyz
+from .xyz import iter_xyz_frames, read_xyz, write_xyz
 
 if has_ipywidgets:
     from .networkx import (
@@ -0,0 +1,156 @@
+"""Write formatted text to files in large chunks."""
+
+import itertools
+import queue
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+__all__ = ["ChunkedWriter", "format_columns", "open_chunked"]
+
+CHUNK_SIZE = 1 << 20
+CHUNK_ROWS = 512
+
+
+def format_columns(columns, row_format, chunk_rows=CHUNK_ROWS):
+    """Format columns of values into lines of text, a chunk of rows at a time.
+
+    Every chunk is formatted with a single printf-style operation on the row
+    format repeated once per row, which avoids formatting the lines one at a
+    time.
+
+    Parameters
+    ----------
+    columns : list of sequences or np.ndarray
+        The values of each column, all of the same length
+    row_format : str
+        A printf-style format for a line, with one conversion per column,
+        e.g. ``"%5d %8.3f\\n"``
+    chunk_rows : int, default=512
+        The number of rows formatted at once
+
+    Yields
+    ------
+    str
+        The formatted lines of up to `chunk_rows` rows
+    """
+    columns = [
+        column.tolist() if isinstance(column, np.ndarray) else column
+        for column in columns
+    ]
+    rows = zip(*columns)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_rows))
+        if not chunk:
+            return
+        yield (row_format * len(chunk)) % tuple(itertools.chain.from_iterable(chunk))
+
+
+class ChunkedWriter:
+    """A file wrapper that buffers the text written to it and writes it in chunks.
+
+    Parameters
+    ----------
+    file : file object
+        The text file to write to, which is not closed by the writer
+    chunk_size : int, default=1048576
+        The number of characters buffered before they are written to the file
+    threaded : bool, default=False
+        If True, the chunks are written to the file from a background thread,
+        so that formatting the next chunk overlaps with writing the last one
+    """
+
+    def __init__(self, file, chunk_size=CHUNK_SIZE, threaded=False):
+        self.file = file
+        self.chunk_size = chunk_size
+        self._buffer = []
+        self._buffered = 0
+        self._error = None
+        self._queue = None
+        self._thread = None
+        if threaded:
+            self._queue = queue.Queue(maxsize=4)
+            self._thread = threading.Thread(target=self._write_chunks, daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, text):
+        """Buffer text, writing the buffer out once it holds a full chunk."""
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.chunk_size:
+            self.flush()
+
+    def writelines(self, lines):
+        """Buffer every line of an iterable of lines."""
+        for line in lines:
+            self.write(line)
+
+    def write_columns(self, columns, row_format):
+        """Format columns of values as lines of text, see `format_columns`."""
+        for chunk in format_columns(columns, row_format):
+            self.write(chunk)
+
+    def flush(self):
+        """Write out the buffered text."""
+        if not self._buffer:
+            return
+        chunk = "".join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        if self._thread is None:
+            self.file.write(chunk)
+        else:
+            self._raise_error()
+            self._queue.put(chunk)
+
+    def close(self):
+        """Write out the buffered text and wait for the background thread."""
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            self._raise_error()
+
+    def _write_chunks(self):
+        """Write the queued chunks until the sentinel is reached."""
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._error is None:
+                try:
+                    self.file.write(chunk)
+                except Exception as e:
+                    self._error = e
+
+    def _raise_error(self):
+        """Raise the error of a failed write in the background thread."""
+        if self._error is not None:
+            raise self._error
+
+
+@contextmanager
+def open_chunked(filename, threaded=False):
+    """Open a text file for writing through a `ChunkedWriter`.
+
+    Parameters
+    ----------
+    filename : str or os.PathLike
+        The path of the file
+    threaded : bool, default=False
+        If True, write the chunks from a background thread
+    """
+    with open(filename, "w") as file:
+        writer = ChunkedWriter(file, threaded=threaded)
+        try:
+            yield writer
+        finally:
+            writer.close()
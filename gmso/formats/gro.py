@@ -2,17 +2,22 @@
 
 import datetime
 import warnings
+from collections import namedtuple
 
 import numpy as np
 import unyt as u
 from unyt.array import allclose_units
 
 import gmso
+from gmso.abc.abstract_site import Molecule, Residue
 from gmso.core.atom import Atom
 from gmso.core.box import Box
 from gmso.core.topology import Topology
+from gmso.formats.chunked_writer import format_columns, open_chunked
 from gmso.formats.formats_registry import loads_as, saves_as
 
+GroFrame = namedtuple("GroFrame", ("title", "positions", "velocities", "box"))
+
 
 @loads_as(".gro")
 def read_gro(filename):
@@ -42,8 +47,9 @@ def read_gro(filename):
     Gro files do not specify connections between atoms, the returned topology
     will not have connections between sites either.
 
-    Currently this implementation does not support parsing velocities from a gro file or gro file
-    with more than 1 frame.
+    Only the first frame of a gro file with several frames is loaded, and
+    velocities are not stored in the topology. Use `iter_gro_frames` to read
+    the positions and velocities of every frame.
 
     All residues and resid information from the gro file are currently lost
     when converting to `topology`.
@@ -52,59 +58,125 @@ def read_gro(filename):
     top = Topology()
 
     with open(filename, "r") as gro_file:
-        top.name = str(gro_file.readline().strip())
-        n_atoms = int(gro_file.readline())
-        coords = u.nm * np.zeros(shape=(n_atoms, 3))
-        for row, _ in enumerate(coords):
-            line = gro_file.readline()
-            if not line:
-                msg = (
-                    "Incorrect number of lines in .gro file. Based on the "
-                    "number in the second line of the file, {} rows of"
-                    "atoms were expected, but at least one fewer was found."
-                )
-                raise ValueError(msg.format(n_atoms))
-            res_id = int(line[:5].strip()) - 1  # reformat from 1 to 0 index in gmso
+        frame, atom_lines = _read_gro_frame(gro_file)
+        if frame is None:
+            raise ValueError(f"No atoms were found in {filename}.")
+        top.name = frame.title
+
+        # The parsed values are valid, so validation can be skipped
+        sites = list()
+        for line, position in zip(atom_lines, frame.positions):
+            res_id = int(line[:5]) - 1  # reformat from 1 to 0 index in gmso
             res_name = line[5:10].strip()
-            atom_name = line[10:15].strip()
-
-            positions = line[20:].split()
-            coords[row] = u.nm * np.array(
-                [
-                    float(positions[0]),
-                    float(positions[1]),
-                    float(positions[2]),
-                ]
+            site = Atom.construct_trusted(
+                name=line[10:15].strip(),
+                position=position,
+                molecule=Molecule.construct_trusted(name=res_name, number=res_id),
+                residue=Residue.construct_trusted(name=res_name, number=res_id),
             )
-            site = Atom(name=atom_name, position=coords[row])
+            sites.append(site)
+        top.add_sites(sites, update_types=False)
 
-            site.molecule = (res_name, res_id)
-            site.residue = (res_name, res_id)
-            top.add_site(site, update_types=False)
-
-        if len(positions) == 6:
-            warnings.warn("Velocity information presents but will not be parsed.")
+        if frame.velocities is not None:
+            warnings.warn(
+                "Velocity information presents but will not be parsed. "
+                "Use iter_gro_frames to read the velocities."
+            )
         top.update_topology()
+        top.box = frame.box
 
-        # Box information
-        line = gro_file.readline().split()
-        top.box = Box(u.nm * np.array([float(val) for val in line[:3]]))
-
-        # Verify we have read the last line by ensuring the next line in blank
+        # Verify we have read the last line, or that another frame follows
         line = gro_file.readline()
         if line:
-            msg = (
-                "Incorrect number of lines in input file. Based on the "
-                "number in the second line of the file, {} rows of atoms "
-                "were expected, but at least one more was found."
+            try:
+                int(gro_file.readline())
+            except ValueError:
+                msg = (
+                    "Incorrect number of lines in input file. Based on the "
+                    "number in the second line of the file, {} rows of atoms "
+                    "were expected, but at least one more was found."
+                )
+                raise ValueError(msg.format(len(atom_lines)))
+            warnings.warn(
+                f"{filename} has more than one frame, only the first frame is "
+                "loaded. Use iter_gro_frames to read the other frames."
             )
-            raise ValueError(msg.format(n_atoms))
 
     return top
 
 
+def iter_gro_frames(filename, velocities=False):
+    """Iterate over the frames of a gro file.
+
+    Each frame is parsed as a block, so that the positions of every frame of a
+    trajectory can be read without building a topology for each of them.
+
+    Parameters
+    ----------
+    filename : str or file object
+        The path to the gro file either as a string, or a file object that
+        points to the gro file.
+    velocities : bool, optional, default=False
+        If True, also parse the velocities of the frames that have them
+
+    Yields
+    ------
+    GroFrame
+        A named tuple with the title of the frame, the positions in nm as a
+        (n_atoms, 3) unyt array, the velocities in nm/ps as a (n_atoms, 3)
+        unyt array (or None if not parsed) and the `Box` of the frame
+    """
+    with open(filename, "r") as gro_file:
+        while True:
+            frame, _ = _read_gro_frame(gro_file)
+            if frame is None:
+                return
+            if not velocities:
+                frame = frame._replace(velocities=None)
+            yield frame
+
+
+def _read_gro_frame(gro_file):
+    """Read the next frame of an open gro file.
+
+    Returns the frame and the lines of its atoms, or (None, None) at the end
+    of the file. The coordinates of all atoms are parsed in a single pass.
+    """
+    title = gro_file.readline()
+    if not title:
+        return None, None
+    n_atoms = int(gro_file.readline())
+    atom_lines = [gro_file.readline() for _ in range(n_atoms)]
+    if n_atoms and not atom_lines[-1]:
+        msg = (
+            "Incorrect number of lines in .gro file. Based on the "
+            "number in the second line of the file, {} rows of"
+            "atoms were expected, but at least one fewer was found."
+        )
+        raise ValueError(msg.format(n_atoms))
+
+    values = np.array(" ".join(line[20:] for line in atom_lines).split(), dtype=float)
+    n_columns = values.size // n_atoms if n_atoms else 3
+    if n_columns not in (3, 6) or values.size != n_atoms * n_columns:
+        raise ValueError(
+            "Incorrect number of columns in .gro file. Every row of atoms "
+            "should have 3 positions, optionally followed by 3 velocities."
+        )
+    values = values.reshape(n_atoms, n_columns)
+    positions = u.unyt_array(np.ascontiguousarray(values[:, :3]), u.nm)
+    velocities = None
+    if n_columns == 6:
+        velocities = u.unyt_array(np.ascontiguousarray(values[:, 3:]), u.nm / u.ps)
+
+    # Box information
+    line = gro_file.readline().split()
+    box = Box(u.nm * np.array([float(val) for val in line[:3]]))
+
+    return GroFrame(title.strip(), positions, velocities, box), atom_lines
+
+
 @saves_as(".gro")
-def write_gro(top, filename, n_decimals=3, shift_coord=False):
+def write_gro(top, filename, n_decimals=3, shift_coord=False, threaded=False):
     """Write a topology to a gro file.
 
     The Gromos87 (gro) format is a common plain text structure file used
@@ -126,6 +198,9 @@ def write_gro(top, filename, n_decimals=3, shift_coord=False):
         If True, shift the coordinates of all sites by the minimum position
         to ensure all sites have non-negative positions. This is not a requirement
         for GRO files, but can be useful for visualizing.
+    threaded : bool, optional, default=False
+        If True, write the file from a background thread while the text is
+        being formatted.
 
     Notes
     -----
@@ -139,7 +214,7 @@ def write_gro(top, filename, n_decimals=3, shift_coord=False):
     if shift_coord:
         pos_array = _validate_positions(pos_array)
 
-    with open(filename, "w") as out_file:
+    with open_chunked(filename, threaded=threaded) as out_file:
         out_file.write(
             "{} written by GMSO {} at {}\n".format(
                 top.name if top.name is not None else "",
@@ -168,83 +243,58 @@ def _validate_positions(pos_array):
 
 
 def _prepare_atoms(top, updated_positions, n_decimals):
-    out_str = str()
     warnings.warn(
         "Residue information is parsed from site.molecule,"
         "or site.residue if site.molecule does not exist."
         "Note that the residue idx will be bumped by 1 since GROMACS utilize 1-index."
     )
     # we need to sort through the sites to provide a unique number for each molecule/residue
-    # we will store the unique id in dictionary where the key is the idx
-    site_res_id = dict()
+    # we will store the unique id in dictionary where the key is the molecule/residue
     seen = dict()
-    for idx, site in enumerate(top.sites):
+    res_ids = list()
+    res_names = list()
+    atom_names = list()
+    for site in top.sites:
         if site.molecule:
-            if site.molecule not in seen:
-                seen[site.molecule] = len(seen) + 1
-            site_res_id[idx] = seen[site.molecule]
+            res_label = site.molecule
+            res_name = site.molecule.name[:5]
         elif site.residue:
-            if site.residue not in seen:
-                seen[site.residue] = len(seen) + 1
-            site_res_id[idx] = seen[site.residue]
+            res_label = site.residue
+            res_name = site.residue.name[:5]
         else:
-            if "MOL" not in seen:
-                seen["MOL"] = len(seen) + 1
-            site_res_id[idx] = seen["MOL"]
-
-    for idx, (site, pos) in enumerate(zip(top.sites, updated_positions)):
-        if site.molecule:
-            res_id = site_res_id[idx]
-            res_name = (
-                site.molecule.name
-                if len(site.molecule.name) <= 5
-                else site.molecule.name[:5]
-            )
-
-            site.label = f"res_id: {res_id}, " + site.label
-        elif site.residue:
-            res_id = site_res_id[idx]
-            res_name = (
-                site.residue.name
-                if len(site.residue.name) <= 5
-                else site.residue.name[:5]
-            )
-            site.label = f"res_id: {res_id}, " + site.label
-        else:
-            res_id = site_res_id[idx]
+            res_label = "MOL"
             res_name = "MOL"
-
-            site.label = f"res_id: {res_id}, " + site.label
-
-        atom_name = site.name if len(site.name) <= 5 else site.name[:5]
-        atom_id = idx + 1
+        if res_label not in seen:
+            seen[res_label] = len(seen) + 1
+        res_id = seen[res_label]
+        site.label = f"res_id: {res_id}, " + site.label
 
         # gromacs doesn't actually use the atom id in the .gro file
         # so we will just loop back to 1 once we exceed 99999
         # as is suggested in the FAQ in the manual.
-
-        max_val = 99999
-        atom_id = atom_id % max_val
-        res_id = res_id % max_val
-
-        varwidth = 5 + n_decimals
-        crdfmt = f"{{:{varwidth}.{n_decimals}f}}"
-
-        # preformat pos str
-        crt_x = crdfmt.format(pos[0].in_units(u.nm).value)[:varwidth]
-        crt_y = crdfmt.format(pos[1].in_units(u.nm).value)[:varwidth]
-        crt_z = crdfmt.format(pos[2].in_units(u.nm).value)[:varwidth]
-        out_str = out_str + "{0:5d}{1:5s}{2:>5s}{3:5d}{4}{5}{6}\n".format(
-            res_id,
-            res_name,
-            atom_name,
-            atom_id,
-            crt_x,
-            crt_y,
-            crt_z,
-        )
-
-    return out_str
+        res_ids.append(res_id % 99999)
+        res_names.append(res_name)
+        atom_names.append(site.name[:5])
+    atom_ids = np.arange(1, top.n_sites + 1) % 99999
+
+    # Coordinates wider than the field are truncated to it, which only
+    # happens beyond 999 nm so the formatting is done per value only then
+    varwidth = 5 + n_decimals
+    positions = np.asarray(updated_positions.in_units(u.nm).value)
+    if np.all(np.abs(positions) < 999):
+        crdfmt = f"%{varwidth}.{n_decimals}f"
+        coords = positions.T
+    else:
+        crdfmt = f"%.{varwidth}s"
+        coords = [
+            [f"{value:{varwidth}.{n_decimals}f}" for value in column]
+            for column in positions.T.tolist()
+        ]
+
+    row_format = "%5d%-5s%5s%5d" + 3 * crdfmt + "\n"
+    return "".join(
+        format_columns([res_ids, res_names, atom_names, atom_ids, *coords], row_format)
+    )
 
 
 def _prepare_box(top):
@@ -174,22 +174,27 @@ def _from_json(json_dict):
     )
     _set_scaling_factors(top, json_dict["scaling_factors"])
     id_to_type_map = {}
+    atoms = list()
     for atom_dict in json_dict["atoms"]:
         atom_type_id = atom_dict.pop("atom_type", None)
         atom = Atom.model_validate(atom_dict)
-        top.add_site(atom)
+        atoms.append(atom)
         if atom_type_id:
             if not id_to_type_map.get(atom_type_id):
                 id_to_type_map[atom_type_id] = []
             id_to_type_map[atom_type_id].append(atom)
+    top.add_sites(atoms)
+
+    # The connections were written from a topology, so they are unique
+    connections = list()
 
     for bond_dict in json_dict["bonds"]:
         bond_type_id = bond_dict.pop("bond_type", None)
         bond_dict["connection_members"] = [
-            top._sites[member_idx] for member_idx in bond_dict["connection_members"]
+            atoms[member_idx] for member_idx in bond_dict["connection_members"]
         ]
         bond = Bond.model_validate(bond_dict)
-        top.add_connection(bond)
+        connections.append(bond)
         if bond_type_id:
             if not id_to_type_map.get(bond_type_id):
                 id_to_type_map[bond_type_id] = []
@@ -198,10 +203,10 @@ def _from_json(json_dict):
     for angle_dict in json_dict["angles"]:
         angle_type_id = angle_dict.pop("angle_type", None)
         angle_dict["connection_members"] = [
-            top._sites[member_idx] for member_idx in angle_dict["connection_members"]
+            atoms[member_idx] for member_idx in angle_dict["connection_members"]
         ]
         angle = Angle.model_validate(angle_dict)
-        top.add_connection(angle)
+        connections.append(angle)
         if angle_type_id:
             if not id_to_type_map.get(angle_type_id):
                 id_to_type_map[angle_type_id] = []
@@ -210,10 +215,10 @@ def _from_json(json_dict):
     for dihedral_dict in json_dict["dihedrals"]:
         dihedral_type_id = dihedral_dict.pop("dihedral_type", None)
         dihedral_dict["connection_members"] = [
-            top._sites[member_idx] for member_idx in dihedral_dict["connection_members"]
+            atoms[member_idx] for member_idx in dihedral_dict["connection_members"]
         ]
         dihedral = Dihedral.model_validate(dihedral_dict)
-        top.add_connection(dihedral)
+        connections.append(dihedral)
         if dihedral_type_id:
             if not id_to_type_map.get(dihedral_type_id):
                 id_to_type_map[dihedral_type_id] = []
@@ -222,7 +227,7 @@ def _from_json(json_dict):
     for improper_dict in json_dict["impropers"]:
         improper_type_id = improper_dict.pop("improper_type", None)
         improper_dict["connection_members"] = [
-            top._sites[member_idx] for member_idx in improper_dict["connection_members"]
+            atoms[member_idx] for member_idx in improper_dict["connection_members"]
         ]
         improper = Improper.model_validate(improper_dict)
         if improper_type_id:
@@ -230,6 +235,8 @@ def _from_json(json_dict):
                 id_to_type_map[improper_type_id] = []
             id_to_type_map[improper_type_id].append(improper)
 
+    top.add_connections(connections, validate=False)
+
     for atom_type_dict in json_dict["atom_types"]:
         atom_type_id = atom_type_dict.pop("id", None)
         atom_type = AtomType.model_validate(atom_type_dict)
@@ -6,7 +6,7 @@ import copy
 import datetime
 import os
 import warnings
-from itertools import count
+from itertools import islice
 from pathlib import Path
 
 import numpy as np
@@ -25,15 +25,13 @@ from gmso.core.element import element_by_mass
 from gmso.core.improper import Improper
 from gmso.core.topology import Topology
 from gmso.core.views import PotentialFilters
+from gmso.formats.chunked_writer import open_chunked
 from gmso.formats.formats_registry import loads_as, saves_as
 from gmso.lib.potential_templates import PotentialTemplateLibrary
 from gmso.utils.compatibility import check_compatibility
+from gmso.utils.connectivity import _connection_member_indices
 from gmso.utils.conversions import convert_kelvin_to_energy_units
-from gmso.utils.sorting import (
-    reindex_molecules,
-    sort_by_types,
-    sort_connection_members,
-)
+from gmso.utils.sorting import reindex_molecules, sort_by_types
 from gmso.utils.units import LAMMPS_UnitSystems, write_out_parameter_and_units
 
 pfilter = PotentialFilters.UNIQUE_SORTED_NAMES
@@ -50,6 +48,7 @@ def write_lammpsdata(
     strict_potentials=False,
     strict_units=False,
     lj_cfactorsDict=None,
+    threaded=False,
 ):
     """Output a LAMMPS data file.
 
@@ -85,6 +84,9 @@ def write_lammpsdata(
         dimensionalize all values in the topology. If any key is not passed, default values
         will be pulled from the topology (see _default_lj_val). These are the largest: sigma,
         epsilon, atomtype.mass, and atomtype.charge from the topology.
+    threaded : bool, optional, default False
+        If True, write the file from a background thread while the text is being
+        formatted.
 
     Notes
     -----
@@ -181,7 +183,7 @@ def write_lammpsdata(
         msg = "Provided path to file that does not exist"
         raise FileNotFoundError(msg)
 
-    with open(path, "w") as out_file:
+    with open_chunked(path, threaded=threaded) as out_file:
         _write_header(out_file, top, atom_style, dihedral_parser)
         _write_box(out_file, top, base_unyts, lj_cfactorsDict)
         all_ordered_typesDict = {}
@@ -293,19 +295,25 @@ def read_lammpsdata(
         )
     base_unyts = LAMMPS_UnitSystems(unit_style)
 
-    # Parse box information
-    _get_box_coordinates(filename, base_unyts, top)
-    # Parse atom type information
-    top, type_list = _get_ff_information(filename, base_unyts, top)
-    # Parse atom information
-    _get_atoms(filename, top, base_unyts, type_list)
-    # Parse connection (bonds, angles, dihedrals, impropers) information
-    # TODO: Add more atom styles
-    if atom_style in ["full"]:
-        _get_connection(filename, top, base_unyts, connection_type="bond")
-        _get_connection(filename, top, base_unyts, connection_type="angle")
-        _get_connection(filename, top, base_unyts, connection_type="dihedral")
-        _get_connection(filename, top, base_unyts, connection_type="improper")
+    # Index the file in a single pass, then read each section from its offset
+    with open(filename, "rb") as lammps_file:
+        header, offsets = _index_sections(lammps_file)
+        counts = _get_counts(header)
+        # Parse box information
+        _get_box_coordinates(header, base_unyts, top)
+        # Parse atom type information
+        top, type_list = _get_ff_information(
+            lammps_file, offsets, counts, base_unyts, top
+        )
+        # Parse atom information
+        _get_atoms(lammps_file, offsets, counts, top, base_unyts, type_list)
+        # Parse connection (bonds, angles, dihedrals, impropers) information
+        # TODO: Add more atom styles
+        if atom_style in ["full"]:
+            for connection_type in ["bond", "angle", "dihedral", "improper"]:
+                _get_connection(
+                    lammps_file, offsets, counts, top, base_unyts, connection_type
+                )
 
     top.update_topology()
 
@@ -326,23 +334,56 @@ def get_units(base_unyts, dimension):
     return u.Unit(base_unyts.usystem[dimension], registry=base_unyts.reg)
 
 
-def _get_connection(filename, topology, base_unyts, connection_type):
+def _index_sections(lammps_file):
+    """Split a LAMMPS data file opened in binary mode into its header and sections.
+
+    Returns the split lines of the header without their comments, and a dict
+    mapping the first word of each section title (e.g. "Atoms" or "Bond" for
+    "Bond Coeffs") to the byte offset of the line that follows the title.
+    """
+    header = list()
+    offsets = dict()
+    # The first line is a free-form title
+    offset = len(lammps_file.readline())
+    for line in lammps_file:
+        offset += len(line)
+        words = line.split(maxsplit=1)
+        if words and words[0][:1].isalpha():
+            offsets.setdefault(words[0].decode(), offset)
+        elif not offsets:
+            header.append(line.split(b"#", 1)[0].decode().split())
+    return header, offsets
+
+
+def _get_counts(header):
+    """Return the number of atoms, atom types, bonds, etc. given in the header."""
+    counts = dict()
+    for words in header:
+        if len(words) > 1 and words[0].isdigit():
+            counts[" ".join(words[1:])] = int(words[0])
+    return counts
+
+
+def _read_section(lammps_file, offsets, section, n_lines):
+    """Yield the decoded lines of a section, skipping the line after its title."""
+    lammps_file.seek(offsets[section])
+    lammps_file.readline()
+    for line in islice(lammps_file, n_lines):
+        yield line.decode()
+
+
+def _get_connection(
+    lammps_file, offsets, counts, topology, base_unyts, connection_type
+):
     """Parse connection types."""
     # TODO: check for other connection types besides the defaults
-    with open(filename, "r") as lammps_file:
-        types = False
-        for i, line in enumerate(lammps_file):
-            if connection_type in line.split():
-                n_connection_types = int(line.split()[0])
-                types = True
-            if connection_type.capitalize() in line.split():
-                break
-    if types is False:
+    n_connection_types = counts.get(f"{connection_type} types")
+    if n_connection_types is None:
         return topology
     templates = PotentialTemplateLibrary()
-    connection_type_lines = open(filename, "r").readlines()[
-        i + 2 : i + n_connection_types + 2
-    ]
+    connection_type_lines = _read_section(
+        lammps_file, offsets, connection_type.capitalize(), n_connection_types
+    )
     connection_type_list = list()
     for line in connection_type_lines:
         if connection_type == "bond":
@@ -421,13 +462,9 @@ def _get_connection(filename, topology, base_unyts, connection_type):
 
         connection_type_list.append(c_type)
 
-    with open(filename, "r") as lammps_file:
-        for i, line in enumerate(lammps_file):
-            if connection_type + "s" in line.split():
-                n_connections = int(line.split()[0])
-            if connection_type.capitalize() + "s" in line.split():
-                break
-    connection_lines = open(filename, "r").readlines()[i + 2 : i + n_connections + 2]
+    n_connections = counts.get(f"{connection_type}s", 0)
+    if not n_connections:
+        return topology
     # Determine number of sites to generate
     if connection_type == "bond":
         n_sites = 2
@@ -435,136 +472,150 @@ def _get_connection(filename, topology, base_unyts, connection_type):
         n_sites = 3
     else:
         n_sites = 4
-    for i, line in enumerate(connection_lines):
-        site_list = list()
-        for j in range(n_sites):
-            site = topology.sites[int(line.split()[j + 2]) - 1]
-            site_list.append(site)
-        ctype = copy.copy(connection_type_list[int(line.split()[1]) - 1])
-        ctype.member_types = tuple(map(lambda x: x.atom_type.name, site_list))
-        ctype.member_classes = ctype.member_types
-        if connection_type == "bond":
-            connection = Bond(
-                connection_members=site_list,
-                bond_type=ctype,
-            )
-        elif connection_type == "angle":
-            connection = Angle(
-                connection_members=site_list,
-                angle_type=ctype,
-            )
-        elif connection_type == "dihedral":
-            connection = Dihedral(
-                connection_members=site_list,
-                dihedral_type=ctype,
-            )
-        elif connection_type == "improper":
-            connection = Improper(
-                connection_members=site_list,
-                improper_type=ctype,
+    connection_data = np.loadtxt(
+        _read_section(
+            lammps_file, offsets, connection_type.capitalize() + "s", n_connections
+        ),
+        dtype=np.int64,
+        usecols=range(1, n_sites + 2),
+        comments="#",
+        ndmin=2,
+    )
+    connection_class = {
+        "bond": Bond,
+        "angle": Angle,
+        "dihedral": Dihedral,
+        "improper": Improper,
+    }[connection_type]
+    type_field = connection_type + "_type"
+
+    # Connections of the same type between the same atom types share a copy
+    # of the connection type
+    sites = list(topology.sites)
+    site_type_names = [site.atom_type.name for site in sites]
+    connection_data[:, 1:] -= 1  # 0-index
+    ctypes = dict()
+    connections = list()
+    for type_index, *member_indices in connection_data.tolist():
+        site_list = tuple(sites[index] for index in member_indices)
+        member_types = tuple(site_type_names[index] for index in member_indices)
+        ctype = ctypes.get((type_index, member_types))
+        if ctype is None:
+            ctype = copy.copy(connection_type_list[type_index - 1])
+            ctype.member_types = member_types
+            ctype.member_classes = ctype.member_types
+            ctypes[(type_index, member_types)] = ctype
+        # The members and types are parsed from the file, so validation can be skipped
+        connections.append(
+            connection_class.construct_trusted(
+                connection_members=site_list, **{type_field: ctype}
             )
-        topology.add_connection(connection)
+        )
+    topology.add_connections(connections)
 
     return topology
 
 
-def _get_atoms(filename, topology, base_unyts, type_list):
+def _get_atoms(lammps_file, offsets, counts, topology, base_unyts, type_list):
     """Parse the atom information in the LAMMPS data file."""
-    with open(filename, "r") as lammps_file:
-        for i, line in enumerate(lammps_file):
-            if "atoms" in line.split():
-                n_atoms = int(line.split()[0])
-            if "Atoms" in line.split():
-                break
-    atom_lines = open(filename, "r").readlines()[i + 2 : i + n_atoms + 2]
-    for line in atom_lines:
-        atom_line = line.split()
-        atom_type = atom_line[2]
-        charge = u.unyt_quantity(float(atom_line[3]), get_units(base_unyts, "charge"))
-        coord = u.unyt_array(
-            [float(atom_line[4]), float(atom_line[5]), float(atom_line[6])]
-        ) * get_units(base_unyts, "length")
-        site = Atom(
+    n_atoms = counts.get("atoms", 0)
+    if not n_atoms:
+        return topology
+    atom_data = np.loadtxt(
+        _read_section(lammps_file, offsets, "Atoms", n_atoms),
+        usecols=range(1, 7),
+        comments="#",
+        ndmin=2,
+    )
+    positions = u.unyt_array(atom_data[:, 3:6], get_units(base_unyts, "length"))
+    if positions.units != u.dimensionless:
+        positions.convert_to_units(u.nm)
+    charges = u.unyt_array(atom_data[:, 2], get_units(base_unyts, "charge"))
+
+    # Sites share their atom type, whose element is looked up once
+    elements = [element_by_mass(atom_type.mass.value) for atom_type in type_list]
+    sites = list()
+    for molecule_id, type_id, charge, position in zip(
+        atom_data[:, 0].astype(np.int64).tolist(),
+        atom_data[:, 1].astype(np.int64).tolist(),
+        charges,
+        positions,
+    ):
+        atom_type = type_list[type_id - 1]  # 0-index
+        element = elements[type_id - 1]
+        # The values are parsed with their units, so validation can be skipped
+        site = Atom.construct_trusted(
+            name=element.name if element else atom_type.name,
             charge=charge,
-            position=coord,
-            atom_type=copy.deepcopy(type_list[int(atom_type) - 1]),  # 0-index
-            molecule=Molecule(
-                name=atom_line[1], number=int(atom_line[1]) - 1
+            position=position,
+            atom_type=atom_type,
+            element=element,
+            molecule=Molecule.construct_trusted(
+                name=str(molecule_id), number=molecule_id - 1
             ),  # 0-index
         )
-        element = element_by_mass(site.atom_type.mass.value)
-        site.name = element.name if element else site.atom_type.name
-        site.element = element
-        topology.add_site(site)
+        sites.append(site)
+    topology.add_sites(sites)
 
     return topology
 
 
-def _get_box_coordinates(filename, base_unyts, topology):
+def _get_box_coordinates(header, base_unyts, topology):
     """Parse box information."""
-    with open(filename, "r") as lammps_file:
-        for line in lammps_file:
-            if "xlo" in line.split():
-                break
-        x_line = line.split()
-        y_line = lammps_file.readline().split()
-        z_line = lammps_file.readline().split()
-
-        x = float(x_line[1]) - float(x_line[0])
-        y = float(y_line[1]) - float(y_line[0])
-        z = float(z_line[1]) - float(z_line[0])
-
-        # Check if box is triclinic
-        tilts = lammps_file.readline().split()
-        if "xy" in tilts:
-            xy = float(tilts[0])
-            xz = float(tilts[1])
-            yz = float(tilts[2])
-
-            xhi = float(x_line[1]) - np.max([0.0, xy, xz, xy + xz])
-            xlo = float(x_line[0]) - np.min([0.0, xy, xz, xy + xz])
-            yhi = float(y_line[1]) - np.max([0.0, yz])
-            ylo = float(y_line[0]) - np.min([0.0, yz])
-            zhi = float(z_line[1])
-            zlo = float(z_line[0])
-
-            lx = xhi - xlo
-            ly = yhi - ylo
-            lz = zhi - zlo
-
-            c = np.sqrt(lz**2 + xz**2 + yz**2)
-            b = np.sqrt(ly**2 + xy**2)
-            a = lx
-
-            alpha = np.arccos((yz * ly + xy * xz) / (b * c))
-            beta = np.arccos(xz / c)
-            gamma = np.arccos(xy / b)
-
-            # Box Information
-            lengths = u.unyt_array([a, b, c], get_units(base_unyts, "length"))
-            angles = u.unyt_array([alpha, beta, gamma], get_units(base_unyts, "angle"))
-            topology.box = Box(lengths, angles)
-        else:
-            # Box Information
-            lengths = u.unyt_array([x, y, z], get_units(base_unyts, "length"))
-            topology.box = Box(lengths)
+    for i, x_line in enumerate(header):
+        if "xlo" in x_line:
+            break
+    y_line = header[i + 1]
+    z_line = header[i + 2]
+
+    x = float(x_line[1]) - float(x_line[0])
+    y = float(y_line[1]) - float(y_line[0])
+    z = float(z_line[1]) - float(z_line[0])
+
+    # Check if box is triclinic
+    tilts = header[i + 3] if i + 3 < len(header) else []
+    if "xy" in tilts:
+        xy = float(tilts[0])
+        xz = float(tilts[1])
+        yz = float(tilts[2])
+
+        xhi = float(x_line[1]) - np.max([0.0, xy, xz, xy + xz])
+        xlo = float(x_line[0]) - np.min([0.0, xy, xz, xy + xz])
+        yhi = float(y_line[1]) - np.max([0.0, yz])
+        ylo = float(y_line[0]) - np.min([0.0, yz])
+        zhi = float(z_line[1])
+        zlo = float(z_line[0])
+
+        lx = xhi - xlo
+        ly = yhi - ylo
+        lz = zhi - zlo
+
+        c = np.sqrt(lz**2 + xz**2 + yz**2)
+        b = np.sqrt(ly**2 + xy**2)
+        a = lx
+
+        alpha = np.arccos((yz * ly + xy * xz) / (b * c))
+        beta = np.arccos(xz / c)
+        gamma = np.arccos(xy / b)
+
+        # Box Information
+        lengths = u.unyt_array([a, b, c], get_units(base_unyts, "length"))
+        angles = u.unyt_array([alpha, beta, gamma], get_units(base_unyts, "angle"))
+        topology.box = Box(lengths, angles)
+    else:
+        # Box Information
+        lengths = u.unyt_array([x, y, z], get_units(base_unyts, "length"))
+        topology.box = Box(lengths)
 
-        return topology
+    return topology
 
 
-def _get_ff_information(filename, base_unyts, topology):
+def _get_ff_information(lammps_file, offsets, counts, base_unyts, topology):
     """Parse atom-type information."""
-    with open(filename, "r") as lammps_file:
-        types = False
-        for i, line in enumerate(lammps_file):
-            if "atom" in line:
-                n_atomtypes = int(line.split()[0])
-                types = True
-            elif "Masses" in line:
-                break
-    if types is False:
-        return topology
-    mass_lines = open(filename, "r").readlines()[i + 2 : i + n_atomtypes + 2]
+    n_atomtypes = counts.get("atom types")
+    if n_atomtypes is None or "Masses" not in offsets:
+        return topology, list()
+    mass_lines = _read_section(lammps_file, offsets, "Masses", n_atomtypes)
     type_list = list()
     for line in mass_lines:
         atom_type = AtomType(
@@ -573,14 +624,12 @@ def _get_ff_information(filename, base_unyts, topology):
         )
         type_list.append(atom_type)
 
-    with open(filename, "r") as lammps_file:
-        for i, line in enumerate(lammps_file):
-            if "Pair" in line:
-                break
     # Need to figure out if we're going have mixing rules printed out
     # Currently only reading in LJ params
     warn_ljcutBool = False
-    pair_lines = open(filename, "r").readlines()[i + 2 : i + n_atomtypes + 2]
+    pair_lines = list()
+    if "Pair" in offsets:
+        pair_lines = _read_section(lammps_file, offsets, "Pair", n_atomtypes)
     for i, pair in enumerate(pair_lines):
         if len(pair.split()) == 3:
             type_list[i].parameters["sigma"] = float(pair.split()[2]) * get_units(
@@ -1098,44 +1147,59 @@ def parse_harmonic_style_improper(improper_type):
 def _write_site_data(out_file, top, atom_style, base_unyts, cfactorsDict):
     """Write atomic positions and charges to LAMMPS file.."""
     out_file.write(f"\nAtoms #{atom_style}\n\n")
+    # Floats are written as convert_parameter formats them, cut to 8 characters
     if atom_style == "atomic":
-        atom_line = "{index:d}\t{type_index:d}\t{x:.8}\t{y:.8}\t{z:.8}\n"
+        atom_columns = ("index", "type_index", "x", "y", "z")
     elif atom_style == "charge":
-        atom_line = "{index:d}\t{type_index:d}\t{charge:.8}\t{x:.8}\t{y:.8}\t{z:.8}\n"
+        atom_columns = ("index", "type_index", "charge", "x", "y", "z")
     elif atom_style == "molecular":
-        atom_line = (
-            "{index:d}\t{moleculeid:d}\t{type_index:d}\t{x:.8}\t{y:.8}\t{z:.8}\n"
-        )
+        atom_columns = ("index", "moleculeid", "type_index", "x", "y", "z")
     elif atom_style == "full":
-        atom_line = "{index:d}\t{moleculeid:d}\t{type_index:d}\t{charge:.8}\t{x:.8}\t{y:.8}\t{z:.8}\n"
+        atom_columns = ("index", "moleculeid", "type_index", "charge", "x", "y", "z")
+    atom_line = (
+        "\t".join(
+            "%.8s" if name in ("charge", "x", "y", "z") else "%d"
+            for name in atom_columns
+        )
+        + "\n"
+    )
 
     unique_sorted_typesList = sorted(
         top.atom_types(filter_by=pfilter), key=lambda x: x.name
     )
-    for i, site in enumerate(top.sites):
-        out_file.write(
-            atom_line.format(
-                index=i + 1,
-                moleculeid=site.molecule.number + 1,  # index is 0-based in GMSO
-                type_index=unique_sorted_typesList.index(site.atom_type) + 1,
-                charge=base_unyts.convert_parameter(
-                    site.charge,
-                    cfactorsDict,
-                    n_decimals=6,
-                ),
-                x=base_unyts.convert_parameter(
-                    site.position[0],
-                    cfactorsDict,
-                    n_decimals=6,
-                ),
-                y=base_unyts.convert_parameter(
-                    site.position[1], cfactorsDict, n_decimals=6
-                ),
-                z=base_unyts.convert_parameter(
-                    site.position[2], cfactorsDict, n_decimals=6
-                ),
-            )
+    # The types are unique by name, so match the sites on the same key
+    type_indices = {
+        sort_by_types(atom_type): ind + 1
+        for ind, atom_type in enumerate(unique_sorted_typesList)
+    }
+
+    # Convert every column at once
+    columns = {
+        "index": range(1, top.n_sites + 1),
+        "type_index": [
+            type_indices[sort_by_types(site.atom_type)] for site in top.sites
+        ],
+    }
+    if "moleculeid" in atom_columns:
+        # index is 0-based in GMSO
+        columns["moleculeid"] = [site.molecule.number + 1 for site in top.sites]
+    if "charge" in atom_columns:
+        charges = base_unyts.convert_values(
+            top.charges.value, top.charges.units, cfactorsDict
         )
+        columns["charge"] = _format_values(charges)
+    positions = base_unyts.convert_values(
+        top.positions.value, top.positions.units, cfactorsDict
+    )
+    for axis, name in enumerate("xyz"):
+        columns[name] = _format_values(positions[:, axis])
+
+    out_file.write_columns([columns[name] for name in atom_columns], atom_line)
+
+
+def _format_values(values, n_decimals=6):
+    """Format an array of floats as `LAMMPS_UnitSystems.convert_parameter` does."""
+    return [f"{value:.{n_decimals}f}" for value in np.asarray(values).tolist()]
 
 
 def _angle_order_sorter(angle_typesList):
@@ -1162,25 +1226,49 @@ def _write_conn_data(out_file, top, connStr, sorted_typesList):
     """Write all connections to LAMMPS datafile."""
     out_file.write(f"\n{connStr.capitalize()}\n\n")
 
-    i = 0
-    for conn in getattr(top, connStr):
-        ctype_members = sort_by_types(getattr(conn, connStr[:-1] + "_type"))
-        indexList = [
-            ind
-            for ind, ele in zip(count(), sorted_typesList)
-            if sort_by_types(ele) == ctype_members
-        ]
-        for index in indexList:
-            typeStr = f"{i+1:<6d}\t{index+1:<6d}\t"
-            sorted_membersList = sort_connection_members(conn, sort_by="index", top=top)
-            indexStr = "\t".join(
-                [
-                    str(top.get_index(member) + 1).ljust(6)
-                    for member in sorted_membersList
-                ]
+    connections = getattr(top, connStr)
+    if not connections:
+        return
+    type_indices = dict()
+    for ind, ele in enumerate(sorted_typesList):
+        type_indices.setdefault(sort_by_types(ele), []).append(ind + 1)
+
+    # A connection is written once for each of the types that match its own
+    conn_rows = []
+    conn_types = []
+    conn_type_indices = dict()
+    for row, conn in enumerate(connections):
+        conn_type = getattr(conn, connStr[:-1] + "_type")
+        if conn_type not in conn_type_indices:
+            conn_type_indices[conn_type] = type_indices.get(
+                sort_by_types(conn_type), []
             )
-            out_file.write(typeStr + indexStr + "\n")
-            i += 1
+        for index in conn_type_indices[conn_type]:
+            conn_rows.append(row)
+            conn_types.append(index)
+
+    n_members = len(connections[0].connection_members)
+    members = _connection_member_indices(top, connections, members=range(n_members))
+    members = _sort_members_by_index(members, connStr)[conn_rows] + 1
+    data = np.column_stack(
+        (np.arange(1, len(conn_rows) + 1), conn_types, members)
+    ).astype(np.int64)
+    out_file.write_columns(data.T, "\t".join(["%-6d"] * data.shape[1]) + "\n")
+
+
+def _sort_members_by_index(members, connStr):
+    """Order connection member indices as `sort_connection_members` by index does."""
+    members = members.copy()
+    if connStr == "bonds":
+        members.sort(axis=1)
+    elif connStr == "angles":
+        members[:, [0, 2]] = np.sort(members[:, [0, 2]], axis=1)
+    elif connStr == "dihedrals":
+        flip = members[:, 1] > members[:, 2]
+        members[flip] = members[flip, ::-1]
+    elif connStr == "impropers":
+        members[:, 1:] = np.sort(members[:, 1:], axis=1)
+    return members
 
 
 def _try_default_potential_conversions(top, potentialsDict):
@@ -12,9 +12,11 @@ from gmso import __version__
 from gmso.core.topology import Topology
 from gmso.core.views import PotentialFilters
 from gmso.exceptions import GMSOError
+from gmso.formats.chunked_writer import open_chunked
 from gmso.formats.formats_registry import saves_as
 from gmso.lib.potential_templates import PotentialTemplateLibrary
 from gmso.utils.compatibility import check_compatibility
+from gmso.utils.connectivity import _connection_member_indices
 from gmso.utils.conversions import (
     convert_opls_to_ryckaert,
     convert_ryckaert_to_fourier,
@@ -26,7 +28,7 @@ potential_templates = PotentialTemplateLibrary()
 
 
 @saves_as(".mcf")
-def write_mcf(top, filename):
+def write_mcf(top, filename, threaded=False):
     """Generate a Cassandra MCF from a gmso.core.Topology object.
 
     The MCF file stores the topology information for a single
@@ -49,6 +51,9 @@ def write_mcf(top, filename):
         each element in the list. The number of element in the list
         should match the
         number of unique subtopologies.
+    threaded : bool, optional, default=False
+        If True, write the files from a background thread while the text is
+        being formatted.
 
     Notes
     -----
@@ -79,7 +84,7 @@ def write_mcf(top, filename):
                 filename = filename[idx]
 
         # Now we write the MCF file
-        with open(filename, "w") as mcf:
+        with open_chunked(filename, threaded=threaded) as mcf:
             header = (
                 "!***************************************"
                 "****************************************\n"
@@ -277,9 +282,8 @@ def _write_atom_information(mcf, top, in_ring):
         )
 
     # Check charge neutrality
-    net_q = 0.0
-    for idx, site in enumerate(range(top.n_sites)):
-        net_q += top.sites[idx].charge.in_units(u.elementary_charge).value
+    charges = top.charges.in_units(u.elementary_charge).value
+    net_q = charges.sum()
 
     if not np.isclose(net_q, 0.0):
         raise ValueError(
@@ -311,39 +315,42 @@ def _write_atom_information(mcf, top, in_ring):
         "\n# Atom_Info\n"
     )
 
+    # Convert the parameters once for each atom type
+    type_values = dict()
+    for site in sites:
+        atom_type = site.atom_type
+        if atom_type not in type_values:
+            values = [
+                atom_type.mass.in_units(u.amu).value,
+                (atom_type.parameters["epsilon"] / u.kb).in_units("K").value,
+                atom_type.parameters["sigma"].in_units("Angstrom").value,
+            ]
+            if vdw_style == "Mie":
+                values.append(atom_type.parameters["n"].value)
+                values.append(atom_type.parameters["m"].value)
+            type_values[atom_type] = values
+    masses, *vdw_parameters = zip(*(type_values[site.atom_type] for site in sites))
+
+    atom_format = "%-4d  %-6s  %-2s  %8.4f  %12.8f  %-3s  %10.5f  %10.5f"
+    if vdw_style == "Mie":
+        atom_format += "  %8.3f  %8.3f"
+    rings = ["  ring" if in_ring[idx] is True else "" for idx in range(top.n_sites)]
+
     mcf.write(header)
     mcf.write("{:d}\n".format(len(top.sites)))
-    for idx, site in enumerate(top.sites):
-        mcf.write(
-            "{:<4d}  " "{:<6s}  " "{:<2s}  " "{:8.4f}  " "{:12.8f}  ".format(
-                idx + 1,
-                atypes_list[idx],
-                names[idx],
-                site.atom_type.mass.in_units(u.amu).value,
-                site.charge.in_units(u.elementary_charge).value,
-            )
-        )
-        if vdw_style == "LJ":
-            mcf.write(
-                "{:3s}  " "{:10.5f}  " "{:10.5f}".format(
-                    vdw_style,
-                    (site.atom_type.parameters["epsilon"] / u.kb).in_units("K").value,
-                    site.atom_type.parameters["sigma"].in_units("Angstrom").value,
-                )
-            )
-        elif vdw_style == "Mie":
-            mcf.write(
-                "{:3s}  " "{:10.5f}  " "{:10.5f}  " "{:8.3f}  " "{:8.3f}".format(
-                    vdw_style,
-                    (site.atom_type.parameters["epsilon"] / u.kb).in_units("K").value,
-                    site.atom_type.parameters["sigma"].in_units("Angstrom").value,
-                    site.atom_type.parameters["n"].value,
-                    site.atom_type.parameters["m"].value,
-                )
-            )
-        if in_ring[idx] is True:
-            mcf.write("  ring")
-        mcf.write("\n")
+    mcf.write_columns(
+        [
+            range(1, top.n_sites + 1),
+            atypes_list,
+            names,
+            masses,
+            charges,
+            [vdw_style] * top.n_sites,
+            *vdw_parameters,
+            rings,
+        ],
+        atom_format + "%s\n",
+    )
 
 
 def _write_bond_information(mcf, top):
@@ -361,16 +368,22 @@ def _write_bond_information(mcf, top):
     mcf.write("!index i j type parameters\n" + '!type="fixed", parms=bondLength\n')
     mcf.write("\n# Bond_Info\n")
     mcf.write("{:d}\n".format(len(top.bonds)))
-    for idx, bond in enumerate(top.bonds):
-        mcf.write(
-            "{:<4d}  " "{:<4d}  " "{:<4d}  " "{:s}  " "{:10.5f}\n".format(
-                idx + 1,
-                top.get_index(bond.connection_members[0]) + 1,
-                top.get_index(bond.connection_members[1]) + 1,
-                "fixed",
-                bond.connection_type.parameters["r_eq"].in_units(u.Angstrom).value,
-            )
-        )
+    if not top.bonds:
+        return
+    members = _connection_member_indices(top, top.bonds) + 1
+    bond_lengths = [
+        bond.connection_type.parameters["r_eq"].in_units(u.Angstrom).value
+        for bond in top.bonds
+    ]
+    mcf.write_columns(
+        [
+            range(1, top.n_bonds + 1),
+            *members.T,
+            ["fixed"] * top.n_bonds,
+            bond_lengths,
+        ],
+        "%-4d  %-4d  %-4d  %s  %10.5f\n",
+    )
 
 
 def _write_angle_information(mcf, top):
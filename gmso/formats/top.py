@@ -11,6 +11,7 @@ from gmso.core.element import element_by_atom_type
 from gmso.core.improper import Improper
 from gmso.core.views import PotentialFilters
 from gmso.exceptions import GMSOError
+from gmso.formats.chunked_writer import open_chunked
 from gmso.formats.formats_registry import saves_as
 from gmso.lib.potential_templates import PotentialTemplateLibrary
 from gmso.parameterization.molecule_utils import (
@@ -24,7 +25,7 @@ from gmso.utils.connectivity import generate_pairs_lists
 
 
 @saves_as(".top")
-def write_top(top, filename, top_vars=None):
+def write_top(top, filename, top_vars=None, threaded=False):
     """Write a gmso.core.Topology object to a GROMACS topology (.TOP) file.
 
     Parameters
@@ -33,6 +34,9 @@ def write_top(top, filename, top_vars=None):
         A typed Topology Object
     filename : str
         Path of the output file
+    threaded : bool, optional, default=False
+        If True, write the file from a background thread while the text is
+        being formatted.
 
     Notes
     -----
@@ -50,7 +54,7 @@ def write_top(top, filename, top_vars=None):
     for connection in top.connections:
         assert connection.connection_type, msg
 
-    with open(filename, "w") as out_file:
+    with open_chunked(filename, threaded=threaded) as out_file:
         out_file.write(
             "; File {} written by GMSO at {}\n\n".format(
                 top.name if top.name is not None else "",
@@ -130,6 +134,7 @@ def write_top(top, filename, top_vars=None):
             "#ifdef DIHRES\n"
             "; ai\taj\tak\tal\tfunct\ttheta_eq\tdelta_theta\t\tkd\n",
         }
+        shifted_idx_map = _get_shifted_idx_map(top, unique_molecules)
         for tag in unique_molecules:
             """Write out nrexcl for each unique molecule."""
             out_file.write("\n[ moleculetype ]\n" "; name\tnrexcl\n")
@@ -141,12 +146,7 @@ def write_top(top, filename, top_vars=None):
             out_file.write(
                 "[ atoms ]\n" "; nr\ttype\tresnr\tresidue\t\tatom\tcgnr\tcharge\tmass\n"
             )
-            # Each unique molecule need to be reindexed (restarting from 0)
-            # The shifted_idx_map is needed to make sure all the atom index used in
-            # latter connection sections are acurate
-            shifted_idx_map = dict()
             for idx, site in enumerate(unique_molecules[tag]["sites"]):
-                shifted_idx_map[top.get_index(site)] = idx
                 out_file.write(
                     "{0:8s}"
                     "{1:12s}"
@@ -254,25 +254,27 @@ def write_top(top, filename, top_vars=None):
                             for conn in proper_groups[
                                 "RyckaertBellemansTorsionPotential"
                             ]:
-                                for line in _write_connection(
-                                    top,
-                                    conn,
-                                    pot_types[conn.connection_type],
-                                    shifted_idx_map,
-                                ):
-                                    out_file.write(line)
+                                out_file.write(
+                                    _write_connection(
+                                        top,
+                                        conn,
+                                        pot_types[conn.connection_type],
+                                        shifted_idx_map,
+                                    )
+                                )
                         if proper_groups["PeriodicTorsionPotential"]:
                             out_file.write(
                                 headers["dihedrals"]["PeriodicTorsionPotential"]
                             )
                             for conn in proper_groups["PeriodicTorsionPotential"]:
-                                for line in _write_connection(
-                                    top,
-                                    conn,
-                                    pot_types[conn.connection_type],
-                                    shifted_idx_map,
-                                ):
-                                    out_file.write(line)
+                                out_file.write(
+                                    _write_connection(
+                                        top,
+                                        conn,
+                                        pot_types[conn.connection_type],
+                                        shifted_idx_map,
+                                    )
+                                )
                     elif "restraints" in conn_group:
                         out_file.write(headers[conn_group])
                         for conn in unique_molecules[tag][conn_group]:
@@ -367,58 +369,65 @@ def _get_unique_molecules(top):
         unique_molecules[top.name] = dict()
         unique_molecules[top.name]["subtags"] = [top.name]
         unique_molecules[top.name]["sites"] = list(top.sites)
-        unique_molecules[top.name]["position_restraints"] = list(
-            site for site in top.sites if site.restraint
-        )
         unique_molecules[top.name]["pairs"] = generate_pairs_lists(
             top, refer_from_scaling_factor=True
         )["pairs14"]
         unique_molecules[top.name]["bonds"] = list(top.bonds)
-        unique_molecules[top.name]["bond_restraints"] = list(
-            bond for bond in top.bonds if bond.restraint
-        )
         unique_molecules[top.name]["angles"] = list(top.angles)
-        unique_molecules[top.name]["angle_restraints"] = list(
-            angle for angle in top.angles if angle.restraint
-        )
         unique_molecules[top.name]["dihedrals"] = list(top.dihedrals)
-        unique_molecules[top.name]["dihedral_restraints"] = list(
-            dihedral for dihedral in top.dihedrals if dihedral.restraint
-        )
-        unique_molecules[molecule.name]["impropers"] = list(top.impropers)
-
+        unique_molecules[top.name]["impropers"] = list(top.impropers)
     else:
-        for tag in unique_molecules:
+        # The sites and connections of every molecule are partitioned in a
+        # single pass by the topology, and the 1-4 pairs are generated once
+        # for the whole topology, then split by molecule
+        sites_by_molecule = top._get_sites_by_label("molecule")
+        pairs14 = generate_pairs_lists(top, index_only=True)["pairs14"]
+        molecule_indices = np.full(top.n_sites, -1)
+        for idx, tag in enumerate(unique_molecules):
             molecule = unique_molecules[tag]["subtags"][0]
-            unique_molecules[tag]["sites"] = list(
-                top.iter_sites(key="molecule", value=molecule)
-            )
-            unique_molecules[tag]["position_restraints"] = list(
-                site
-                for site in top.sites
-                if (site.restraint and site.molecule == molecule)
-            )
-            unique_molecules[tag]["pairs"] = generate_pairs_lists(top, molecule)[
-                "pairs14"
-            ]
+            unique_molecules[tag]["sites"] = list(sites_by_molecule[molecule])
+            molecule_indices[
+                [top.get_index(site) for site in unique_molecules[tag]["sites"]]
+            ] = idx
             unique_molecules[tag]["bonds"] = list(molecule_bonds(top, molecule))
-            unique_molecules[tag]["bond_restraints"] = list(
-                bond for bond in molecule_bonds(top, molecule) if bond.restraint
-            )
             unique_molecules[tag]["angles"] = list(molecule_angles(top, molecule))
-            unique_molecules[tag]["angle_restraints"] = list(
-                angle for angle in molecule_angles(top, molecule) if angle.restraint
-            )
             unique_molecules[tag]["dihedrals"] = list(molecule_dihedrals(top, molecule))
-            unique_molecules[tag]["dihedral_restraints"] = list(
-                dihedral
-                for dihedral in molecule_dihedrals(top, molecule)
-                if dihedral.restraint
-            )
             unique_molecules[tag]["impropers"] = list(molecule_impropers(top, molecule))
+
+        pairs_molecules = molecule_indices[pairs14]
+        in_molecule = pairs_molecules[:, 0] == pairs_molecules[:, 1]
+        pairs14, pairs_molecules = pairs14[in_molecule], pairs_molecules[in_molecule, 0]
+        sites = top.sites
+        for idx, tag in enumerate(unique_molecules):
+            molecule_pairs = pairs14[pairs_molecules == idx].tolist()
+            unique_molecules[tag]["pairs"] = [
+                [sites[i], sites[j]] for i, j in molecule_pairs
+            ]
+
+    for tag in unique_molecules:
+        unique_molecules[tag]["position_restraints"] = [
+            site for site in unique_molecules[tag]["sites"] if site.restraint
+        ]
+        for conn_group in ["bonds", "angles", "dihedrals"]:
+            unique_molecules[tag][conn_group[:-1] + "_restraints"] = [
+                conn for conn in unique_molecules[tag][conn_group] if conn.restraint
+            ]
     return unique_molecules
 
 
+def _get_shifted_idx_map(top, unique_molecules):
+    """Map the topology index of the sites of each unique molecule to their index in it.
+
+    Each unique molecule need to be reindexed (restarting from 0), so that the
+    atom indices used in its connection sections are accurate.
+    """
+    shifted_idx_map = np.full(top.n_sites, -1)
+    for tag in unique_molecules:
+        sites = unique_molecules[tag]["sites"]
+        shifted_idx_map[[top.get_index(site) for site in sites]] = np.arange(len(sites))
+    return shifted_idx_map
+
+
 def _lookup_atomic_number(atom_type):
     """Look up an atomic_number based on atom type information, 0 if non-element type."""
     try:
@@ -548,7 +557,7 @@ def _periodic_torsion_writer(top, dihedral, shifted_idx_map):
             dihedral.connection_type.parameters["n"][i].value,
         )
         lines.append(line)
-    return lines
+    return "".join(lines)
 
 
 def _write_restraint(top, site_or_conn, type, shifted_idx_map):
@@ -1,20 +1,27 @@
 """Read and write XYZ files."""
 
 import datetime
+import warnings
+from collections import namedtuple
 
 import numpy as np
 import unyt as u
 
 from gmso.core.atom import Atom
 from gmso.core.topology import Topology
+from gmso.formats.chunked_writer import open_chunked
 from gmso.formats.formats_registry import loads_as, saves_as
 
+XYZFrame = namedtuple("XYZFrame", ("comment", "names", "positions"))
+
 
 @loads_as(".xyz")
 def read_xyz(filename):
     """Reader for xyz file format.
 
     Read in an xyz file at the given path and return a Topology object.
+    Only the first frame of a multi-frame file is read, see `iter_xyz_frames`
+    to read all of them.
 
     Parameters
     ----------
@@ -29,39 +36,91 @@ def read_xyz(filename):
     top = Topology()
 
     with open(filename, "r") as xyz_file:
-        n_atoms = int(xyz_file.readline())
-        xyz_file.readline()
-        coords = np.zeros(shape=(n_atoms, 3)) * u.nanometer
-        for row, _ in enumerate(coords):
-            line = xyz_file.readline().split()
-            if not line:
-                msg = (
-                    "Incorrect number of lines in input file. Based on the "
-                    "number in the first line of the file, {} rows of atoms "
-                    "were expected, but at least one fewer was found."
-                )
-                raise ValueError(msg.format(n_atoms))
-            tmp = np.array(line[1:4], dtype=float) * u.angstrom
-            coords[row] = tmp.in_units(u.nanometer)
-            site = Atom(name=line[0], position=coords[row])
-            top.add_site(site)
+        frame = _read_xyz_frame(xyz_file)
+        if frame is None:
+            raise ValueError(f"No atoms were found in {filename}.")
+        # The parsed values are valid, so validation can be skipped
+        top.add_sites(
+            (
+                Atom.construct_trusted(name=name, position=position)
+                for name, position in zip(frame.names, frame.positions)
+            ),
+            update_types=False,
+        )
         top.update_topology()
 
-        # Verify we have read the last line by ensuring the next line in blank
+        # Verify we have read the last line, or that another frame follows
         line = xyz_file.readline().split()
         if line:
-            msg = (
-                "Incorrect number of lines in input file. Based on the "
-                "number in the first line of the file, {} rows of atoms "
-                "were expected, but at least one more was found."
+            if len(line) != 1 or not line[0].isdigit():
+                msg = (
+                    "Incorrect number of lines in input file. Based on the "
+                    "number in the first line of the file, {} rows of atoms "
+                    "were expected, but at least one more was found."
+                )
+                raise ValueError(msg.format(len(frame.names)))
+            warnings.warn(
+                f"{filename} has more than one frame, only the first frame is "
+                "loaded. Use iter_xyz_frames to read the other frames."
             )
-            raise ValueError(msg.format(n_atoms))
 
     return top
 
 
+def iter_xyz_frames(filename):
+    """Iterate over the frames of an xyz file.
+
+    Each frame is parsed as a block, so that the positions of every frame of a
+    trajectory can be read without building a topology for each of them, e.g.
+    ``np.stack([frame.positions for frame in iter_xyz_frames(filename)])``.
+
+    Parameters
+    ----------
+    filename : str
+        Path to .xyz file that need to be read.
+
+    Yields
+    ------
+    XYZFrame
+        A named tuple with the comment line of the frame, the list of the atom
+        names and the positions in nm as a (n_atoms, 3) unyt array
+    """
+    with open(filename, "r") as xyz_file:
+        while True:
+            frame = _read_xyz_frame(xyz_file)
+            if frame is None:
+                return
+            yield frame
+
+
+def _read_xyz_frame(xyz_file):
+    """Read the next frame of an open xyz file, or return None at the end of the file.
+
+    The coordinates of all atoms are converted to nm at once.
+    """
+    line = xyz_file.readline()
+    if not line.strip():
+        return None
+    n_atoms = int(line)
+    comment = xyz_file.readline().strip()
+    rows = [xyz_file.readline().split() for _ in range(n_atoms)]
+    if not all(rows):
+        msg = (
+            "Incorrect number of lines in input file. Based on the "
+            "number in the first line of the file, {} rows of atoms "
+            "were expected, but at least one fewer was found."
+        )
+        raise ValueError(msg.format(n_atoms))
+
+    names = [row[0] for row in rows]
+    coords = np.array([row[1:4] for row in rows], dtype=float).reshape(n_atoms, 3)
+    positions = u.unyt_array(coords, u.angstrom).in_units(u.nanometer)
+
+    return XYZFrame(comment, names, positions)
+
+
 @saves_as(".xyz")
-def write_xyz(top, filename):
+def write_xyz(top, filename, threaded=False):
     """Writer for xyz file format.
 
     Write a Topology object to an xyz file at the given path.
@@ -72,28 +131,21 @@ def write_xyz(top, filename):
         Topology object that needs to be written out.
     filename : str
         Path to file location.
+    threaded : bool, optional, default=False
+        If True, write the file from a background thread while the text is
+        being formatted.
     """
-    with open(filename, "w") as out_file:
+    with open_chunked(filename, threaded=threaded) as out_file:
         out_file.write("{:d}\n".format(top.n_sites))
         out_file.write(
             "{} {} written by topology at {}\n".format(
                 top.name, filename, str(datetime.datetime.now())
             )
         )
-        out_file.write(_prepare_particles(top))
-
-
-def _prepare_particles(top: Topology) -> str:
-    atom_info = str()
-    for _, site in enumerate(top.sites):
         # TODO: Better handling of element guessing and site naming
-        if site.element is not None:
-            tmp_name = site.element.symbol
-        else:
-            tmp_name = "X"
-
-        x = site.position[0].in_units(u.angstrom).value
-        y = site.position[1].in_units(u.angstrom).value
-        z = site.position[2].in_units(u.angstrom).value
-        atom_info = atom_info + f"{tmp_name} {x:8.3f} {y:8.3f} {z:8.3f}\n"
-    return atom_info
+        names = [
+            site.element.symbol if site.element is not None else "X"
+            for site in top.sites
+        ]
+        positions = top.positions.in_units(u.angstrom).value
+        out_file.write_columns([names, *positions.T], "%s %8.3f %8.3f %8.3f\n")
@@ -1,6 +1,8 @@
 """Utilities for atomtyping a gmso topology with foyer."""
 
+import os
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
 from foyer.atomtyper import AtomTypingRulesProvider, find_atomtypes
 from foyer.exceptions import FoyerError
@@ -120,3 +122,79 @@ def get_atomtyping_rules_provider(gmso_ff):
 def typemap_dict(topology_graph, atomtyping_rules_provider, max_iter=10):
     """Return a dictionary of typemap, by finding atomtypes in foyer."""
     return find_atomtypes(topology_graph, atomtyping_rules_provider, max_iter)
+
+
+_typing_worker_state = {}
+
+
+def _init_typing_worker(topology_graph, atomtyping_rules_provider, max_iter):
+    """Keep the topology graph and rules provider in a typing worker process."""
+    _typing_worker_state["topology_graph"] = topology_graph
+    _typing_worker_state["atomtyping_rules_provider"] = atomtyping_rules_provider
+    _typing_worker_state["max_iter"] = max_iter
+
+
+def _typemap_for_nodes(nodes):
+    """Return the typemap for the subgraph spanned by `nodes` in a typing worker."""
+    return typemap_dict(
+        topology_graph=_typing_worker_state["topology_graph"].subgraph(nodes),
+        atomtyping_rules_provider=_typing_worker_state["atomtyping_rules_provider"],
+        max_iter=_typing_worker_state["max_iter"],
+    )
+
+
+def typemap_dicts(
+    topology_graph, atomtyping_rules_provider, subgraphs, n_jobs=1, max_iter=10
+):
+    """Return the typemaps of disconnected subgraphs of a topology graph.
+
+    Parameters
+    ----------
+    topology_graph: foyer.topology_graph.TopologyGraph
+        The topology graph the subgraphs are taken from
+    atomtyping_rules_provider: foyer.atomtyper.AtomTypingRulesProvider
+        The rules provider used to find the atomtypes
+    subgraphs: list of foyer.topology_graph.TopologyGraph
+        The subgraphs of `topology_graph` to atomtype, which should not be
+        bonded to each other
+    n_jobs: int, default=1
+        The number of worker processes to atomtype the subgraphs with. If -1,
+        use all the available CPUs. The topology graph and the rules provider
+        are sent once to each worker, and only the nodes of each subgraph are
+        sent per task.
+    max_iter: int, default=10
+        The maximum number of iterations for resolving the atomtypes
+
+    Returns
+    -------
+    list of dict
+        The typemap of each subgraph, in the order of `subgraphs`
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif n_jobs < 1:
+        raise ValueError(f"n_jobs should be a positive integer or -1, got {n_jobs}")
+
+    n_jobs = min(n_jobs, len(subgraphs))
+    if n_jobs <= 1:
+        return [
+            typemap_dict(
+                topology_graph=subgraph,
+                atomtyping_rules_provider=atomtyping_rules_provider,
+                max_iter=max_iter,
+            )
+            for subgraph in subgraphs
+        ]
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_init_typing_worker,
+        initargs=(topology_graph, atomtyping_rules_provider, max_iter),
+    ) as executor:
+        return list(
+            executor.map(
+                _typemap_for_nodes,
+                [tuple(subgraph.nodes) for subgraph in subgraphs],
+                chunksize=max(1, len(subgraphs) // (4 * n_jobs)),
+            )
+        )
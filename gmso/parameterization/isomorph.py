@@ -1,7 +1,5 @@
 """TopologyGraph Functions that identify molecules from isomorphism."""
 
-from collections import deque
-
 import networkx as nx
 
 
@@ -27,34 +25,48 @@ def partition_isomorphic_topology_graphs(graph):
 
     Notes
     -----
+    The connected components are first bucketed by their node and edge counts
+    and a Weisfeiler-Lehman hash of their elements, so that the (VF2) isomorphism
+    check only runs against the unique graphs that share a bucket.
     See https://github.com/networkx/networkx/blob/main/networkx/algorithms/isomorphism/isomorphvf2.py
     from the networkx documentation about identifying isomorphic components
     """
-    graph_queue = deque(graph.subgraph(c) for c in nx.connected_components(graph))
-
-    graph_of_interest = graph_queue.popleft()
-    isomorphic_elements = {
-        graph_of_interest: [],
-    }
-
-    count = 0
-    first_mismatch = None
-
-    while graph_queue:
-        if graph_queue[0] == first_mismatch:
-            count = 0
-            graph_of_interest = graph_queue.popleft()
-            isomorphic_elements[graph_of_interest] = []
-        if graph_queue:
-            graph = graph_queue.popleft()
+    isomorphic_elements = {}
+    buckets = {}
+    for component in nx.connected_components(graph):
+        subgraph = graph.subgraph(component)
+        bucket = buckets.setdefault(_topology_graph_invariant(subgraph), [])
+        for graph_of_interest in bucket:
             matcher = nx.algorithms.isomorphism.GraphMatcher(
-                graph, graph_of_interest, node_match=top_node_match
+                subgraph, graph_of_interest, node_match=top_node_match
             )
             if matcher.is_isomorphic():
-                isomorphic_elements[graph_of_interest].append((graph, matcher.mapping))
-            else:
-                if count == 0:
-                    first_mismatch = graph
-                graph_queue.append(graph)
-                count += 1
+                isomorphic_elements[graph_of_interest].append(
+                    (subgraph, matcher.mapping)
+                )
+                break
+        else:
+            bucket.append(subgraph)
+            isomorphic_elements[subgraph] = []
     return isomorphic_elements
+
+
+def _topology_graph_invariant(graph):
+    """Return a hashable invariant that is equal for isomorphic topology graphs.
+
+    The invariant combines the node and edge counts with a Weisfeiler-Lehman
+    hash of the graph labelled by the elements of its atoms. Graphs with
+    different invariants can not be isomorphic, so only graphs sharing an
+    invariant need to be matched.
+    """
+    labelled_graph = nx.Graph()
+    labelled_graph.add_nodes_from(
+        (node, {"element": str(data["atom_data"].element)})
+        for node, data in graph.nodes(data=True)
+    )
+    labelled_graph.add_edges_from(graph.edges)
+    return (
+        graph.number_of_nodes(),
+        graph.number_of_edges(),
+        nx.weisfeiler_lehman_graph_hash(labelled_graph, node_attr="element"),
+    )
@@ -22,10 +22,14 @@ def _conn_in_molecule(connection, label, is_group=False):
 
 def _molecule_connections(top, molecule, attr, is_group=False):
     """Return all the connections belonging to a molecule."""
-    return filter(
-        lambda conn: _conn_in_molecule(conn, molecule, is_group),
-        getattr(top, attr),
-    )
+    if isinstance(molecule, (list, tuple)):
+        return filter(
+            lambda conn: _conn_in_molecule(conn, molecule, is_group),
+            getattr(top, attr),
+        )
+    else:
+        label_type = "group" if is_group else "molecule"
+        return iter(top._get_connections_by_label(attr, label_type, molecule))
 
 
 def molecule_bonds(top, molecule, is_group=False):
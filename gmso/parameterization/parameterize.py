@@ -15,9 +15,12 @@ def apply(
     identify_connections=False,
     speedup_by_molgraph=False,
     speedup_by_moltag=False,
+    speedup_by_template=False,
     ignore_params=["improper"],
     remove_untyped=True,
     fast_copy=True,
+    share_potentials=False,
+    n_jobs=1,
 ):
     """Set Topology parameter types from GMSO ForceFields.
 
@@ -55,6 +58,13 @@ def apply(
         each molecule only once. This option provides speedup for topologies with properly
         assigned molecule and residue labels.
 
+    speedup_by_template : bool, optional, default=False
+        A flag to determine whether or not to look up connection parameters only once
+        per unique molecule, and replicate them onto each repeated copy of that molecule
+        through its atom mapping. This option is only used with speedup_by_molgraph=True
+        or speedup_by_moltag=True, and provides speedup for topologies with many copies
+        of the same molecules.
+
     ignore_params : set or list or tuple, optional, default=["impropers"]
         Skipping the checks that make sure all connections (in the list) have a connection types.
         Available options includes "bonds", "angles", "dihedrals", and "impropers".
@@ -72,6 +82,22 @@ def apply(
         application of forcefield parameters, and so is defaulted to True. Note that
         this should be changed to False if further modification of expressions are
         necessary post parameterization.
+
+    share_potentials : bool, optional, default=False
+        If True, all the sites/connections matched to the same forcefield potential
+        reference a single copy of that potential, instead of each one owning its own
+        copy. This greatly reduces the memory used by large parameterized topologies.
+        Note that modifying such a potential in place modifies it for all the
+        sites/connections sharing it, so assign a clone of the potential to a
+        site/connection (e.g. `site.atom_type = site.atom_type.clone()`) before modifying
+        it alone.
+
+    n_jobs : int, optional, default=1
+        The number of processes used to atomtype the topology. Each unique molecule
+        (with speedup_by_molgraph or speedup_by_moltag) or each disconnected structure
+        (otherwise) is atomtyped as a separate task. If -1, use all the available CPUs.
+        This option will be useful for topologies with many distinct molecules, e.g.
+        polydisperse polymer melts or mixtures.
     """
     ignore_params = set([option.lower() for option in ignore_params])
     config = TopologyParameterizationConfig.model_validate(
@@ -80,9 +106,12 @@ def apply(
             identify_connections=identify_connections,
             speedup_by_molgraph=speedup_by_molgraph,
             speedup_by_moltag=speedup_by_moltag,
+            speedup_by_template=speedup_by_template,
             ignore_params=ignore_params,
             remove_untyped=remove_untyped,
             fast_copy=fast_copy,
+            share_potentials=share_potentials,
+            n_jobs=n_jobs,
         )
     )
     parameterizer = TopologyParameterizer(
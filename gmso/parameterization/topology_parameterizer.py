@@ -1,10 +1,12 @@
 """The parameterizer module for a gmso Topology."""
 
+import functools
 import warnings
 from typing import Dict, Union
 
 import networkx as nx
 from boltons.setutils import IndexedSet
+from pydantic import PrivateAttr
 
 from gmso.abc.gmso_base import GMSOBase
 from gmso.core.forcefield import ForceField
@@ -14,6 +16,7 @@ from gmso.parameterization.foyer_utils import (
     get_atomtyping_rules_provider,
     get_topology_graph,
     typemap_dict,
+    typemap_dicts,
 )
 from gmso.parameterization.isomorph import (
     partition_isomorphic_topology_graphs,
@@ -90,6 +93,31 @@ class TopologyParameterizationConfig(GMSOBase):
         "variables to save time on parameterization step.",
     )
 
+    speedup_by_template: bool = Field(
+        default=False,
+        description="A flag to determine whether or not to resolve connection "
+        "parameters once per unique molecule and replicate them onto its repeated "
+        "copies. Will only be used if speedup_by_molgraph=True or "
+        "speedup_by_moltag=True",
+    )
+
+    share_potentials: bool = Field(
+        default=False,
+        description="If True, all the sites/connections matched to the same forcefield "
+        "potential (with the same member types/classes) reference a single clone of "
+        "that potential instead of each owning a clone, which reduces the memory usage "
+        "of large topologies. Modifying such a potential in place changes it for all of "
+        "them, so assign a clone to a site/connection before modifying its potential "
+        "alone.",
+    )
+
+    n_jobs: int = Field(
+        default=1,
+        description="The number of processes used to atomtype the unique "
+        "disconnected structures of the topology. If -1, use all the available "
+        "CPUs.",
+    )
+
 
 class TopologyParameterizer(GMSOBase):
     """Utility class to parameterize a topology with gmso Forcefield."""
@@ -107,6 +135,8 @@ class TopologyParameterizer(GMSOBase):
         ..., description="The configuration options for the parameterizer."
     )
 
+    _shared_potentials: dict = PrivateAttr(default_factory=dict)
+
     def get_ff(self, key=None):
         """Return the forcefield of choice by looking up the forcefield dictionary."""
         if isinstance(self.forcefields, Dict):
@@ -114,12 +144,33 @@ class TopologyParameterizer(GMSOBase):
         else:
             return self.forcefields
 
+    def _clone_potential(self, potential, member_types=None, member_classes=None):
+        """Return a clone of a forcefield potential to assign to a site/connection.
+
+        If `share_potentials` is set, the clone is reused for every call with the same
+        potential, member_types and member_classes.
+        """
+        if self.config.share_potentials:
+            key = (id(potential), member_types, member_classes)
+            if key in self._shared_potentials:
+                return self._shared_potentials[key]
+
+        clone = potential.clone(self.config.fast_copy)
+        if member_types:
+            clone.member_types = member_types
+        if member_classes:
+            clone.member_classes = member_classes
+
+        if self.config.share_potentials:
+            self._shared_potentials[key] = clone
+        return clone
+
     def _parameterize_sites(self, sites, typemap, ff, speedup_by_moltag=None):
         """Parameterize sites with appropriate atom-types from the forcefield."""
         for j, site in enumerate(sites):
-            site.atom_type = ff.get_potential(
-                "atom_type", typemap[j]["atomtype"]
-            ).clone(self.config.fast_copy)
+            site.atom_type = self._clone_potential(
+                ff.get_potential("atom_type", typemap[j]["atomtype"])
+            )
             assert site.atom_type, site
 
     def _parameterize_connections(
@@ -128,8 +179,15 @@ class TopologyParameterizer(GMSOBase):
         ff,
         label_type=None,
         label=None,
+        sites=None,
+        templates=None,
     ):
-        """Parameterize connections with appropriate potentials from the forcefield."""
+        """Parameterize connections with appropriate potentials from the forcefield.
+
+        If `templates` is provided, the connections of each template molecule are
+        parameterized from the forcefield and replicated onto the connections of
+        its copies. The template nodes and mappings index into `sites`.
+        """
         if label_type and label:
             bonds = molecule_bonds(top, label, True if label_type == "group" else False)
             angles = molecule_angles(
@@ -147,18 +205,27 @@ class TopologyParameterizer(GMSOBase):
             dihedrals = top.dihedrals
             impropers = top.impropers
 
-        self._apply_connection_parameters(
+        if templates:
+            apply_connection_parameters = functools.partial(
+                self._apply_connection_parameters_by_template,
+                site_nodes={id(site): j for j, site in enumerate(sites)},
+                templates=templates,
+            )
+        else:
+            apply_connection_parameters = self._apply_connection_parameters
+
+        apply_connection_parameters(
             bonds, ff, False if "bond" in self.config.ignore_params else True
         )
-        self._apply_connection_parameters(
+        apply_connection_parameters(
             angles, ff, False if "angle" in self.config.ignore_params else True
         )
-        self._apply_connection_parameters(
+        apply_connection_parameters(
             dihedrals,
             ff,
             False if "dihedral" in self.config.ignore_params else True,
         )
-        self._apply_connection_parameters(
+        apply_connection_parameters(
             impropers,
             ff,
             False if "improper" in self.config.ignore_params else True,
@@ -192,25 +259,96 @@ class TopologyParameterizer(GMSOBase):
                     f"identifiers: {connection_identifiers} in the Forcefield."
                 )
             elif match:
-                setattr(connection, group, match[0].clone(self.config.fast_copy))
                 matched_order = [connection.connection_members[i] for i in match[1]]
+                member_types = (
+                    None
+                    if match[0].member_types
+                    else tuple(member.atom_type.name for member in matched_order)
+                )
+                member_classes = (
+                    None
+                    if match[0].member_classes
+                    else tuple(member.atom_type.atomclass for member in matched_order)
+                )
+                setattr(
+                    connection,
+                    group,
+                    self._clone_potential(match[0], member_types, member_classes),
+                )
                 connection.connection_members = matched_order
-                if not match[0].member_types:
-                    connection.connection_type.member_types = tuple(
-                        member.atom_type.name for member in matched_order
-                    )
-                if not match[0].member_classes:
-                    connection.connection_type.member_classes = tuple(
-                        member.atom_type.atomclass for member in matched_order
-                    )
+
+    def _apply_connection_parameters_by_template(
+        self, connections, ff, error_on_missing=True, site_nodes=None, templates=None
+    ):
+        """Find potentials for the connections of template molecules and replicate them onto their copies."""
+        node_templates = {}
+        for template_nodes, mappings in templates:
+            node_templates.update((node, node) for node in template_nodes)
+            for mapping in mappings:
+                node_templates.update(mapping)
+
+        template_connections, replicas = [], []
+        for connection in connections:
+            nodes = tuple(
+                site_nodes[id(member)] for member in connection.connection_members
+            )
+            template_nodes = tuple(node_templates.get(node) for node in nodes)
+            if template_nodes == nodes:
+                template_connections.append(connection)
+            else:
+                replicas.append((connection, template_nodes))
+
+        connections_by_members = {}
+        for connection in template_connections:
+            for members in connection.equivalent_members():
+                connections_by_members[
+                    tuple(site_nodes[id(member)] for member in members)
+                ] = connection
+
+        self._apply_connection_parameters(template_connections, ff, error_on_missing)
+
+        unmatched = []
+        for connection, template_nodes in replicas:
+            template = connections_by_members.get(template_nodes)
+            if template is None:
+                unmatched.append(connection)
+                continue
+
+            group = POTENTIAL_GROUPS[type(connection)]
+            potential = getattr(template, group)
+            if potential is None:
+                continue
+
+            members = dict(zip(template_nodes, connection.connection_members))
+            setattr(
+                connection,
+                group,
+                (
+                    potential
+                    if self.config.share_potentials
+                    else potential.clone(self.config.fast_copy)
+                ),
+            )
+            connection.connection_members = [
+                members[site_nodes[id(member)]]
+                for member in template.connection_members
+            ]
+
+        self._apply_connection_parameters(unmatched, ff, error_on_missing)
 
     def _parameterize(
-        self, top, typemap, label_type=None, label=None, speedup_by_moltag=False
+        self,
+        top,
+        typemap,
+        label_type=None,
+        label=None,
+        speedup_by_moltag=False,
+        templates=None,
     ):
         """Parameterize a topology/subtopology based on an atomtype map."""
         if label and label_type:
             forcefield = self.get_ff(label)
-            sites = top.iter_sites(label_type, label)
+            sites = tuple(top.iter_sites(label_type, label))
         else:
             forcefield = self.get_ff(top.name)
             sites = top.sites
@@ -223,6 +361,8 @@ class TopologyParameterizer(GMSOBase):
             forcefield,
             label_type,
             label,
+            sites=sites,
+            templates=templates,
         )
 
     def _set_combining_rule(self):
@@ -296,7 +436,9 @@ class TopologyParameterizer(GMSOBase):
         if self.config.identify_connections:
             """ToDo: This mutates the topology and is agnostic to downstream
             errors. So, here we should use index only option"""
-            self.topology.identify_connections()
+            self.topology.identify_connections(
+                by_molecule=self.config.speedup_by_moltag
+            )
 
         if isinstance(self.forcefields, Dict):
             labels = self.topology.unique_site_labels(
@@ -320,13 +462,15 @@ class TopologyParameterizer(GMSOBase):
                         f"is missing."
                     )  # FixMe: Will warning be enough?
                 else:
-                    typemap = self._get_atomtypes(
+                    typemap, templates = self._get_atomtypes(
                         self.get_ff(label),
                         self.topology,
                         self.config.match_ff_by,
                         label,
                         self.config.speedup_by_moltag,
                         self.config.speedup_by_molgraph,
+                        self.config.n_jobs,
+                        return_templates=True,
                     )
                     self._parameterize(
                         self.topology,
@@ -334,18 +478,24 @@ class TopologyParameterizer(GMSOBase):
                         label_type=self.config.match_ff_by,
                         label=label,
                         speedup_by_moltag=self.config.speedup_by_moltag,  # This will be removed from the future iterations
+                        templates=(
+                            templates if self.config.speedup_by_template else None
+                        ),
                     )
         else:
-            typemap = self._get_atomtypes(
+            typemap, templates = self._get_atomtypes(
                 self.get_ff(),
                 self.topology,
                 speedup_by_moltag=self.config.speedup_by_moltag,
                 use_isomorphic_checks=self.config.speedup_by_molgraph,
+                n_jobs=self.config.n_jobs,
+                return_templates=True,
             )
             self._parameterize(
                 self.topology,
                 typemap,
                 speedup_by_moltag=self.config.speedup_by_moltag,
+                templates=templates if self.config.speedup_by_template else None,
             )
 
         self._set_scaling_factors()  # Set global or per molecule scaling factors
@@ -355,16 +505,16 @@ class TopologyParameterizer(GMSOBase):
             # TEMP CODE: copied from foyer/general_forcefield.py, will update later
             for i in range(self.topology.n_bonds - 1, -1, -1):
                 if not self.topology.bonds[i].bond_type:
-                    self.topology._bonds.pop(i)
+                    self.topology.remove_connection(self.topology.bonds[i])
             for i in range(self.topology.n_angles - 1, -1, -1):
                 if not self.topology.angles[i].angle_type:
-                    self.topology._angles.pop(i)
+                    self.topology.remove_connection(self.topology.angles[i])
             for i in range(self.topology.n_dihedrals - 1, -1, -1):
                 if not self.topology.dihedrals[i].dihedral_type:
-                    self.topology._dihedrals.pop(i)
+                    self.topology.remove_connection(self.topology.dihedrals[i])
             for i in range(self.topology.n_impropers - 1, -1, -1):
                 if not self.topology.impropers[i].improper_type:
-                    self.topology._impropers.pop(i)
+                    self.topology.remove_connection(self.topology.impropers[i])
 
     @staticmethod
     def connection_identifier(
@@ -387,8 +537,16 @@ class TopologyParameterizer(GMSOBase):
         label=None,
         speedup_by_moltag=False,
         use_isomorphic_checks=False,
+        n_jobs=1,
+        return_templates=False,
     ):
-        """Run atom-typing in foyer and return the typemap."""
+        """Run atom-typing in foyer and return the typemap.
+
+        If `return_templates` is True, also return the typed molecule templates as
+        a list of (template nodes, list of mappings from replica node to template node),
+        or None when atom-typing did not look for repeated molecules.
+        """
+        templates = None
         atom_typing_rules_provider = get_atomtyping_rules_provider(forcefield)
         foyer_topology_graph = get_topology_graph(
             topology,
@@ -399,18 +557,34 @@ class TopologyParameterizer(GMSOBase):
         if speedup_by_moltag:
             # Iterate through foyer_topology_graph, which is a subgraph of label_type
             typemap, reference = dict(), dict()
-            for connected_component in nx.connected_components(foyer_topology_graph):
-                subgraph = foyer_topology_graph.subgraph(connected_component)
+            subgraphs = [
+                foyer_topology_graph.subgraph(connected_component)
+                for connected_component in nx.connected_components(foyer_topology_graph)
+            ]
+            for subgraph in subgraphs:
                 nodes_idx = tuple(subgraph.nodes)
                 molecule = subgraph.nodes[nodes_idx[0]]["atom_data"].molecule
                 if molecule not in reference:
-                    reference[molecule] = {
-                        "typemap": typemap_dict(
-                            atomtyping_rules_provider=atom_typing_rules_provider,
-                            topology_graph=subgraph,
-                        ),
-                        "graph": subgraph,
-                    }
+                    reference[molecule] = {"graph": subgraph, "mirrors": []}
+
+            reference_typemaps = typemap_dicts(
+                foyer_topology_graph,
+                atom_typing_rules_provider,
+                [
+                    molecule_reference["graph"]
+                    for molecule_reference in reference.values()
+                ],
+                n_jobs=n_jobs,
+            )
+            for molecule_reference, reference_typemap in zip(
+                reference.values(), reference_typemaps
+            ):
+                molecule_reference["typemap"] = reference_typemap
+
+            for subgraph in subgraphs:
+                nodes_idx = tuple(subgraph.nodes)
+                molecule = subgraph.nodes[nodes_idx[0]]["atom_data"].molecule
+                if reference[molecule]["graph"] is subgraph:
                     typemap.update(reference[molecule]["typemap"])
                 else:
                     if use_isomorphic_checks:
@@ -421,38 +595,71 @@ class TopologyParameterizer(GMSOBase):
                             node_match=top_node_match,
                         )
                         assert matcher.is_isomorphic()
+                        reference[molecule]["mirrors"].append(matcher.mapping)
                         for node in subgraph.nodes:
                             typemap[node] = reference[molecule]["typemap"][
                                 matcher.mapping[node]
                             ]
                     else:
                         # Assume nodes in repeated structures are in the same order
-                        for node, ref_node in zip(
-                            sorted(subgraph.nodes),
-                            sorted(reference[molecule]["typemap"]),
-                        ):
+                        mapping = dict(
+                            zip(
+                                sorted(subgraph.nodes),
+                                sorted(reference[molecule]["typemap"]),
+                            )
+                        )
+                        reference[molecule]["mirrors"].append(mapping)
+                        for node, ref_node in mapping.items():
                             typemap[node] = reference[molecule]["typemap"][ref_node]
-            return typemap
+            templates = [
+                (
+                    tuple(molecule_reference["graph"].nodes),
+                    molecule_reference["mirrors"],
+                )
+                for molecule_reference in reference.values()
+            ]
         elif use_isomorphic_checks:
             # Iterate through each isomorphic connected component
             isomorphic_substructures = partition_isomorphic_topology_graphs(
                 foyer_topology_graph
             )
             typemap = {}
-            for graph, mirrors in isomorphic_substructures.items():
-                typemap.update(
-                    typemap_dict(
-                        atomtyping_rules_provider=atom_typing_rules_provider,
-                        topology_graph=graph,
-                    )
-                )
-                for mirror, mapping in mirrors:
+            graphs = list(isomorphic_substructures)
+            graph_typemaps = typemap_dicts(
+                foyer_topology_graph,
+                atom_typing_rules_provider,
+                graphs,
+                n_jobs=n_jobs,
+            )
+            for graph, graph_typemap in zip(graphs, graph_typemaps):
+                typemap.update(graph_typemap)
+                for mirror, mapping in isomorphic_substructures[graph]:
                     for node in mirror:
                         typemap[node] = typemap[mapping[node]]
-            return typemap
+            templates = [
+                (tuple(graph.nodes), [mapping for _, mapping in mirrors])
+                for graph, mirrors in isomorphic_substructures.items()
+            ]
+
+        elif n_jobs != 1:
+            # Atomtype each connected component on its own
+            typemap = {}
+            subgraphs = [
+                foyer_topology_graph.subgraph(connected_component)
+                for connected_component in nx.connected_components(foyer_topology_graph)
+            ]
+            for component_typemap in typemap_dicts(
+                foyer_topology_graph,
+                atom_typing_rules_provider,
+                subgraphs,
+                n_jobs=n_jobs,
+            ):
+                typemap.update(component_typemap)
 
         else:
-            return typemap_dict(
+            typemap = typemap_dict(
                 topology_graph=foyer_topology_graph,
                 atomtyping_rules_provider=atom_typing_rules_provider,
             )
+
+        return (typemap, templates) if return_templates else typemap
@@ -0,0 +1,33 @@
+import networkx as nx
+
+from gmso.parameterization.foyer_utils import get_topology_graph
+from gmso.parameterization.isomorph import (
+    partition_isomorphic_topology_graphs,
+    top_node_match,
+)
+from gmso.tests.parameterization.parameterization_base_test import (
+    ParameterizationBaseTest,
+)
+
+
+class TestIsomorph(ParameterizationBaseTest):
+    def test_partition_isomorphic_topology_graphs(self, ethane_box_with_methane):
+        graph = get_topology_graph(ethane_box_with_methane)
+        isomorphic_elements = partition_isomorphic_topology_graphs(graph)
+
+        assert len(isomorphic_elements) == 2
+        assert sorted(len(graph) for graph in isomorphic_elements) == [5, 8]
+        for graph_of_interest, mirrors in isomorphic_elements.items():
+            assert len(mirrors) == 49
+            for mirror, mapping in mirrors:
+                assert set(mapping) == set(mirror.nodes)
+                assert set(mapping.values()) == set(graph_of_interest.nodes)
+                for node, ref_node in mapping.items():
+                    assert top_node_match(
+                        mirror.nodes[node], graph_of_interest.nodes[ref_node]
+                    )
+
+        n_components = nx.number_connected_components(graph)
+        assert n_components == sum(
+            len(mirrors) + 1 for mirrors in isomorphic_elements.values()
+        )
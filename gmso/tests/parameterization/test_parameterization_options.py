@@ -184,6 +184,119 @@ class TestParameterizationOptions(ParameterizationBaseTest):
             assert atom_a.atom_type == atom_b.atom_type
             assert atom_a.atom_type is not None
 
+    @pytest.mark.parametrize(
+        "speedup_by_molgraph, speedup_by_moltag",
+        [(False, False), (True, False), (False, True)],
+    )
+    def test_parallel_atomtyping(
+        self,
+        ethane_box_with_methane,
+        oplsaa_gmso,
+        speedup_by_molgraph,
+        speedup_by_moltag,
+    ):
+        ethane_box_with_methane.identify_connections()
+        serial_top = deepcopy(ethane_box_with_methane)
+        apply(
+            serial_top,
+            oplsaa_gmso,
+            speedup_by_molgraph=speedup_by_molgraph,
+            speedup_by_moltag=speedup_by_moltag,
+        )
+        apply(
+            ethane_box_with_methane,
+            oplsaa_gmso,
+            speedup_by_molgraph=speedup_by_molgraph,
+            speedup_by_moltag=speedup_by_moltag,
+            n_jobs=2,
+        )
+        for site, serial_site in zip(ethane_box_with_methane.sites, serial_top.sites):
+            assert site.atom_type.name == serial_site.atom_type.name
+
+    @pytest.mark.parametrize(
+        "speedup_by_molgraph, speedup_by_moltag",
+        [(True, False), (False, True), (True, True)],
+    )
+    def test_speedup_by_template(
+        self,
+        ethane_box_with_methane,
+        oplsaa_gmso,
+        speedup_by_molgraph,
+        speedup_by_moltag,
+    ):
+        ethane_box_with_methane.identify_connections()
+        reference_top = deepcopy(ethane_box_with_methane)
+        apply(
+            reference_top,
+            oplsaa_gmso,
+            speedup_by_molgraph=speedup_by_molgraph,
+            speedup_by_moltag=speedup_by_moltag,
+        )
+        apply(
+            ethane_box_with_methane,
+            oplsaa_gmso,
+            speedup_by_molgraph=speedup_by_molgraph,
+            speedup_by_moltag=speedup_by_moltag,
+            speedup_by_template=True,
+        )
+        assert ethane_box_with_methane.n_connections == reference_top.n_connections
+        for connection, reference_connection in zip(
+            ethane_box_with_methane.connections, reference_top.connections
+        ):
+            assert connection.connection_type.name == (
+                reference_connection.connection_type.name
+            )
+            assert connection.connection_type.member_types == (
+                reference_connection.connection_type.member_types
+            )
+            assert [
+                ethane_box_with_methane.get_index(member)
+                for member in connection.connection_members
+            ] == [
+                reference_top.get_index(member)
+                for member in reference_connection.connection_members
+            ]
+
+    @pytest.mark.parametrize("speedup_by_template", [False, True])
+    def test_share_potentials(
+        self, ethane_box_with_methane, oplsaa_gmso, speedup_by_template
+    ):
+        ethane_box_with_methane.identify_connections()
+        reference_top = deepcopy(ethane_box_with_methane)
+        apply(reference_top, oplsaa_gmso, speedup_by_molgraph=True)
+        apply(
+            ethane_box_with_methane,
+            oplsaa_gmso,
+            speedup_by_molgraph=True,
+            speedup_by_template=speedup_by_template,
+            share_potentials=True,
+        )
+        for site, reference_site in zip(
+            ethane_box_with_methane.sites, reference_top.sites
+        ):
+            assert site.atom_type == reference_site.atom_type
+        for connection, reference_connection in zip(
+            ethane_box_with_methane.connections, reference_top.connections
+        ):
+            assert connection.connection_type == reference_connection.connection_type
+            assert connection.connection_type.member_types == (
+                reference_connection.connection_type.member_types
+            )
+
+        atom_type_names = set(
+            site.atom_type.name for site in ethane_box_with_methane.sites
+        )
+        assert len(reference_top.atom_types) == reference_top.n_sites
+        assert len(ethane_box_with_methane.atom_types) == len(atom_type_names)
+        for atom_type in ethane_box_with_methane.atom_types:
+            assert atom_type is not oplsaa_gmso.atom_types[atom_type.name]
+
+    def test_parallel_atomtyping_invalid_n_jobs(
+        self, ethane_box_with_methane, oplsaa_gmso
+    ):
+        with pytest.raises(ValueError):
+            apply(ethane_box_with_methane, oplsaa_gmso, n_jobs=0)
+
     def test_remove_untyped(self, oplsaa_gmso):
         isopropane = mb.load("C(C)C", smiles=True)
         top1 = from_mbuild(isopropane)
@@ -3,6 +3,7 @@ import pytest
 import unyt as u
 from pydantic import ValidationError
 
+from gmso.abc.abstract_site import Molecule
 from gmso.core.atom import Atom
 from gmso.core.atom_type import AtomType
 from gmso.core.element import Lithium, Sulfur
@@ -109,3 +110,31 @@ class TestSite(BaseTest):
         atom1 = Atom(name="Site")
         with pytest.raises(ValidationError):
             atom1.position = "invalid"
+
+    def test_construct_trusted(self):
+        molecule = Molecule(name="LI", number=0)
+        atom = Atom.construct_trusted(
+            name="Lithium",
+            charge=1 * u.elementary_charge,
+            position=u.nm * np.ones(3),
+            molecule=molecule,
+        )
+        ref_atom = Atom(
+            name="Lithium",
+            charge=1 * u.elementary_charge,
+            position=u.nm * np.ones(3),
+            molecule=molecule,
+        )
+        assert atom.model_dump() == ref_atom.model_dump()
+        assert atom.model_fields_set == ref_atom.model_fields_set
+
+        atom.mass = 6.941
+        assert atom.mass == 6.941 * u.gram / u.mol
+
+        default_atom = Atom.construct_trusted()
+        assert default_atom.name == "Atom"
+        assert np.all(np.isnan(default_atom.position))
+        assert default_atom.position is not Atom.construct_trusted().position
+
+        with pytest.raises(TypeError):
+            Atom.construct_trusted(spin=1)
@@ -123,3 +123,14 @@ class TestBond(BaseTest):
         bond = Bond(connection_members=[atom1, atom2], bond_type=btype)
         assert set(bond.member_classes) == set(["XE", "XE"])
         assert set(bond.member_types) == set(["at1", "at2"])
+
+    def test_bond_construct_trusted(self):
+        atom1 = Atom(name="atom1")
+        atom2 = Atom(name="atom2")
+        bond = Bond.construct_trusted(connection_members=[atom1, atom2])
+        ref_bond = Bond(connection_members=[atom1, atom2])
+
+        assert bond.name == ref_bond.name == "Bond"
+        assert bond.connection_members == ref_bond.connection_members
+        assert bond.bond_type is None
+        assert bond.equivalent_members() == ref_bond.equivalent_members()
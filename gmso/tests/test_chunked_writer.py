@@ -0,0 +1,74 @@
+import io
+
+import numpy as np
+import pytest
+
+from gmso.formats.chunked_writer import (
+    ChunkedWriter,
+    format_columns,
+    open_chunked,
+)
+from gmso.tests.base_test import BaseTest
+
+
+class FailingFile(io.StringIO):
+    def write(self, text):
+        raise OSError("disk full")
+
+
+class TestChunkedWriter(BaseTest):
+    @pytest.fixture
+    def columns(self):
+        rng = np.random.default_rng(seed=0)
+        n_rows = 1000
+        return [
+            range(1, n_rows + 1),
+            [f"C{idx % 7}" for idx in range(n_rows)],
+            rng.random(n_rows) * 100,
+        ]
+
+    def test_format_columns(self, columns):
+        ref = "".join(
+            f"{idx:<5d} {name:>4s} {value:10.5f}\n"
+            for idx, name, value in zip(*columns)
+        )
+        chunks = list(format_columns(columns, "%-5d %4s %10.5f\n", chunk_rows=300))
+        assert len(chunks) == 4
+        assert "".join(chunks) == ref
+
+        assert list(format_columns([[], []], "%d %d\n")) == []
+
+    @pytest.mark.parametrize("threaded", [False, True])
+    def test_write_chunks(self, columns, threaded):
+        out_file = io.StringIO()
+        with ChunkedWriter(out_file, chunk_size=100, threaded=threaded) as writer:
+            writer.write("header\n")
+            writer.write_columns(columns, "%d %s %.3f\n")
+            writer.writelines(["footer\n", "end\n"])
+
+        ref = "".join(format_columns(columns, "%d %s %.3f\n"))
+        assert out_file.getvalue() == "header\n" + ref + "footer\nend\n"
+
+    def test_buffered_until_chunk_size(self):
+        out_file = io.StringIO()
+        writer = ChunkedWriter(out_file, chunk_size=10)
+        writer.write("12345")
+        assert out_file.getvalue() == ""
+        writer.write("67890")
+        assert out_file.getvalue() == "1234567890"
+        writer.write("end")
+        writer.close()
+        assert out_file.getvalue() == "1234567890end"
+
+    def test_threaded_write_error(self):
+        writer = ChunkedWriter(FailingFile(), chunk_size=1, threaded=True)
+        writer.write("text")
+        with pytest.raises(OSError, match="disk full"):
+            writer.close()
+
+    def test_open_chunked(self, columns):
+        with open_chunked("columns.txt", threaded=True) as writer:
+            writer.write_columns(columns, "%d %s %.3f\n")
+
+        with open("columns.txt") as f:
+            assert f.read() == "".join(format_columns(columns, "%d %s %.3f\n"))
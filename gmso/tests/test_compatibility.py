@@ -0,0 +1,34 @@
+import unyt as u
+
+from gmso.core.atom_type import AtomType
+from gmso.lib.potential_templates import PotentialTemplateLibrary
+from gmso.tests.base_test import BaseTest
+from gmso.utils.compatibility import _check_single_potential
+
+
+class TestCompatibility(BaseTest):
+    def test_check_single_potential(self):
+        library = PotentialTemplateLibrary()
+        accepted_potentials = [
+            library["HarmonicBondPotential"],
+            library["LennardJonesPotential"],
+        ]
+        # An expanded expression with epsilon as a temperature
+        atom_type = AtomType(
+            name="A",
+            expression="4*epsilon*sigma**12/r**12 - 4*epsilon*sigma**6/r**6",
+            independent_variables="r",
+            parameters={"epsilon": 100 * u.K, "sigma": 0.3 * u.nm},
+        )
+        for _ in range(2):
+            assert _check_single_potential(atom_type, accepted_potentials) == {
+                atom_type: "LennardJonesPotential"
+            }
+
+        mie_type = AtomType(
+            name="B",
+            expression="4*epsilon*((sigma/r)**10 - (sigma/r)**6)",
+            independent_variables="r",
+            parameters={"epsilon": 1 * u.kJ / u.mol, "sigma": 0.3 * u.nm},
+        )
+        assert _check_single_potential(mie_type, accepted_potentials) is False
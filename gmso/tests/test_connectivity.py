@@ -1,11 +1,17 @@
 import mbuild as mb
+import networkx as nx
 
+from gmso.abc.abstract_site import Molecule
 from gmso.core.atom import Atom
 from gmso.core.bond import Bond
 from gmso.core.topology import Topology
 from gmso.external import from_mbuild
 from gmso.tests.base_test import BaseTest
-from gmso.utils.connectivity import generate_pairs_lists, identify_connections
+from gmso.utils.connectivity import (
+    _detect_connections,
+    generate_pairs_lists,
+    identify_connections,
+)
 
 
 class TestConnectivity(BaseTest):
@@ -168,6 +174,72 @@ class TestConnectivity(BaseTest):
                 for members_tuple in indices["impropers"]
             )
 
+    def test_matches_line_graph_connections(self):
+        # A fused ring system with a branch, including 3- and 4-membered rings
+        edges = [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5), (5, 2), (5, 6)]
+        edges += [(6, 7), (6, 8), (6, 9), (9, 10), (10, 11), (11, 9), (4, 12)]
+        top = Topology()
+        sites = [Atom(name=f"{idx}") for idx in range(13)]
+        for site in sites:
+            top.add_site(site, update_types=False)
+        for idx1, idx2 in edges:
+            top.add_connection(
+                Bond(connection_members=[sites[idx1], sites[idx2]]),
+                update_types=False,
+            )
+
+        graph = nx.Graph()
+        for bond in top.bonds:
+            graph.add_edge(*bond.connection_members)
+        line_graph = nx.line_graph(graph)
+
+        indices = identify_connections(top, index_only=True)
+        for key, type_ in [
+            ("angles", "angle"),
+            ("dihedrals", "dihedral"),
+            ("impropers", "improper"),
+        ]:
+            assert indices[key] == _detect_connections(line_graph, top, type_=type_)
+
+    def test_identify_connections_by_molecule(self):
+        top = Topology()
+        bonds = []
+        # Copies of two molecules with the same name but different bonds,
+        # with the sites of the copies interleaved in the topology
+        for number, edges in enumerate(
+            [[(0, 1), (1, 2), (2, 3)], [(0, 1), (0, 2), (0, 3)]] * 3
+        ):
+            sites = [
+                Atom(name="C", molecule=Molecule(name="butane", number=number))
+                for _ in range(4)
+            ]
+            bonds.extend(
+                Bond(connection_members=[sites[idx1], sites[idx2]])
+                for idx1, idx2 in edges
+            )
+            for site in sites[::-1] if number % 2 else sites:
+                top.add_site(site)
+        for bond in bonds:
+            top.add_connection(bond)
+
+        expected = identify_connections(top, index_only=True)
+        indices = identify_connections(top, index_only=True, by_molecule=True)
+        assert indices == expected
+        assert len(indices["dihedrals"]) == 3
+        assert len(indices["impropers"]) == 3
+
+        # A bond between two molecules falls back to the whole topology
+        top.add_connection(Bond(connection_members=[top.sites[0], top.sites[4]]))
+        assert identify_connections(
+            top, index_only=True, by_molecule=True
+        ) == identify_connections(top, index_only=True)
+
+    def test_identify_connections_by_molecule_empty(self):
+        expected = identify_connections(Topology(), index_only=True)
+        indices = identify_connections(Topology(), index_only=True, by_molecule=True)
+        assert indices == expected
+        assert all(connections == [] for connections in indices.values())
+
     def test_generate_pairs_list(self):
         # Methane with no 1-4 pair
         methane = mb.load("C", smiles=True)
@@ -205,3 +277,21 @@ class TestConnectivity(BaseTest):
 
         assert len(cyclopentane_top.dihedrals) == 45
         assert len(cyclopentane_top_pairs["pairs14"]) == 40
+
+    def test_generate_pairs_list_index_only(self):
+        cyclopentane = mb.load("C1CCCC1", smiles=True)
+        cyclopentane_top = from_mbuild(cyclopentane)
+        cyclopentane_top.identify_connections()
+        pairs = generate_pairs_lists(cyclopentane_top)
+        pairs_indices = generate_pairs_lists(cyclopentane_top, index_only=True)
+
+        bonded = {frozenset(bond.connection_members) for bond in cyclopentane_top.bonds}
+        for key in pairs:
+            assert pairs_indices[key].shape == (len(pairs[key]), 2)
+            assert pairs_indices[key].tolist() == [
+                [cyclopentane_top.get_index(site) for site in pair]
+                for pair in pairs[key]
+            ]
+            if key != "pairs12":
+                assert not bonded.intersection(frozenset(pair) for pair in pairs[key])
+        assert len(pairs["pairs13"]) == 30
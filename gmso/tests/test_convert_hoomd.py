@@ -0,0 +1,135 @@
+import itertools
+
+import numpy as np
+import pytest
+import unyt as u
+
+from gmso.core.atom import Atom
+from gmso.core.atom_type import AtomType
+from gmso.core.bond import Bond
+from gmso.core.pairpotential_type import PairPotentialType
+from gmso.core.topology import Topology
+from gmso.external.convert_hoomd import (
+    _lj_mixing_matrices,
+    _scale_special_pairs,
+    _special_pair_types,
+)
+from gmso.lib.potential_templates import PotentialTemplateLibrary
+from gmso.tests.base_test import BaseTest
+from gmso.utils.connectivity import generate_pairs_lists
+
+
+class TestConvertHoomd(BaseTest):
+    """Tests of the hoomd conversion helpers which do not need hoomd."""
+
+    @pytest.fixture
+    def lj_top(self):
+        lj = PotentialTemplateLibrary()["LennardJonesPotential"]
+        atom_types = [
+            AtomType.from_template(
+                lj,
+                parameters={
+                    "epsilon": epsilon * u.kJ / u.mol,
+                    "sigma": sigma * u.nm,
+                },
+                name=name,
+                atomclass=atomclass,
+            )
+            for name, atomclass, epsilon, sigma in [
+                ("CH3", "CT", 0.815, 0.375),
+                ("CH2", "CT", 0.382, 0.395),
+                ("OH", "OH", 0.773, 0.302),
+            ]
+        ]
+
+        top = Topology()
+        sites = [
+            Atom(name=atom_type.name, atom_type=atom_type)
+            for atom_type in atom_types + atom_types[1::-1]
+        ]
+        for site in sites:
+            top.add_site(site)
+        for site1, site2 in zip(sites[:-1], sites[1:]):
+            top.add_connection(Bond(connection_members=[site1, site2]))
+        top.identify_connections()
+
+        for member_types, epsilon, sigma in [
+            (("CH3", "OH"), 0.1 * u.kcal / u.mol, 3.5 * u.angstrom),
+            (("CT", "CT"), 0.5 * u.kJ / u.mol, 0.4 * u.nm),
+        ]:
+            top.add_pairpotentialtype(
+                PairPotentialType(
+                    name="-".join(member_types),
+                    expression=lj.expression,
+                    independent_variables=lj.independent_variables,
+                    parameters={"epsilon": epsilon, "sigma": sigma},
+                    member_types=member_types,
+                )
+            )
+        return top, atom_types
+
+    @pytest.mark.parametrize("combining_rule", ["lorentz", "geometric"])
+    def test_lj_mixing_matrices(self, lj_top, combining_rule):
+        top, atom_types = lj_top
+        epsilons, sigmas = _lj_mixing_matrices(top, atom_types, combining_rule)
+
+        for i, j in itertools.product(range(len(atom_types)), repeat=2):
+            atype1, atype2 = atom_types[i], atom_types[j]
+            epsilon1 = atype1.parameters["epsilon"].to_value(u.kJ / u.mol)
+            epsilon2 = atype2.parameters["epsilon"].to_value(u.kJ / u.mol)
+            sigma1 = atype1.parameters["sigma"].to_value(u.nm)
+            sigma2 = atype2.parameters["sigma"].to_value(u.nm)
+            epsilon = np.sqrt(epsilon1 * epsilon2)
+            if combining_rule == "lorentz":
+                sigma = (sigma1 + sigma2) / 2
+            else:
+                sigma = np.sqrt(sigma1 * sigma2)
+
+            for pairpotential_type in top.pairpotential_types:
+                members = set(pairpotential_type.member_types)
+                if members in (
+                    {atype1.name, atype2.name},
+                    {atype1.atomclass, atype2.atomclass},
+                ):
+                    parameters = pairpotential_type.parameters
+                    epsilon = parameters["epsilon"].to_value(u.kJ / u.mol)
+                    sigma = parameters["sigma"].to_value(u.nm)
+
+            assert epsilons[i, j] == pytest.approx(epsilon)
+            assert sigmas[i, j] == pytest.approx(sigma)
+
+        assert epsilons[0, 2] == pytest.approx(0.4184)
+        assert sigmas[1, 1] == pytest.approx(0.4)
+
+        with pytest.raises(ValueError, match="Invalid combining rule"):
+            _lj_mixing_matrices(top, atom_types, "arithmetic")
+
+    def test_special_pair_types(self, lj_top):
+        top, _ = lj_top
+        special_pairs = _special_pair_types(top)
+
+        pairs_dict = generate_pairs_lists(top)
+        assert len(special_pairs) == len(pairs_dict)
+        for pair_types, pairs in zip(special_pairs, pairs_dict.values()):
+            ref = list()
+            for pair in pairs:
+                pair_type = tuple(sorted(site.atom_type.name for site in pair))
+                if pair_type not in ref:
+                    ref.append(pair_type)
+            assert pair_types == ref
+        assert all(special_pairs)
+
+    def test_scale_special_pairs(self, lj_top):
+        top, _ = lj_top
+        special_pairs = _special_pair_types(top)
+
+        for scaling_factors in [(0.0, 0.0, 0.5), (1.0, 0.5, 0.25), (0.0, 0.0, 0.0)]:
+            ref = dict()
+            for scaling_factor, pairs in zip(
+                scaling_factors, generate_pairs_lists(top).values()
+            ):
+                if scaling_factor:
+                    for pair in pairs:
+                        pair_type = tuple(sorted(site.atom_type.name for site in pair))
+                        ref[pair_type] = scaling_factor
+            assert _scale_special_pairs(special_pairs, scaling_factors) == ref
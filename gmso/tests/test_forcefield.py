@@ -4,6 +4,7 @@ import unyt as u
 from sympy import sympify
 from unyt.testing import assert_allclose_units
 
+from gmso.core.dihedral_type import DihedralType
 from gmso.core.forcefield import ForceField
 from gmso.core.improper_type import ImproperType
 from gmso.exceptions import (
@@ -567,6 +568,37 @@ class TestForceField(BaseTest):
         assert imp1.name == imp2.name
         assert imp1 is imp2
 
+    def test_forcefield_lookup_cache(self):
+        ff = ForceField()
+        ff.dihedral_types = {
+            "*~CT~CT~*": DihedralType(name="wildcard"),
+            "HC~CT~CT~*": DihedralType(name="partial"),
+        }
+        dih, order = ff.get_potential(
+            "dihedral_type", ["OH", "CT", "CT", "HC"], return_match_order=True
+        )
+        assert dih.name == "partial"
+        assert order == (3, 2, 1, 0)
+        ff.get_potential("dihedral_type", ["OH", "CT", "CT", "HC"])
+        assert ff.get_potential("dihedral_type", ["OH", "CT", "CT", "OH"]).name == (
+            "wildcard"
+        )
+        info = ff.lookup_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+        ff.dihedral_types["HC~CT~CT~*"] = DihedralType(name="replaced")
+        assert ff.get_potential("dihedral_type", ["OH", "CT", "CT", "HC"]).name == (
+            "replaced"
+        )
+        ff.dihedral_types.pop("HC~CT~CT~*")
+        assert ff.get_potential("dihedral_type", ["OH", "CT", "CT", "HC"]).name == (
+            "wildcard"
+        )
+        assert ff.lookup_cache_info().misses == 4
+
+        ff.clear_lookup_cache()
+        assert ff.lookup_cache_info() == (0, 0, ff.lookup_cache_maxsize, 0)
+
     def test_write_xml(self, opls_ethane_foyer):
         opls_ethane_foyer.to_xml("test_xml_writer.xml")
         reloaded_xml = ForceField("test_xml_writer.xml")
@@ -7,7 +7,7 @@ from gmso import Topology
 from gmso.core.atom import Atom
 from gmso.core.box import Box
 from gmso.external.convert_parmed import from_parmed
-from gmso.formats.gro import _prepare_atoms
+from gmso.formats.gro import _prepare_atoms, iter_gro_frames
 from gmso.tests.base_test import BaseTest
 from gmso.tests.utils import get_path
 from gmso.utils.io import get_fn, has_mbuild, has_parmed, import_
@@ -44,6 +44,38 @@ class TestGro(BaseTest):
         with pytest.raises(ValueError):
             Topology.load(get_fn("too_many_atoms.gro"))
 
+    def test_read_empty_gro(self):
+        open("empty.gro", "w").close()
+        with pytest.raises(ValueError, match="No atoms were found"):
+            Topology.load("empty.gro")
+
+    def test_read_gro_multiple_frames(self):
+        with open(get_fn("350-waters.gro")) as gro_file:
+            frame = gro_file.read()
+        second_frame = frame.replace("Generic title", "Second frame").replace(
+            "   2.20866   2.20866   2.20866", "   3.00000   3.00000   3.00000"
+        )
+        with open("two-frames.gro", "w") as gro_file:
+            gro_file.write(frame + second_frame)
+
+        with pytest.warns(UserWarning, match="more than one frame"):
+            top = Topology.load("two-frames.gro")
+        assert top.n_sites == 1050
+
+        frames = list(iter_gro_frames("two-frames.gro", velocities=True))
+        assert [frame.title for frame in frames] == ["Generic title", "Second frame"]
+        for frame in frames:
+            assert frame.positions.shape == (1050, 3)
+            assert frame.velocities.shape == (1050, 3)
+            assert_allclose_units(frame.positions, top.positions)
+        assert_allclose_units(
+            frames[0].velocities[0], [0.1574, -0.2173, -0.2147] * u.nm / u.ps
+        )
+        assert_allclose_units(frames[1].box.lengths, 3 * np.ones(3) * u.nm)
+
+        frame = next(iter_gro_frames(get_fn("350-waters.gro")))
+        assert frame.velocities is None
+
     def test_write_gro(self):
         top = from_parmed(pmd.load_file(get_fn("ethane.gro"), structure=True))
         top.save("out.gro")
@@ -7,6 +7,7 @@ from gmso.external.convert_mbuild import from_mbuild
 from gmso.external.convert_parmed import from_parmed
 from gmso.tests.base_test import BaseTest
 from gmso.utils.io import get_fn, has_gsd, has_parmed, import_
+from gmso.utils.sorting import sort_connection_members
 
 if has_parmed:
     pmd = import_("parmed")
@@ -40,3 +41,29 @@ class TestGsd(BaseTest):
         top = from_parmed(pmd.load_file(get_fn("ethane.top"), xyz=get_fn("ethane.gro")))
         top.box.angles = u.degree * [90, 90, 120]
         top.save("out.gsd")
+
+    def test_write_gsd_groups(self):
+        comp = mb.load("CCCC", smiles=True)
+        system = mb.fill_box(comp, n_compounds=3, density=100)
+        top = from_mbuild(system)
+        top.identify_connections()
+        top.save("out.gsd")
+        with gsd.hoomd.open("out.gsd") as traj:
+            snap = traj[0]
+            for connections, group in [
+                (top.bonds, snap.bonds),
+                (top.angles, snap.angles),
+                (top.dihedrals, snap.dihedrals),
+            ]:
+                assert group.N == len(connections)
+                for connection, typeid, members in zip(
+                    connections, group.typeid, group.group
+                ):
+                    sorted_members = sort_connection_members(connection, "name")
+                    assert group.types[typeid] == "-".join(
+                        site.name for site in sorted_members
+                    )
+                    indices = [top.get_index(site) for site in sorted_members]
+                    if connection in top.bonds:
+                        indices = sorted(indices)
+                    assert list(members) == indices
@@ -244,6 +244,38 @@ class TestLammpsWriter(BaseTest):
         assert read.n_dihedrals == 9
         assert len(read.dihedral_types(filter_by=pfilter)) == 1
 
+    def test_read_shared_types(self, filename=get_path("typed_ethane.lammps")):
+        read = gmso.Topology.load(filename)
+
+        assert read.n_sites == 8
+        assert len(read.atom_types) == 2
+        assert len(read.bond_types) == 2
+        assert len(read.dihedral_types) == 1
+        assert [site.element.symbol for site in read.sites[:2]] == ["C", "H"]
+        assert read.sites[0].atom_type is read.sites[4].atom_type
+        assert_allclose_units(
+            read.sites[1].position,
+            u.unyt_array([-1.07, -1.4, 0.0], u.angstrom),
+            rtol=1e-5,
+            atol=1e-8,
+        )
+        bond_members = read.bonds[3].connection_members
+        assert [read.get_index(site) for site in bond_members] == [0, 4]
+
+    def test_read_header_comments(self):
+        with open(get_path("typed_ethane.lammps"), "r") as f:
+            lines = f.readlines()
+        for i, line in enumerate(lines[:20]):
+            if line.split()[1:2] in (["atoms"], ["bonds"], ["xlo"]):
+                lines[i] = line.rstrip() + "  # commented\n"
+        with open("commented.lammps", "w") as f:
+            f.writelines(lines)
+
+        read = gmso.Topology.load("commented.lammps")
+        assert read.n_sites == 8
+        assert read.n_bonds == 7
+        assert_allclose_units(read.box.lengths, [7.14, 7.938, 6.646] * u.angstrom)
+
     # TODO: would be good to create a library of molecules and styles to test
     # Test potential styles that are directly comparable to ParmEd writers.
     def test_lammps_vs_parmed_by_mol(self, typed_ethane):
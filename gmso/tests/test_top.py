@@ -149,6 +149,16 @@ class TestTop(BaseTest):
         assert struct.defaults.fudgeLJ == 0.5
         assert struct.defaults.fudgeQQ == 0.5
 
+    def test_molecule_pairs(self, typed_benzene_ua_system):
+        typed_benzene_ua_system.save("benzene_ua.top")
+        struct = pmd.load_file("benzene_ua.top")
+
+        assert len(struct.bonds) == 6 * 5
+        assert len(struct.adjusts) == 3 * 5
+        assert all(
+            adjust.atom1.residue is adjust.atom2.residue for adjust in struct.adjusts
+        )
+
     def test_settles(self, typed_tip3p_rigid_system):
         typed_tip3p_rigid_system.save("settles.top", overwrite=True)
 
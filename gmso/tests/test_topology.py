@@ -6,6 +6,7 @@ import pytest
 import unyt as u
 from unyt.testing import assert_allclose_units
 
+from gmso.abc.gmso_base import FIELD_OBSERVERS
 from gmso.core.angle import Angle
 from gmso.core.angle_type import AngleType
 from gmso.core.atom import Atom
@@ -121,6 +122,79 @@ class TestTopology(BaseTest):
         assert top.positions.units == u.nm
         assert isinstance(top.positions, u.unyt_array)
 
+    def test_positions_buffer(self):
+        top = Topology()
+        for j in range(3):
+            top.add_site(Atom(name=f"atom{j}", position=u.nm * [j, j, j]))
+
+        site_position = top.sites[0].position
+        positions = top.positions
+        assert top.sites[0].position is site_position
+        assert_allclose_units(positions[2], u.nm * [2, 2, 2])
+        with pytest.raises(ValueError):
+            positions[0, 0] = 1.0
+
+        top.positions = u.angstrom * np.ones((3, 3))
+        assert_allclose_units(top.sites[2].position, u.nm * [0.1, 0.1, 0.1])
+        positions = top.positions
+        assert positions is top.positions
+        site_position = top.sites[0].position
+        site_position[0] = 5 * u.nm
+        assert_allclose_units(positions[0], u.nm * [5, 0.1, 0.1])
+
+        top.positions = u.nm * np.zeros((3, 3))
+        assert top.sites[0].position is site_position
+        assert_allclose_units(site_position, u.nm * [0, 0, 0])
+
+        top.sites[1].position = u.nm * [2, 2, 2]
+        assert_allclose_units(top.positions[1], u.nm * [2, 2, 2])
+
+        top.add_site(Atom(name="atom3", position=u.nm * [3, 3, 3]))
+        assert top.positions.shape == (4, 3)
+
+        with pytest.raises(ValueError):
+            top.positions = u.nm * np.ones((2, 3))
+
+    def test_positions_dimensionless_shared(self):
+        top = Topology()
+        for j in range(4):
+            top.add_site(
+                Atom(name=f"atom{j}", position=u.unyt_array([j, j, j], "dimensionless"))
+            )
+        assert_allclose_units(top.positions[3], u.nm * [3, 3, 3])
+        assert top.sites[3].position.units == u.dimensionless
+
+        top.positions = u.unyt_array(np.ones((4, 3)), "dimensionless")
+        assert top.positions.units == u.dimensionless
+        assert top.sites[3].position.units == u.dimensionless
+
+        subtop = Topology()
+        subtop.add_sites(top.sites[:2])
+        subtop.positions = u.nm * np.zeros((2, 3))
+        site_positions = [site.position for site in top.sites]
+        for _ in range(2):
+            assert_allclose_units(top.positions[1:3], u.nm * [[0, 0, 0], [1, 1, 1]])
+            assert_allclose_units(subtop.positions, u.nm * np.zeros((2, 3)))
+        assert all(
+            site.position is position
+            for site, position in zip(top.sites, site_positions)
+        )
+
+    def test_charges_masses(self):
+        top = Topology()
+        atom_type = AtomType(charge=1 * u.elementary_charge, mass=12 * u.amu)
+        top.add_site(Atom(name="typed", atom_type=atom_type))
+        top.add_site(Atom(name="charged", charge=-1 * u.elementary_charge))
+
+        assert_allclose_units(top.charges, [1, -1] * top.charges.units)
+        assert str(top.charges.units) == "elementary_charge"
+        assert np.isnan(top.masses[1])
+
+        atom_type.charge = 0.5 * u.elementary_charge
+        top.sites[1].mass = 1 * u.amu
+        assert_allclose_units(top.charges[0], 0.5 * top.charges.units)
+        assert_allclose_units(top.masses, [12, 1] * u.amu)
+
     def test_eq_types(self, top, box):
         assert top != box
 
@@ -605,6 +679,52 @@ class TestTopology(BaseTest):
             == 5
         )
 
+    def test_topology_get_index_potential_updates(self):
+        top = Topology()
+        atoms = [Atom(name=f"atom_{j}") for j in range(4)]
+        atom_types = [AtomType(name=f"type_{j}") for j in range(4)]
+        for atom, atom_type in zip(atoms, atom_types):
+            atom.atom_type = atom_type
+            top.add_site(atom)
+        bond = Bond(connection_members=atoms[:2], bond_type=BondType())
+        top.add_connection(bond)
+
+        assert top.get_index(atom_types[2]) == 2
+        assert top.get_index(bond.bond_type) == 0
+
+        atoms[0].atom_type = atom_types[3]
+        assert top.get_index(atom_types[0]) is None
+        assert top.get_index(atom_types[3]) == 0
+        assert top.get_index(atom_types[2]) == 2
+
+        top.remove_site(atoms[1])
+        assert top.get_index(atom_types[2]) == 1
+        assert top.get_index(bond.bond_type) is None
+
+        new_atom = Atom(name="new_atom", atom_type=AtomType(name="new_type"))
+        top.add_site(new_atom)
+        assert top.get_index(new_atom.atom_type) == 2
+
+    def test_topology_get_index_while_typing(self):
+        top = Topology()
+        atoms = [Atom(name=f"atom_{j}") for j in range(12)]
+        top.add_sites(atoms)
+        atom_types = [AtomType(name=f"type_{j}") for j in range(4)]
+        other_top = Topology()
+        other_top.add_site(Atom(name="other", atom_type=atom_types[0]))
+
+        for j, atom in enumerate(atoms):
+            atom.atom_type = atom_types[j % 3]
+            for atom_type in atom_types:
+                assert top.get_index(atom_type) == top.atom_types.index(atom_type)
+            other_top.sites[0].atom_type = atom_types[j % 4]
+        assert top._potential_positions["atom_types"] is not None
+
+        for j in [5, 0, 4, 1, 3, 2]:
+            atoms[j].atom_type = atom_types[3]
+            for atom_type in atom_types:
+                assert top.get_index(atom_type) == top.atom_types.index(atom_type)
+
     def test_topology_get_bonds_for(self, typed_methylnitroaniline):
         site = list(typed_methylnitroaniline.sites)[0]
         converted_bonds_list = typed_methylnitroaniline._get_bonds_for(site)
@@ -879,6 +999,50 @@ class TestTopology(BaseTest):
             for site in labeled_top.iter_sites_by_molecule(molecule_name):
                 assert site.molecule.name == molecule_name
 
+    def test_iter_sites_label_updates(self, labeled_top):
+        sites = list(labeled_top.iter_sites("molecule", ("MY_MOL_EVEN", 2)))
+        assert len(sites) == 3
+
+        sites[0].molecule = ("MY_MOL_NEW", 0)
+        assert len(list(labeled_top.iter_sites("molecule", ("MY_MOL_EVEN", 2)))) == 2
+        assert list(labeled_top.iter_sites_by_molecule("MY_MOL_NEW")) == [sites[0]]
+        assert "MY_MOL_NEW" in labeled_top.unique_site_labels(
+            "molecule", name_only=True
+        )
+
+        molecule = sites[0].molecule
+        molecule.isrigid = True
+        assert list(labeled_top.iter_sites("molecule", molecule)) == [sites[0]]
+        assert list(labeled_top.iter_sites("molecule", ("MY_MOL_NEW", 0))) == []
+
+        new_site = Atom(name="new_site", group="MY_NEW_GROUP")
+        labeled_top.add_site(new_site)
+        assert list(labeled_top.iter_sites("group", "MY_NEW_GROUP")) == [new_site]
+        labeled_top.remove_site(new_site)
+        assert list(labeled_top.iter_sites("group", "MY_NEW_GROUP")) == []
+
+    def test_get_connections_by_label(self):
+        top = Topology()
+        atoms = [Atom(name=f"atom_{j}", molecule=("MOL", j // 3)) for j in range(6)]
+        bonds = [
+            top.add_connection(Bond(connection_members=[atoms[j], atoms[j + 1]]))
+            for j in range(5)
+        ]
+
+        assert top._get_connections_by_label("bonds", "molecule", "MOL") == bonds
+        assert top._get_connections_by_label(
+            "bonds", "molecule", atoms[0].molecule
+        ) == [bonds[0], bonds[1]]
+
+        top.remove_connection(bonds[0])
+        atoms[2].molecule = ("MOL", 1)
+        assert (
+            top._get_connections_by_label("bonds", "molecule", atoms[0].molecule) == []
+        )
+        assert top._get_connections_by_label(
+            "bonds", "molecule", atoms[3].molecule
+        ) == [bonds[2], bonds[3], bonds[4]]
+
     @pytest.mark.parametrize(
         "connections",
         ["bonds", "angles", "dihedrals", "impropers"],
@@ -920,6 +1084,136 @@ class TestTopology(BaseTest):
             for conn in top.iter_connections_by_site(site):
                 pass
 
+    def test_iter_connections_by_site_updates(self):
+        top = Topology()
+        atoms = [Atom(name=f"atom_{j}") for j in range(4)]
+        bonds = [
+            top.add_connection(Bond(connection_members=[atoms[j], atoms[j + 1]]))
+            for j in range(3)
+        ]
+        angle = top.add_connection(Angle(connection_members=atoms[:3]))
+
+        assert list(top.iter_connections_by_site(atoms[1])) == [
+            bonds[0],
+            bonds[1],
+            angle,
+        ]
+        assert top._get_angles_for(atoms[3]) == []
+
+        top.remove_connection(bonds[1])
+        assert top._get_bonds_for(atoms[2]) == [bonds[2]]
+        new_bond = top.add_connection(Bond(connection_members=[atoms[1], atoms[2]]))
+        assert new_bond is not bonds[1]
+        assert top._get_bonds_for(atoms[2]) == [bonds[2], new_bond]
+
+        angle.connection_members = [atoms[1], atoms[2], atoms[3]]
+        assert top._get_angles_for(atoms[0]) == []
+        assert top._get_angles_for(atoms[3]) == [angle]
+
+        top.remove_site(atoms[2])
+        assert top.n_connections == 1
+        assert list(top.iter_connections_by_site(atoms[1])) == [bonds[0]]
+
+    def test_add_sites_connections(self):
+        top = Topology()
+        atoms = [Atom(name=f"atom{idx}") for idx in range(4)]
+        top.add_sites(atoms[:2])
+        assert top.sites == tuple(atoms[:2])
+        assert not top.is_updated
+
+        bonds = [
+            Bond(connection_members=[atoms[idx], atoms[idx + 1]]) for idx in range(3)
+        ]
+        added = top.add_connections(bonds, validate=False)
+        assert added == bonds
+        assert top.sites == tuple(atoms)
+        assert top.bonds == tuple(bonds)
+        assert list(top.iter_connections_by_site(atoms[1])) == bonds[:2]
+
+        # Connections added without validation are still found as equivalents
+        with pytest.warns(UserWarning):
+            duplicate = top.add_connection(
+                Bond(connection_members=[atoms[1], atoms[0]])
+            )
+        assert duplicate is bonds[0]
+
+        angle = Angle(connection_members=atoms[:3])
+        with pytest.warns(UserWarning):
+            added = top.add_connections(
+                [angle, Angle(connection_members=atoms[2::-1])], update_types=True
+            )
+        assert added == [angle, angle]
+        assert top.n_angles == 1
+        assert top.is_updated
+
+    def test_potentials_count_updates(self):
+        top = Topology()
+        atom_type = AtomType(name="A")
+        atoms = [Atom(name=f"atom_{j}", atom_type=atom_type) for j in range(3)]
+        bonds = [
+            top.add_connection(Bond(connection_members=[atoms[j], atoms[j + 1]]))
+            for j in range(2)
+        ]
+        assert top.is_typed()
+        assert top._potentials_count["atom_types"] == 1
+        assert top.is_fully_typed(group="sites")
+        assert not top.is_fully_typed(group="bonds")
+
+        for bond in bonds:
+            bond.bond_type = BondType(name="AA")
+        atoms[0].atom_type = AtomType(name="B")
+        top.update_topology()
+        assert top._potentials_count["atom_types"] == 2
+        assert top._potentials_count["bond_types"] == 2
+        assert top.is_fully_typed()
+
+        copied_top = deepcopy(top)
+        copied_top.sites[1].atom_type = None
+        assert not copied_top.is_fully_typed(group="sites")
+        assert top.is_fully_typed(group="sites")
+
+        top.remove_site(atoms[0])
+        top.update_topology()
+        assert top._potentials_count["atom_types"] == 1
+        assert top._potentials_count["bond_types"] == 1
+
+        for atom in atoms[1:]:
+            atom.atom_type = None
+        bonds[1].bond_type = None
+        assert not top.is_typed()
+        assert top._potentials_count == {
+            "atom_types": 0,
+            "bond_types": 0,
+            "angle_types": 0,
+            "dihedral_types": 0,
+            "improper_types": 0,
+            "pairpotential_types": 0,
+        }
+
+    def test_potentials_count_unrelated_topologies(self):
+        top = Topology()
+        atoms = [Atom(name=f"atom_{j}") for j in range(3)]
+        top.add_sites(atoms)
+        subtop = Topology()
+        subtop.add_site(atoms[0])
+        others = [Topology() for _ in range(100)]
+        for other in others:
+            other.add_site(Atom(name="other"))
+
+        for atom in atoms:
+            atom.atom_type = AtomType(name="A")
+        observers = {ref() for ref in FIELD_OBSERVERS["potentials"][atoms[0]]}
+        assert observers == {top, subtop}
+        assert top.is_fully_typed(group="sites")
+        assert subtop.is_fully_typed(group="sites")
+        assert not any(other.is_typed() for other in others)
+
+        subtop.remove_site(atoms[0])
+        atoms[0].atom_type = None
+        assert not top.is_fully_typed(group="sites")
+        assert top._n_typed["atom_types"] == 2
+        assert subtop._n_typed["atom_types"] == 0
+
     def test_write_forcefield(self, typed_water_system, typed_benzene_aa_system):
         forcefield = typed_water_system.get_forcefield()
         assert "opls_111" in forcefield.atom_types
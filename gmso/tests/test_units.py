@@ -1,11 +1,14 @@
 import re
 
+import numpy as np
 import pytest
 import unyt as u
 
+from gmso.core.dihedral_type import DihedralType
+from gmso.lib.potential_templates import PotentialTemplateLibrary
 from gmso.tests.base_test import BaseTest
 from gmso.utils.misc import unyt_to_hashable
-from gmso.utils.units import LAMMPS_UnitSystems
+from gmso.utils.units import LAMMPS_UnitSystems, convert_params_units
 
 
 class TestUnitHandling(BaseTest):
@@ -69,6 +72,25 @@ class TestUnitHandling(BaseTest):
         outStr = real_usys.convert_parameter(parameter, n_decimals=n_decimals)
         assert outStr[::-1].find(".") == n_decimals
 
+    def test_convert_values(self, real_usys):
+        values = np.array([0.001, 1.0, 2.5])
+        converted = real_usys.convert_values(values, u.Unit("nm"))
+        assert np.allclose(converted, [0.01, 10.0, 25.0])
+        for value, convertedValue in zip(values, converted):
+            assert f"{convertedValue:.6f}" == real_usys.convert_parameter(
+                value * u.nm, n_decimals=6
+            )
+
+        lj_usys = LAMMPS_UnitSystems("lj")
+        cfactorDict = {
+            "energy": 0.276144 * u.kJ / u.mol,
+            "length": 0.35 * u.nm,
+            "charge": 1 * u.coulomb,
+            "mass": 12.011 * u.amu,
+        }
+        converted = lj_usys.convert_values(values, u.Unit("nm"), cfactorDict)
+        assert np.allclose(converted, values / 0.35)
+
     def test_unitsystem_setup(self, real_usys):
         assert real_usys.usystem.name == "lammps_real"
 
@@ -220,3 +242,50 @@ class TestUnitHandling(BaseTest):
         lj_usys = LAMMPS_UnitSystems("lj")
         outStr = write_out_parameter_and_units("x", x, lj_usys)
         assert outStr == "x (dimensionless)"
+
+    def test_convert_params_units(self):
+        template = PotentialTemplateLibrary()["PeriodicTorsionPotential"]
+        dihedral_types = [
+            DihedralType(
+                expression=template.expression,
+                independent_variables=template.independent_variables,
+                parameters={
+                    "k": 4.184 * u.kJ / u.mol,
+                    "phi_eq": 180 * u.degree,
+                    "n": 2 * u.dimensionless,
+                },
+            ),
+            DihedralType(
+                expression=template.expression,
+                independent_variables=template.independent_variables,
+                parameters={
+                    "k": [1, 2] * u.kcal / u.mol,
+                    "phi_eq": [0, 3.14159] * u.radian,
+                    "n": [1, 2] * u.dimensionless,
+                },
+            ),
+        ]
+        base_units = {
+            "energy": 4.184 * u.kJ / u.mol,
+            "length": 0.1 * u.nm,
+            "mass": 1 * u.amu,
+            "angle": 1 * u.radian,
+            "dimensionless": 1 * u.dimensionless,
+        }
+        expected_units_dim = {
+            "k": "energy",
+            "phi_eq": "angle",
+            "n": "dimensionless",
+        }
+        converted = convert_params_units(dihedral_types, expected_units_dim, base_units)
+        assert converted == dihedral_types
+
+        scalar_params = dihedral_types[0].parameters
+        assert isinstance(scalar_params["k"], u.unyt_quantity)
+        assert u.allclose_units(scalar_params["k"], 1 * u.kcal / u.mol)
+        assert scalar_params["k"].to_value() == pytest.approx(1)
+        assert scalar_params["phi_eq"].to_value() == pytest.approx(3.14159, 1e-5)
+
+        array_params = dihedral_types[1].parameters
+        assert array_params["k"].to_value() == pytest.approx([1, 2])
+        assert array_params["n"].to_value() == pytest.approx([1, 2])
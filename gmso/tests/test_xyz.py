@@ -3,6 +3,7 @@ import unyt as u
 from unyt.testing import assert_allclose_units
 
 from gmso import Topology
+from gmso.formats.xyz import iter_xyz_frames
 from gmso.tests.base_test import BaseTest
 from gmso.utils.io import get_fn
 
@@ -43,3 +44,21 @@ class TestXYZ(BaseTest):
         assert_allclose_units(
             original_top.positions, new_top.positions, rtol=1e-5, atol=1e-8
         )
+
+    def test_read_xyz_multiple_frames(self):
+        with open(get_fn("ethane.xyz")) as f:
+            frame = f.read()
+        with open("two-frames.xyz", "w") as f:
+            f.write(frame + frame)
+
+        with pytest.warns(UserWarning, match="more than one frame"):
+            top = Topology.load("two-frames.xyz")
+        assert top.n_sites == 8
+
+        frames = list(iter_xyz_frames("two-frames.xyz"))
+        assert len(frames) == 2
+        for frame in frames:
+            assert len(frame.names) == 8
+            assert frame.positions.shape == (8, 3)
+            assert frame.positions.units == u.nm
+            assert_allclose_units(frame.positions, top.positions, rtol=1e-5, atol=1e-8)
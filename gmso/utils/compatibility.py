@@ -1,5 +1,7 @@
 """Determine if the parametrized gmso.topology can be written to an engine."""
 
+from functools import lru_cache
+
 import symengine
 import sympy
 
@@ -83,35 +85,57 @@ def check_compatibility(
 
 def _check_single_potential(potential, accepted_potentials):
     """Check to see if a single given potential is in the list of accepted potentials."""
-    ind_var = potential.independent_variables
-    u_dims = [
-        symplify_str_eqn(para.units.dimensions)
-        for para in potential.parameters.values()
-    ]
-    for i in range(len(u_dims)):
-        if "temperature" in u_dims[i]:
-            energy_dimsStr = str(replace_temp_with_energy(u_dims[i]))
-            energy_dimsStr = symplify_str_eqn(energy_dimsStr)
-            u_dims[i] = energy_dimsStr
-    u_dims = set(u_dims)
+    signature = _potential_signature(potential)
     for ref in accepted_potentials:
-        ref_ind_var = ref.independent_variables
-        ref_u_dims = set(
-            map(symplify_str_eqn, ref.expected_parameters_dimensions.values())
-        )
-        if len(ind_var) == len(ref_ind_var) and u_dims == ref_u_dims:
-            if str(ref.expression) == str(potential.expression):
-                return {potential: ref.name}
-            else:
-                if (
-                    symengine.expand(ref.expression - potential.expression)
-                    # sympy.simplify(ref.expression - potential.expression)
-                    == 0
-                ):
-                    return {potential: ref.name}
+        if signature == _template_signature(ref) and _equivalent_expressions(
+            ref.expression, potential.expression
+        ):
+            return {potential: ref.name}
     return False
 
 
+def _potential_signature(potential):
+    """Return the number of independent variables and parameter dimensions of a potential."""
+    return (
+        len(potential.independent_variables),
+        frozenset(
+            _canonical_dimensions(para.units.dimensions, temperature_as_energy=True)
+            for para in potential.parameters.values()
+        ),
+    )
+
+
+def _template_signature(template):
+    """Return the number of independent variables and parameter dimensions of a template."""
+    return (
+        len(template.independent_variables),
+        frozenset(
+            _canonical_dimensions(dimensions)
+            for dimensions in template.expected_parameters_dimensions.values()
+        ),
+    )
+
+
+@lru_cache(maxsize=128)
+def _canonical_dimensions(dimensions, temperature_as_energy=False):
+    """Return the expanded string of a dimension expression.
+
+    If temperature_as_energy is True, temperature is tracked as an energy.
+    """
+    dimensions = symplify_str_eqn(dimensions)
+    if temperature_as_energy and "temperature" in dimensions:
+        dimensions = symplify_str_eqn(str(replace_temp_with_energy(dimensions)))
+    return dimensions
+
+
+@lru_cache(maxsize=128)
+def _equivalent_expressions(ref_expression, expression):
+    """Check if two sympy expressions expand to the same expression."""
+    if str(ref_expression) == str(expression):
+        return True
+    return symengine.expand(ref_expression - expression) == 0
+
+
 def replace_temp_with_energy(dimsStr):
     """Track energy dimensions instead of temperature dimensions."""
     dimsStr = dimsStr.replace("(temperature)", "(length)**2*(mass)/(time)**2")
@@ -1,8 +1,8 @@
 """Module supporting various connectivity methods and operations."""
 
 import networkx as nx
+import numpy as np
 from boltons.setutils import IndexedSet
-from networkx.algorithms import shortest_path_length
 
 from gmso.core.angle import Angle
 from gmso.core.dihedral import Dihedral
@@ -17,7 +17,7 @@ EDGES = {
 }
 
 
-def identify_connections(top, index_only=False):
+def identify_connections(top, index_only=False, by_molecule=False):
     """Identify all possible connections within a topology.
 
     Parameters
@@ -27,33 +27,51 @@ def identify_connections(top, index_only=False):
     index_only: bool, default=False
         If True, return atom indices that would form the actual connections
         rather than adding the connections to the topology
-
-    Notes: We are using networkx graph matching to match
-    the topology's bonding graph to smaller sub-graphs that
-    correspond to an angle, dihedral, improper etc.
-    The matching is actually done via the line-graph of the
-    topology bonding graph.
-    [ahy]: IIRC we chose to use line-graph as opposed the actual graph
-    because the graph-matching (on the actual graph) would miss certain
-    angles/dihedrals/impropers if there were cycles or bridge bonds
-    that would effectively hide the angle/dihedral/dihedral
+    by_molecule: bool, default=False
+        If True, identify the connections of every unique molecule once and
+        replicate them over its copies. Molecules are the sites sharing a
+        `site.molecule` label, and two molecules are copies of each other
+        when their sites, taken in topology order, have the same bonds. If a
+        site has no molecule label or a bond links two molecules, the whole
+        topology is used instead. The connections are the same either way.
+
+    Notes: The connections are enumerated directly from the bond graph,
+    stored as a compressed sparse row adjacency of site indices:
+    an angle is a pair of neighbors of a site, a dihedral a neighbor of each
+    end of a bond and an improper three neighbors of a site. Any path of 3
+    bonds whose ends are different sites is a dihedral, so 3-membered rings
+    give angles and impropers but no dihedral.
+    This gives the same connections, in the same order, as matching
+    the angle, dihedral and improper sub-graphs to the line-graph
+    of the bond graph (see `_detect_connections`), without running
+    a subgraph isomorphism search.
     [ahy]: In the event of virtual sites/drude particles, the matching
     process may have to change in the _detect, _format, or _add methods.
     Personally, I think modifying the _add methods to exclude angles/dihedrals
-    with virtual sites would be be the best approach. I
-    don't think we would want to change how we construct any of the
-    NetworkX graphs.
+    with virtual sites would be be the best approach.
     """
-    compound = nx.Graph()
-
-    for b in top.bonds:
-        compound.add_edge(b.connection_members[0], b.connection_members[1])
+    bonds = _bond_indices(top)
+    templates = _molecule_templates(top, bonds) if by_molecule else None
 
-    compound_line_graph = nx.line_graph(compound)
-
-    angle_matches = _detect_connections(compound_line_graph, top, type_="angle")
-    dihedral_matches = _detect_connections(compound_line_graph, top, type_="dihedral")
-    improper_matches = _detect_connections(compound_line_graph, top, type_="improper")
+    if not templates:
+        angles, dihedrals, impropers = _enumerate_connections(bonds, top.n_sites)
+    else:
+        # Local indices follow the topology order of the sites of a molecule,
+        # so the replicated connections keep their orientation
+        replicas = ([], [], [])
+        for local_bonds, copies in templates:
+            local_connections = _enumerate_connections(local_bonds, copies.shape[1])
+            for replica, connections in zip(replicas, local_connections):
+                replica.append(copies[:, connections].reshape(-1, connections.shape[1]))
+        angles, dihedrals, impropers = map(np.concatenate, replicas)
+
+    angles = angles[np.lexsort(angles.T[::-1])]
+    dihedrals = dihedrals[np.lexsort(dihedrals[:, [3, 0, 2, 1]].T)]
+    impropers = impropers[np.lexsort(impropers.T[::-1])]
+
+    angle_matches = list(map(tuple, angles[:, [1, 0, 2]].tolist()))
+    dihedral_matches = list(map(tuple, dihedrals.tolist()))
+    improper_matches = impropers.tolist()
 
     if not index_only:
         for conn_matches, conn_type in zip(
@@ -74,15 +92,172 @@ def identify_connections(top, index_only=False):
 
 def _add_connections(top, matches, conn_type):
     """Add connections to the topology."""
-    for sorted_conn in matches:
-        to_add_conn = CONNS[conn_type](
-            connection_members=[top.sites[idx] for idx in sorted_conn]
+    sites = top.sites
+    top.add_connections(
+        (
+            CONNS[conn_type](connection_members=[sites[idx] for idx in sorted_conn])
+            for sorted_conn in matches
+        ),
+        update_types=False,
+    )
+
+
+def _bond_indices(top):
+    """Return the unique (lower, higher) site index pairs of the bonds.
+
+    Bonds of a site to itself are dropped.
+    """
+    bonds = _connection_member_indices(top, top.bonds)
+    bonds = bonds[bonds[:, 0] != bonds[:, 1]]
+    return np.unique(np.sort(bonds, axis=1), axis=0)
+
+
+def _bond_graph(bonds, n_sites):
+    """Return the bond graph as a CSR adjacency.
+
+    Parameters
+    ----------
+    bonds : np.ndarray of shape (n_bonds, 2)
+        The unique bonds, from `_bond_indices`.
+    n_sites : int
+        The number of sites of the graph.
+
+    Returns
+    -------
+    indptr : np.ndarray of shape (n_sites + 1,)
+    neighbors : np.ndarray of shape (2 * n_bonds,)
+        The indices of the sites bonded to site i, sorted, are
+        neighbors[indptr[i]:indptr[i + 1]].
+    """
+    edges = np.concatenate([bonds, bonds[:, ::-1]])
+    edges = edges[np.lexsort(edges.T[::-1])]
+    indptr = np.zeros(n_sites + 1, dtype=np.int64)
+    np.cumsum(np.bincount(edges[:, 0], minlength=n_sites), out=indptr[1:])
+    return indptr, edges[:, 1]
+
+
+def _molecule_templates(top, bonds):
+    """Group the molecules of a topology by the bonds between their sites.
+
+    Returns
+    -------
+    templates : list of tuple
+        For every unique molecule, the bonds of its first copy in local
+        indices (the positions of the sites within the molecule) and an
+        (n_copies, n_molecule_sites) array of the site indices of every copy.
+        None if the topology has no sites, a site has no molecule label or
+        a bond links two molecules.
+    """
+    if top.n_sites == 0:
+        return None
+
+    # Sites often share their molecule label object, which is hashed by value
+    molecule_ids = dict()
+    label_ids = {id(None): -1}
+    labels = np.empty(top.n_sites, dtype=np.int64)
+    for idx, site in enumerate(top.sites):
+        molecule = site.molecule
+        if id(molecule) not in label_ids:
+            label_ids[id(molecule)] = molecule_ids.setdefault(
+                molecule, len(molecule_ids)
+            )
+        labels[idx] = label_ids[id(molecule)]
+    if (labels < 0).any() or (labels[bonds[:, 0]] != labels[bonds[:, 1]]).any():
+        return None
+
+    # Sites, and their bonds, grouped by molecule in topology order
+    site_order = np.argsort(labels, kind="stable")
+    n_molecule_sites = np.bincount(labels)
+    site_starts = np.cumsum(n_molecule_sites) - n_molecule_sites
+    local_indices = np.empty_like(labels)
+    local_indices[site_order] = np.arange(len(labels)) - np.repeat(
+        site_starts, n_molecule_sites
+    )
+    bond_labels = labels[bonds[:, 0]]
+    bond_order = np.argsort(bond_labels, kind="stable")
+    local_bonds = np.split(
+        local_indices[bonds[bond_order]],
+        np.cumsum(np.bincount(bond_labels, minlength=len(n_molecule_sites)))[:-1],
+    )
+
+    templates = dict()
+    for molecule, molecule_bonds in enumerate(local_bonds):
+        key = (n_molecule_sites[molecule], molecule_bonds.tobytes())
+        templates.setdefault(key, (molecule_bonds, []))[1].append(molecule)
+
+    return [
+        (
+            molecule_bonds,
+            site_order[
+                site_starts[molecules, None] + np.arange(n_molecule_sites[molecules[0]])
+            ],
         )
-        top.add_connection(to_add_conn, update_types=False)
+        for molecule_bonds, molecules in templates.values()
+    ]
+
+
+def _enumerate_connections(bonds, n_sites):
+    """Return the unsorted angles, dihedrals and impropers of a bond graph."""
+    indptr, neighbors = _bond_graph(bonds, n_sites)
+    angles = _enumerate_angles(indptr, neighbors)
+    dihedrals = _enumerate_dihedrals(indptr, neighbors)
+    impropers = _enumerate_impropers(indptr, neighbors, angles)
+    return angles, dihedrals, impropers
+
+
+def _expand_neighbors(indptr, neighbors, sites):
+    """Pair every site of an index array with each of its neighbors.
+
+    Returns
+    -------
+    rows : np.ndarray
+        For each pair, the position of the site in `sites`.
+    site_neighbors : np.ndarray
+        For each pair, the neighbor of the site.
+    """
+    starts = indptr[sites]
+    degrees = indptr[sites + 1] - starts
+    rows = np.repeat(np.arange(len(sites)), degrees)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+    return rows, neighbors[starts[rows] + offsets]
+
+
+def _enumerate_angles(indptr, neighbors):
+    """Return the (center, end, end) angles, ends in increasing order."""
+    centers = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    rows, others = _expand_neighbors(indptr, neighbors, centers)
+    angles = np.column_stack([centers[rows], neighbors[rows], others])
+    return angles[angles[:, 1] < angles[:, 2]]
+
+
+def _enumerate_dihedrals(indptr, neighbors):
+    """Return the dihedrals, oriented so that the first site is the lowest end."""
+    # Every bond, in both directions, is the middle bond (j, k) of i-j-k-m
+    j = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    k = neighbors
+    rows, i = _expand_neighbors(indptr, neighbors, j)
+    keep = i != k[rows]
+    i, j, k = i[keep], j[rows][keep], k[rows][keep]
+    rows, m = _expand_neighbors(indptr, neighbors, k)
+    i, j, k = i[rows], j[rows], k[rows]
+    keep = (m != j) & (i < m)
+    return np.column_stack([i[keep], j[keep], k[keep], m[keep]])
+
+
+def _enumerate_impropers(indptr, neighbors, angles):
+    """Return the (center, branch1, branch2, branch3) impropers."""
+    rows, others = _expand_neighbors(indptr, neighbors, angles[:, 0])
+    keep = others > angles[rows, 2]
+    return np.column_stack([angles[rows][keep], others[keep]])
 
 
 def _detect_connections(compound_line_graph, top, type_="angle"):
-    """Detect available connections in the topology based on bonds."""
+    """Detect available connections in the topology based on bonds.
+
+    This matches the connection sub-graphs to the line-graph of the bond
+    graph. It is no longer used by `identify_connections`, but kept as the
+    reference the enumeration of connections is checked against.
+    """
     connection = nx.Graph()
     for edge in EDGES[type_]:
         assert len(edge) == 2, "Edges should be of length 2"
@@ -277,8 +452,49 @@ def _trim_duplicates(all_matches):
     return trimmed_list
 
 
+def _connection_member_indices(top, connections, members=(0, -1)):
+    """Return the topology indices of the given members of the connections."""
+    site_indices = {site: idx for idx, site in enumerate(top.sites)}
+    connections = list(connections)
+    return np.fromiter(
+        (
+            site_indices[connection.connection_members[member]]
+            for connection in connections
+            for member in members
+        ),
+        dtype=np.int64,
+        count=len(connections) * len(members),
+    ).reshape(-1, len(members))
+
+
+def _pair_keys(pairs, n_sites):
+    """Encode unordered site index pairs as unique integers."""
+    return np.minimum(pairs[:, 0], pairs[:, 1]) * n_sites + np.maximum(
+        pairs[:, 0], pairs[:, 1]
+    )
+
+
+def _bonded_pair_keys(top):
+    """Return the keys of the site pairs within one and two bonds of each other.
+
+    The pairs two bonds apart are the ends of the angles enumerated from the
+    bond graph, gathered without a python loop.
+    """
+    bonds = _bond_indices(top)
+    angles = _enumerate_angles(*_bond_graph(bonds, top.n_sites))
+
+    return (
+        _pair_keys(bonds, top.n_sites),
+        np.unique(_pair_keys(angles[:, 1:], top.n_sites)),
+    )
+
+
 def generate_pairs_lists(
-    top, molecule=None, sort_key=None, refer_from_scaling_factor=False
+    top,
+    molecule=None,
+    sort_key=None,
+    refer_from_scaling_factor=False,
+    index_only=False,
 ):
     """Generate all the pairs lists of the topology or molecular of topology.
 
@@ -290,10 +506,14 @@ def generate_pairs_lists(
         Generate only pairs list of a particular molecule.
     sort_key : function, optional, default=None
         Function used as key for sorting of site pairs. If None is provided
-        will used topology.get_index
+        will used topology.get_index. Sites with the same key are sorted by
+        their index in the topology.
     refer_from_scaling_factor : bool, optional, default=False
         If True, only generate pair lists of pairs that have a non-zero scaling
         factor value.
+    index_only : bool, optional, default=False
+        If True, return the pairs as (n_pairs, 2) arrays of site indices in
+        the topology rather than lists of sites.
 
     Returns
     -------
@@ -304,8 +524,9 @@ def generate_pairs_lists(
     angles and dihedrals (through top.identify_connections()). In addition,
     if the refer_from_scaling_factor is True, this method will only generate
     pairs when the corresponding scaling factor is not 0.
+    The 1-3 (1-4) pairs are the end sites of the angles (dihedrals) that are
+    not closer to each other through a shorter path in the bond graph.
     """
-    from gmso.external import to_networkx
     from gmso.parameterization.molecule_utils import (
         molecule_angles,
         molecule_bonds,
@@ -314,19 +535,13 @@ def generate_pairs_lists(
 
     nb_scalings, coulombic_scalings = top.scaling_factors
 
-    if sort_key is None:
-        sort_key = top.get_index
-
-    graph = to_networkx(top, parse_angles=False, parse_dihedrals=False)
-
     pairs_dict = dict()
     if refer_from_scaling_factor:
         for i in range(3):
             if nb_scalings[i] or coulombic_scalings[i]:
-                pairs_dict[f"pairs1{i+2}"] = list()
+                pairs_dict[f"pairs1{i+2}"] = None
     else:
-        for i in range(3):
-            pairs_dict = {f"pairs1{i+2}": list() for i in range(3)}
+        pairs_dict = {f"pairs1{i+2}": None for i in range(3)}
 
     if molecule is None:
         bonds, angles, dihedrals = top.bonds, top.angles, top.dihedrals
@@ -335,42 +550,38 @@ def generate_pairs_lists(
         angles = molecule_angles(top, molecule)
         dihedrals = molecule_dihedrals(top, molecule)
 
-    if "pairs12" in pairs_dict:
-        for bond in bonds:
-            pairs = sorted(bond.connection_members, key=sort_key)
-            pairs_dict["pairs12"].append(pairs)
+    # Rank of every site in the sort order, pairs are (lower, higher) ranks
+    sites = top.sites
+    n_sites = len(sites)
+    if sort_key is None:
+        ranks = np.arange(n_sites)
+    else:
+        ranks = np.empty(n_sites, dtype=np.int64)
+        ranks[sorted(range(n_sites), key=lambda i: sort_key(sites[i]))] = np.arange(
+            n_sites
+        )
 
-    if "pairs13" in pairs_dict:
-        for angle in angles:
-            pairs = sorted(
-                (angle.connection_members[0], angle.connection_members[-1]),
-                key=sort_key,
-            )
-            if (
-                pairs not in pairs_dict["pairs13"]
-                and shortest_path_length(graph, pairs[0], pairs[1]) == 2
-            ):
-                pairs_dict["pairs13"].append(pairs)
-
-    if "pairs14" in pairs_dict:
-        for dihedral in dihedrals:
-            pairs = sorted(
-                (
-                    dihedral.connection_members[0],
-                    dihedral.connection_members[-1],
-                ),
-                key=sort_key,
-            )
-            if (
-                pairs not in pairs_dict["pairs14"]
-                and shortest_path_length(graph, pairs[0], pairs[1]) == 3
-            ):
-                pairs_dict["pairs14"].append(pairs)
+    if "pairs13" in pairs_dict or "pairs14" in pairs_dict:
+        bonded_keys, path2_keys = _bonded_pair_keys(top)
 
     for key in pairs_dict:
-        pairs_dict[key] = sorted(
-            pairs_dict[key],
-            key=lambda pairs: (sort_key(pairs[0]), sort_key(pairs[1])),
-        )
+        if key == "pairs12":
+            pairs = _connection_member_indices(top, bonds)
+        elif key == "pairs13":
+            pairs = _connection_member_indices(top, angles)
+            pairs = pairs[~np.isin(_pair_keys(pairs, n_sites), bonded_keys)]
+        else:
+            pairs = _connection_member_indices(top, dihedrals)
+            keys = _pair_keys(pairs, n_sites)
+            pairs = pairs[~(np.isin(keys, bonded_keys) | np.isin(keys, path2_keys))]
+
+        swap = ranks[pairs[:, 0]] > ranks[pairs[:, 1]]
+        pairs[swap] = pairs[swap, ::-1]
+        pairs = np.unique(pairs, axis=0)
+        pairs = pairs[np.lexsort((ranks[pairs[:, 1]], ranks[pairs[:, 0]]))]
+        if index_only:
+            pairs_dict[key] = pairs
+        else:
+            pairs_dict[key] = [[sites[i], sites[j]] for i, j in pairs.tolist()]
 
     return pairs_dict
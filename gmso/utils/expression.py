@@ -29,6 +29,12 @@ def _are_equal_parameters(u1, u2):
         return True
 
 
+@lru_cache(maxsize=128)
+def _free_symbols(expression):
+    """Return the free symbols of an expression, which sympy recomputes on access."""
+    return frozenset(expression.free_symbols)
+
+
 class PotentialExpression:
     """A general Expression class with parameters.
 
@@ -172,8 +178,8 @@ class PotentialExpression:
         if self._is_parametric:
             if parameters is not None:
                 parameters = self._validate_parameters(parameters)
-                total_free_symbols = self._expression.free_symbols.union(
-                    expression.free_symbols
+                total_free_symbols = _free_symbols(self._expression).union(
+                    _free_symbols(expression)
                 )
                 for key in list(parameters.keys()):
                     if sympy.Symbol(key) not in total_free_symbols:
@@ -204,8 +210,9 @@ class PotentialExpression:
         self._independent_variables = independent_variables
 
         if self._is_parametric:
+            free_symbols = _free_symbols(self.expression)
             for key in list(self._parameters.keys()):
-                if sympy.Symbol(key) not in self.expression.free_symbols:
+                if sympy.Symbol(key) not in free_symbols:
                     self._parameters.pop(key)
 
     def __repr__(self):
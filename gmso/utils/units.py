@@ -1,6 +1,8 @@
 """Source of available units registered within GMSO."""
 
 import re
+from collections import defaultdict
+from functools import lru_cache
 
 import numpy as np
 import unyt as u
@@ -300,47 +302,87 @@ class LAMMPS_UnitSystems:
             "phi_eq",
         ]:  # eq angle are always in degrees
             return f"{round(float(parameter.to('degree').value), n_decimals):.{n_decimals}f}"
-        new_dims = self._get_output_dimensions(parameter.units.dimensions)
         if isinstance(self.usystem, ljUnitSystem):
-            if not conversion_factorDict:
-                raise ValueError(
-                    "Missing conversion_factorDict for a dimensionless unit system."
-                )
-            elif not np.all(
-                [
-                    key in conversion_factorDict
-                    for key in ["energy", "length", "mass", "charge"]
-                ]
-            ):
-                raise ValueError(
-                    f"Missing dimensionless constant in conversion_factorDict {conversion_factorDict}"
-                )
-            # multiply object -> split into length, mass, energy, charge -> grab conversion factor from dict
-            # first replace energy for (length)**2*(mass)/(time)**2 u.dimensions.energy. Then iterate through the free symbols
-            # and figure out a way how to add those to the overall conversion factor
-            dim_info = new_dims.as_terms()
-            conversion_factor = 1
-            for exponent, ind_dim in zip(dim_info[0][0][1][1], dim_info[1]):
-                factor = conversion_factorDict.get(
-                    ind_dim.name[1:-1],
-                    1 * self.usystem[ind_dim.name[1:-1]],  # default value of 1
-                )  # replace () in name
-                current_unit = get_parameter_dimension(parameter, ind_dim.name)
-                factor = factor.to(current_unit)  # convert factor to units of parameter
-                conversion_factor *= float(factor) ** (exponent)
+            conversion_factor = self._lj_conversion_factor(
+                parameter, conversion_factorDict
+            )
             return f"""{round(
                 float(parameter / conversion_factor),
                 n_decimals
             ):.{n_decimals}f}"""  # Assuming that conversion factor is in right units
-        new_dimStr = str(new_dims)
+        outFloat = float(parameter.to(self._get_output_units(parameter.units)))
+
+        return f"{outFloat:.{n_decimals}f}"
+
+    def convert_values(self, values, units, conversion_factorDict=None):
+        """Convert an array of values in the same units to the style of self.usystem.
+
+        The conversion is the one done by `convert_parameter`, computed once for
+        all values and returned as floats rather than formatted strings.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values to convert
+        units : unyt.Unit
+            The units of the values
+        conversion_factorDict : dict, default=None
+            If the self.usystem is ljUnitSystem, handle conversion
+
+        Returns
+        -------
+        np.ndarray
+            The values converted via self.usystem
+        """
+        values = np.asarray(values, dtype=float)
+        if isinstance(self.usystem, ljUnitSystem):
+            conversion_factor = self._lj_conversion_factor(
+                u.unyt_quantity(1, units), conversion_factorDict
+            )
+            return values / conversion_factor
+        conversion_factor = u.unyt_quantity(1, units).to_value(
+            self._get_output_units(units)
+        )
+        return values * conversion_factor
+
+    def _lj_conversion_factor(self, parameter, conversion_factorDict):
+        """Return the factor that makes a parameter dimensionless, in the units of the parameter."""
+        if not conversion_factorDict:
+            raise ValueError(
+                "Missing conversion_factorDict for a dimensionless unit system."
+            )
+        elif not np.all(
+            [
+                key in conversion_factorDict
+                for key in ["energy", "length", "mass", "charge"]
+            ]
+        ):
+            raise ValueError(
+                f"Missing dimensionless constant in conversion_factorDict {conversion_factorDict}"
+            )
+        # multiply object -> split into length, mass, energy, charge -> grab conversion factor from dict
+        # first replace energy for (length)**2*(mass)/(time)**2 u.dimensions.energy. Then iterate through the free symbols
+        # and figure out a way how to add those to the overall conversion factor
+        new_dims = self._get_output_dimensions(parameter.units.dimensions)
+        dim_info = new_dims.as_terms()
+        conversion_factor = 1
+        for exponent, ind_dim in zip(dim_info[0][0][1][1], dim_info[1]):
+            factor = conversion_factorDict.get(
+                ind_dim.name[1:-1],
+                1 * self.usystem[ind_dim.name[1:-1]],  # default value of 1
+            )  # replace () in name
+            current_unit = get_parameter_dimension(parameter, ind_dim.name)
+            factor = factor.to(current_unit)  # convert factor to units of parameter
+            conversion_factor *= float(factor) ** (exponent)
+        return conversion_factor
+
+    def _get_output_units(self, units):
+        """Return the units of self.usystem with the dimensions of the given units."""
+        new_dimStr = str(self._get_output_dimensions(units.dimensions))
         ind_units = re.sub("[^a-zA-Z]+", " ", new_dimStr).split()
         for unit in ind_units:
             new_dimStr = new_dimStr.replace(unit, str(self.usystem[unit]))
-        outFloat = float(
-            parameter.to(u.Unit(new_dimStr, registry=self.usystem.registry))
-        )
-
-        return f"{outFloat:.{n_decimals}f}"
+        return u.Unit(new_dimStr, registry=self.usystem.registry)
 
     @staticmethod
     def _dimensions_to_energy(dims):
@@ -476,6 +518,21 @@ def write_out_parameter_and_units(parameter_name, parameter, base_unyts=None):
     return f"{parameter_name} ({outputUnyt})"
 
 
+@lru_cache(maxsize=128)
+def _target_units(unit_dim, base_units):
+    """Return the units of a dimension string expressed in the base units.
+
+    base_units is a tuple of (dimension, value, units) strings, so that the
+    units of every parameter dimension are parsed once per unit system.
+    """
+    base_units = {dim: (value, units) for dim, value, units in base_units}
+    ind_units = re.sub("[^a-zA-Z]+", " ", unit_dim).split()
+    for unit in ind_units:
+        value, units = base_units[unit]
+        unit_dim = unit_dim.replace(unit, f"({value} * {units})")
+    return u.Unit(unit_dim)
+
+
 def convert_params_units(
     potentials,
     expected_units_dim,
@@ -501,19 +558,38 @@ def convert_params_units(
         the input potentials converted into the base units given by
         base_units `dict`.
     """
+    potentials = list(potentials)
+    base_units_key = tuple(
+        (dim, str(quantity.value), str(quantity.units))
+        for dim, quantity in base_units.items()
+    )
+
+    # Parameters with the same name, units and shape are converted together
+    converted_params = list()
+    param_groups = defaultdict(list)
+    for idx, potential in enumerate(potentials):
+        converted_params.append(dict.fromkeys(potential.parameters))
+        for parameter, value in potential.parameters.items():
+            param_groups[parameter, value.units, value.shape].append(idx)
+
+    for (parameter, units, _), indices in param_groups.items():
+        target_units = _target_units(expected_units_dim[parameter], base_units_key)
+        factor, offset = units.get_conversion_factor(target_units)
+        if offset:
+            converted = [
+                potentials[idx].parameters[parameter].to(target_units)
+                for idx in indices
+            ]
+        else:
+            values = np.array(
+                [potentials[idx].parameters[parameter].value for idx in indices]
+            )
+            converted = u.unyt_array(values * factor, target_units)
+        for idx, value in zip(indices, converted):
+            converted_params[idx][parameter] = value
+
     converted_potentials = list()
-    for potential in potentials:
-        converted_params = dict()
-        for parameter in potential.parameters:
-            unit_dim = expected_units_dim[parameter]
-            ind_units = re.sub("[^a-zA-Z]+", " ", unit_dim).split()
-            for unit in ind_units:
-                unit_dim = unit_dim.replace(
-                    unit,
-                    f"({str(base_units[unit].value)} * {str(base_units[unit].units)})",
-                )
-
-            converted_params[parameter] = potential.parameters[parameter].to(unit_dim)
-        potential.parameters = converted_params
+    for potential, params in zip(potentials, converted_params):
+        potential.parameters = params
         converted_potentials.append(potential)
     return converted_potentials